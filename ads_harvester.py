@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Resumable, concurrent harvester for the ADS search API.
+#
+# The first request learns how many documents match; the remaining pages are
+# then fetched by a small thread pool. Every page is written to its own shard
+# (page-000000.ndjson or .parquet, temp file + rename) as soon as it arrives and
+# recorded in checkpoint.json, so memory stays at a few pages and a crash or
+# Ctrl-C only loses the pages in flight: running the same command again skips
+# the finished ones. 429/5xx answers are retried after the server's Retry-After
+# delay (or an exponential backoff when there is none), and that delay holds
+# back every worker of the pool, not just the one that was throttled.
+#
+# Pages are offsets into the result list sorted by bibcode, so a paper added or
+# removed while the harvest runs shifts the later pages by one: a paper can then
+# land in two shards, and iter_docs yields every bibcode only once. (A removal
+# can also push one paper into a page that was already fetched; the next
+# refresh.py run, which asks for everything indexed since this one started,
+# picks it up.) Parquet shards are written with a fixed Arrow schema derived
+# from the requested fields (FIELD_TYPES), so every shard has the same column
+# types whatever values its page happened to contain.
+#
+# The API URL is configurable (ADS_API_URL or --api-url), e.g. to harvest from
+# a local mock server.
+#
+# Usage:
+#   ADS_API_TOKEN=... python ads_harvester.py 'full:"dark matter"' harvest/
+#   python ads_harvester.py 'full:"dark matter"' harvest/ --workers 4 --format parquet
+
+import argparse
+import email.utils
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+import columnar_store
+
+ADS_API_URL = os.environ.get('ADS_API_URL', 'https://api.adsabs.harvard.edu/v1/search/query')
+ADS_API_TOKEN = os.environ.get('ADS_API_TOKEN', '')
+
+DEFAULT_FIELDS = ['bibcode', 'title', 'year', 'keyword_norm', 'abstract', 'page']
+ROWS = 2000  # documents per page (the ADS maximum)
+WORKERS = 4
+MAX_RETRIES = 8
+CHECKPOINT_NAME = 'checkpoint.json'
+FORMATS = ('ndjson', 'parquet')
+
+# Arrow types of the ADS fields in Parquet shards; other fields are strings
+FIELD_TYPES = {
+    'bibcode': pa.string(),
+    'title': pa.list_(pa.string()),
+    'year': pa.string(),
+    'pubdate': pa.string(),
+    'entdate': pa.string(),
+    'indexstamp': pa.string(),
+    'abstract': pa.string(),
+    'first_author': pa.string(),
+    'author': pa.list_(pa.string()),
+    'keyword': pa.list_(pa.string()),
+    'keyword_norm': pa.list_(pa.string()),
+    'arxiv_class': pa.list_(pa.string()),
+    'page': pa.list_(pa.string()),
+    'doi': pa.list_(pa.string()),
+    'identifier': pa.list_(pa.string()),
+    'citation': pa.list_(pa.string()),
+    'reference': pa.list_(pa.string()),
+    'citation_count': pa.int64(),
+    'citation_count_norm': pa.float64(),
+    'read_count': pa.int64(),
+}
+
+
+def retry_delay(response, attempt):
+    # Seconds to wait before retrying: Retry-After (delta-seconds or an HTTP
+    # date) when the server sent one, exponential backoff otherwise
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return min(60.0, 2.0 ** attempt)
+
+
+def shard_schema(fields):
+    return pa.schema([(field, FIELD_TYPES.get(field, pa.string())) for field in fields])
+
+
+def write_shard(docs, path, fmt, schema=None):
+    if fmt == 'parquet':
+        columnar_store.write_table(pa.Table.from_pylist(docs, schema=schema), path)
+    else:
+        columnar_store.write_atomic(path, lambda f: f.writelines(json.dumps(doc) + '\n' for doc in docs))
+
+
+def shard_paths(out_dir):
+    return sorted(
+        os.path.join(out_dir, name) for name in os.listdir(out_dir)
+        if name.startswith('page-') and name.endswith(('.ndjson', '.parquet'))
+    )
+
+
+def _read_shard(path):
+    if path.endswith('.parquet'):
+        yield from pq.read_table(path).to_pylist()
+    else:
+        with open(path) as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def iter_docs(out_dir):
+    # All harvested documents, shard by shard, each bibcode once (see above)
+    seen = set()
+    for path in shard_paths(out_dir):
+        for doc in _read_shard(path):
+            bibcode = doc.get('bibcode')
+            if bibcode is not None:
+                if bibcode in seen:
+                    continue
+                seen.add(bibcode)
+            yield doc
+
+
+class Harvester:
+    def __init__(self, query, out_dir, fields=None, rows=ROWS, workers=WORKERS, fmt='ndjson', sort='bibcode asc',
+                 token=None, api_url=None, max_retries=MAX_RETRIES, timeout=60):
+        if fmt not in FORMATS:
+            raise ValueError(f'format must be one of {FORMATS}, got {fmt!r}')
+        self.query = query
+        self.out_dir = out_dir
+        self.fields = list(fields or DEFAULT_FIELDS)
+        self.rows = rows
+        self.workers = workers
+        self.fmt = fmt
+        # A stable sort keeps offset pages consistent between requests and runs
+        # (as long as the matching papers do not change, see above)
+        self.sort = sort
+        self.token = ADS_API_TOKEN if token is None else token
+        self.api_url = api_url or ADS_API_URL
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._local = threading.local()
+        # time.monotonic() before which no worker sends a request
+        self._not_before = 0.0
+        self._not_before_lock = threading.Lock()
+
+    def _session(self):
+        # requests sessions are not shared between threads
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            if self.token:
+                session.headers['Authorization'] = 'Bearer ' + self.token
+        return session
+
+    def _back_off(self, delay):
+        with self._not_before_lock:
+            self._not_before = max(self._not_before, time.monotonic() + delay)
+
+    def _wait_turn(self):
+        # Sleep until the latest back-off of any worker has passed (another
+        # worker may extend it while this one sleeps)
+        while True:
+            with self._not_before_lock:
+                delay = self._not_before - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def fetch(self, start):
+        params = {'q': self.query, 'fl': ','.join(self.fields), 'rows': self.rows, 'start': start, 'sort': self.sort}
+        for attempt in range(self.max_retries + 1):
+            self._wait_turn()
+            response = None
+            try:
+                response = self._session().get(self.api_url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            if response is not None and response.status_code != 429 and response.status_code < 500:
+                response.raise_for_status()
+                return response.json()['response']
+            if attempt == self.max_retries:
+                response.raise_for_status()
+            self._back_off(retry_delay(response, attempt))
+
+    def shard_path(self, page):
+        return os.path.join(self.out_dir, f'page-{page:06d}.{self.fmt}')
+
+    def harvest_page(self, page, response=None):
+        response = response or self.fetch(page * self.rows)
+        write_shard(response['docs'], self.shard_path(page), self.fmt, shard_schema(self.fields))
+        return len(response['docs'])
+
+    def _checkpoint_path(self):
+        return os.path.join(self.out_dir, CHECKPOINT_NAME)
+
+    def _settings(self):
+        return {'query': self.query, 'fields': self.fields, 'rows': self.rows, 'sort': self.sort, 'format': self.fmt}
+
+    def load_checkpoint(self):
+        try:
+            with open(self._checkpoint_path()) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return None
+        if checkpoint['settings'] != self._settings():
+            raise ValueError(f'{self._checkpoint_path()} belongs to a different harvest; use another directory')
+        return checkpoint
+
+    def save_checkpoint(self, num_found, pages_done):
+        checkpoint = {
+            'settings': self._settings(),
+            'num_found': num_found,
+            'pages_done': sorted(pages_done),
+            'updated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }
+        columnar_store.write_atomic(self._checkpoint_path(), lambda f: json.dump(checkpoint, f, indent=2))
+
+    def run(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        checkpoint = self.load_checkpoint()
+        if checkpoint is None:
+            first = self.fetch(0)
+            num_found = first['numFound']
+            self.harvest_page(0, first)
+            pages_done = {0}
+            self.save_checkpoint(num_found, pages_done)
+        else:
+            num_found = checkpoint['num_found']
+            pages_done = set(checkpoint['pages_done'])
+
+        pages = max(1, math.ceil(num_found / self.rows))
+        todo = [page for page in range(pages) if page not in pages_done]
+        print(f'{num_found} documents in {pages} pages, {len(todo)} to fetch')
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.harvest_page, page): page for page in todo}
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    pages_done.add(futures[future])
+                    self.save_checkpoint(num_found, pages_done)
+                    print(f'Processed {len(pages_done)}/{pages} pages.')
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return shard_paths(self.out_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Harvest ADS search results into NDJSON or Parquet shards.')
+    parser.add_argument('query', help='ADS query, e.g. \'full:"dark matter"\'')
+    parser.add_argument('out_dir', help='directory for the shards and checkpoint.json')
+    parser.add_argument('--fields', default=','.join(DEFAULT_FIELDS), help='comma-separated fields to return')
+    parser.add_argument('--rows', type=int, default=ROWS, help='documents per page')
+    parser.add_argument('--workers', type=int, default=WORKERS, help='concurrent requests')
+    parser.add_argument('--format', choices=FORMATS, default='ndjson', help='shard format')
+    parser.add_argument('--sort', default='bibcode asc', help='ADS sort order (keep it stable when resuming)')
+    parser.add_argument('--api-url', default=None, help='search endpoint (default: $ADS_API_URL or the public API)')
+    args = parser.parse_args(argv)
+
+    harvester = Harvester(args.query, args.out_dir, fields=[f.strip() for f in args.fields.split(',')],
+                          rows=args.rows, workers=args.workers, fmt=args.format, sort=args.sort,
+                          api_url=args.api_url)
+    print(f'{len(harvester.run())} shards in {args.out_dir}')
+
+
+if __name__ == '__main__':
+    main()
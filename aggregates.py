@@ -0,0 +1,423 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Precomputed aggregate tables behind the dcc.Graph figures.
+#
+# All the groupbys the figures need are materialized once into a small pickle
+# (data_cache/aggregates-<skeleton sha256>-v<TABLES_VERSION>.pkl), so the web
+# process only loads these tables at boot and never holds the raw skeleton frame.
+#
+# After a refresh (refresh.py) the tables of the new version are patched from
+# those of the previous one instead (see patch).
+#
+# Usage:
+#   python aggregates.py build              # build for the cached skeleton (and its search index and figures)
+#   python aggregates.py build out.pkl      # ... and write the tables to a custom path
+#   python aggregates.py figures            # only build the figures for the current tables
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+import arxiv_weights
+import citation_graph
+import co_occurrence
+import columnar_store
+import data_loader
+import entity_trends
+import filter_cubes
+import scatter_index
+import search_index
+import startup_profile
+
+# Columns read by each figure; only their union is loaded from the columnar store
+FIG_X_COLUMNS = ['year', 'arxiv_category', 'title']
+FIG_1_COLUMNS = ['year'] + columnar_store.ENTITY_COLUMNS
+FIG_3_COLUMNS = ['title', 'citations', 'arxiv_class']
+FIG_4_COLUMNS = ['citations_normalized', 'downloads', 'citations', 'title', 'first_author', 'year']
+FIG_5_COLUMNS = ['year', 'bibcode'] + columnar_store.ENTITY_COLUMNS
+FIG_6_COLUMNS = ['year', 'citations'] + columnar_store.ENTITY_COLUMNS
+FIG_7_COLUMNS = ['year', 'bibcode', 'citations'] + columnar_store.ENTITY_COLUMNS
+ARXIV_METRICS = ['citations', 'downloads']
+ARXIV_METRICS_COLUMNS = ['arxiv_class'] + ARXIV_METRICS
+CITATION_GRAPH_COLUMNS = ['bibcode', 'title', 'year', 'citations', 'arxiv_category', 'citation']
+CITATION_LIST_COLUMNS = ['citation']
+SKELETON_COLUMNS = list(dict.fromkeys(
+    FIG_X_COLUMNS + FIG_1_COLUMNS + FIG_3_COLUMNS + FIG_4_COLUMNS + FIG_5_COLUMNS + FIG_6_COLUMNS + FIG_7_COLUMNS
+    + ARXIV_METRICS_COLUMNS + CITATION_GRAPH_COLUMNS
+))
+
+# arxiv_category lists are joined into one label per paper while reading
+ARXIV_CATEGORY_JOIN = {'arxiv_category': ', '}
+# dm_models lists are also joined (into dm_models_joined, the fig_1 bar key)
+# but kept as lists for the entity tables
+DM_MODELS_JOIN = {'dm_models': ', '}
+
+# Bumped whenever the set of tables changes, so stale pickles are rebuilt
+TABLES_VERSION = 9
+
+# Set to a prebuilt aggregate file to skip the version lookup entirely
+AGGREGATES_PATH = os.environ.get('AGGREGATES_PATH')
+# Same for the serialized static figures of app.py (see figure_cache.save)
+FIGURES_PATH = os.environ.get('FIGURES_PATH')
+
+
+# Research focus precedence, highest first: a paper mentioning several kinds of
+# entities is labelled by the first column in this list that is non-null
+RESEARCH_FOCUS = [
+    ('dm_models', 'Dark Matter Models'),
+    ('telescopes', 'Telescopes'),
+    ('inferences', 'Inferences'),
+    ('methods', 'Methods'),
+    ('stellar_objects', 'Stellar Objects'),
+    ('colliders', 'Colliders'),
+    ('detectors', 'Detectors'),
+    ('gravity', 'Gravitational phenomena'),
+    ('particles', 'Particles'),
+    ('theory', 'Theories'),
+]
+
+# Paper titles are listed in the fig_X hover for years with at most this many papers
+TITLES_MAX_PAPERS = 15
+
+# fig_5 / fig_7 cover papers published after RESEARCH_TYPE_AFTER, fig_6 those
+# after CITATIONS_FOCUS_AFTER
+RESEARCH_TYPE_AFTER = 1980
+CITATIONS_FOCUS_AFTER = 1933
+
+# Map research focus to "Theoretical" or "Experimental"
+RESEARCH_TYPE = {
+    'Particles': 'Experimental', 'Detectors': 'Experimental', 'Colliders': 'Experimental', 'Telescopes': 'Experimental',
+    'Gravitational phenomena': 'Theoretical', 'Dark Matter Models': 'Theoretical', 'Stellar Objects': 'Theoretical',
+    'Methods': 'Theoretical', 'Inferences': 'Theoretical', 'Theories': 'Theoretical',
+}
+
+
+def _first_present(present, labels):
+    # Index of the first True column per row, -1 where a row has none
+    codes = np.where(present.any(axis=1), present.argmax(axis=1), -1)
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def classify_research_focus(df):
+    # One notnull pass over the entity columns yields both labels:
+    # 'research_focus' over all columns, and 'dm_research_focus' which skips
+    # dm_models (fig_1 already colours the bars by dark matter model)
+    columns = [column for column, _ in RESEARCH_FOCUS]
+    labels = [label for _, label in RESEARCH_FOCUS]
+    present = df[columns].notnull().to_numpy()
+    df['research_focus'] = _first_present(present, labels)
+    df['dm_research_focus'] = _first_present(present[:, 1:], labels[1:])
+    return df
+
+
+def prepare(df):
+    # arxiv_category arrives as a categorical of ', '-joined labels (see
+    # ARXIV_CATEGORY_JOIN). Replace NaN or empty arxiv_category with a placeholder
+    # "No class" by relabelling the categories instead of touching every row:
+    # missing values have code -1, which picks the 'No class' label appended last
+    arxiv_category = df['arxiv_category'].cat
+    labels = arxiv_category.categories.where(arxiv_category.categories != '', 'No class').append(pd.Index(['No class']))
+    label_codes, categories = pd.factorize(labels, sort=True)
+    df['arxiv_category'] = pd.Categorical.from_codes(label_codes[arxiv_category.codes.to_numpy()], categories=categories)
+    return classify_research_focus(df)
+
+
+def publications_tables(df, arxiv_shares):
+    # Group by 'year' and count the number of publications
+    publications_per_year = df.groupby('year').size().reset_index(name='publication_count')
+
+    # Relevance-weighted number of papers per year and arXiv category
+    year = df['year'].to_numpy()[arxiv_shares['paper'].to_numpy()]
+    arxiv_distribution = arxiv_shares.groupby([year, 'arxiv_category'])['share'].sum().rename_axis(['year', 'arxiv_category'])
+    arxiv_distribution = arxiv_distribution.reset_index(name='category_count')
+
+    # Titles are only listed for years with TITLES_MAX_PAPERS or fewer papers, so
+    # only those rows are joined instead of every title in the corpus
+    small_years = publications_per_year.loc[publications_per_year['publication_count'] <= TITLES_MAX_PAPERS, 'year']
+    small_year_titles = df.loc[df['year'].isin(small_years), ['year', 'title']]
+    titles = small_year_titles.groupby('year')['title'].agg('<br>'.join)
+
+    return publications_hover_tables(publications_per_year, arxiv_distribution, titles)
+
+
+def publications_hover_tables(publications_per_year, arxiv_distribution, titles):
+    # Hover tables for fig_X from the per-year counts, the per-(year, category)
+    # counts and the joined titles per year (also used for filtered views)
+
+    # Create a DataFrame that includes the count and percentage of arxiv_category per year
+    arxiv_distribution = arxiv_distribution.merge(publications_per_year, on='year')
+    arxiv_distribution['percentage'] = (arxiv_distribution['category_count'] / arxiv_distribution['publication_count']) * 100
+
+    # Format arxiv_distribution for hover information
+    # Sort arxiv_distribution by 'category_count' in descending order. The
+    # weighted counts are float sums whose order depends on the summation, so
+    # they are rounded first and ties go by name
+    arxiv_distribution['category_count'] = arxiv_distribution['category_count'].round(6)
+    arxiv_distribution = arxiv_distribution.sort_values(by=['category_count', 'arxiv_category'], ascending=[False, True])
+
+    # Create the 'formatted_info' column with the sorted data (one row per
+    # year/category pair, built column-wise rather than row by row)
+    arxiv_distribution['formatted_info'] = (
+        arxiv_distribution['arxiv_category'].astype(str) + ': '
+        + np.char.mod('%.10g', arxiv_distribution['category_count'].round(1).to_numpy()) + ' ('
+        + np.char.mod('%.1f', arxiv_distribution['percentage'].to_numpy()) + '%)<br>'
+    )
+
+    # Aggregate formatted_info by year
+    hover_data = arxiv_distribution.groupby('year')['formatted_info'].agg(''.join).reset_index(name='arxiv_distribution')
+
+    titles_per_year = publications_per_year[['year']].assign(
+        titles=publications_per_year['year'].map(titles).fillna('')
+    )
+
+    # Merge all hover data
+    merged_df = publications_per_year.merge(hover_data, on='year', how='left').merge(titles_per_year, on='year', how='left')
+
+    return {
+        'publications_per_year': publications_per_year,
+        'arxiv_distribution': arxiv_distribution,
+        'hover_data': hover_data,
+        'titles_per_year': titles_per_year,
+        'merged_df': merged_df,
+    }
+
+
+def dm_models_focus_table(df):
+    category_data = df.loc[df['dm_models'].notnull() & df['dm_research_focus'].notnull(), ['year', 'dm_models_joined', 'dm_research_focus']]
+    category = category_data['dm_models_joined'].astype(str).rename('category')
+    research_focus = category_data['dm_research_focus'].astype(str).rename('research focus')
+    return category_data.groupby(['year', category, research_focus]).size().reset_index(name='counts')
+
+
+def top_titles_table(df, ranked):
+    # most cited titles by arXiv; each paper's citations are split over its
+    # arXiv categories by relevance
+    top_titles = df.nlargest(50, 'citations')
+    shares = arxiv_weights.category_shares(ranked, top_titles.index.to_numpy())
+    flat_data = shares.merge(top_titles[['title', 'citations']], left_on='paper', right_index=True)
+    flat_data = flat_data.set_index('paper').loc[top_titles.index].reset_index(drop=True)
+
+    # Create a combined column for the title and citations for easier labeling
+    flat_data['title_citation'] = flat_data['title'] + " (" + flat_data['citations'].astype(str) + " citations)"
+    flat_data['citations'] = flat_data['citations'] * flat_data['share']
+    return flat_data[['arxiv_category', 'title_citation', 'citations']]
+
+
+def arxiv_metrics_tables(df, ranked):
+    # Relevance-weighted paper counts and metrics per arXiv category and class
+    values = df[ARXIV_METRICS]
+    return {
+        'arxiv_category_metrics': arxiv_weights.weighted_metrics(ranked, values, 'arxiv_category'),
+        'arxiv_class_metrics': arxiv_weights.weighted_metrics(ranked, values, 'arxiv_class'),
+    }
+
+
+def citations_downloads_index(df):
+    # CITATIONS VS DOWNLOADS: spatial index over the papers fig_4 plots
+    return scatter_index.build(df[FIG_4_COLUMNS])
+
+
+def research_type_data(df):
+    # theoretical vs experimental: papers after 1980 with a research focus
+    research_data = df.loc[(df['year'] > RESEARCH_TYPE_AFTER) & df['research_focus'].notnull(), ['year', 'bibcode', 'citations', 'research_focus']]
+    category = research_data['research_focus'].astype(str).rename('category')
+    research_type = category.map(RESEARCH_TYPE).rename('research_type')
+    return research_data, [research_data['year'], category, research_type]
+
+
+def theoretical_vs_experimental_table(df):
+    # Group by year, category, and research type, counting unique bibcodes
+    research_data, keys = research_type_data(df)
+    return research_data.groupby(keys)['bibcode'].nunique().reset_index(name='counts')
+
+
+def citations_focus_table(df):
+    research_data = df.loc[(df['year'] > CITATIONS_FOCUS_AFTER) & df['research_focus'].notnull(), ['year', 'research_focus', 'citations']]
+    research_focus = research_data['research_focus'].astype(str)
+    return research_data.groupby(['year', research_focus])['citations'].sum().unstack(fill_value=0)
+
+
+def theoretical_vs_experimental_citations_table(df):
+    # Group by year, category, and research type, summing citations
+    research_data, keys = research_type_data(df)
+    return research_data.groupby(keys)['citations'].sum().reset_index(name='total_citations')
+
+
+def _timed(name, function, *args):
+    with startup_profile.stage('aggregate ' + name):
+        return function(*args)
+
+
+def build(df):
+    df = _timed('prepare', prepare, df)
+    ranked = _timed('ranked_classes', arxiv_weights.ranked_classes, df['arxiv_class'])
+    arxiv_shares = _timed('category_shares', arxiv_weights.category_shares, ranked, np.arange(len(df)))
+    tables = _timed('publications (arxiv_distribution)', publications_tables, df, arxiv_shares)
+    tables['grouped_data'] = _timed('grouped_data', dm_models_focus_table, df)
+    tables['top_titles'] = _timed('top_titles', top_titles_table, df, ranked)
+    tables.update(_timed('arxiv_metrics', arxiv_metrics_tables, df, ranked))
+    tables['citations_downloads_index'] = _timed('citations_downloads_index', citations_downloads_index, df)
+    tables['theoretical_vs_experimental'] = _timed('theoretical_vs_experimental', theoretical_vs_experimental_table,
+                                                   df)
+    tables['grouped_citation_data'] = _timed('grouped_citation_data', citations_focus_table, df)
+    tables['grouped_data_2'] = _timed('grouped_data_2', theoretical_vs_experimental_citations_table, df)
+    tables['entity_trends'] = _timed('entity_trends', entity_trends.build_index, df, columnar_store.ENTITY_COLUMNS)
+    tables['co_occurrence'] = _timed('co_occurrence', co_occurrence.build, df, columnar_store.ENTITY_COLUMNS)
+    tables['filter_cubes'] = _timed('filter_cubes', filter_cubes.build, df, arxiv_shares,
+                                    [label for _, label in RESEARCH_FOCUS], RESEARCH_TYPE, TITLES_MAX_PAPERS)
+    tables['citation_graph'] = _timed('citation_graph', citation_graph.build, df[CITATION_GRAPH_COLUMNS])
+    return tables
+
+
+def _shares(df):
+    ranked = arxiv_weights.ranked_classes(df['arxiv_class'])
+    return ranked, arxiv_weights.category_shares(ranked, np.arange(len(df)))
+
+
+def patch(tables, df, removed, added):
+    # The tables of `df` from `tables`, those of the corpus before a refresh:
+    # `removed` holds the old rows of the refreshed papers and `added` their
+    # new rows and the new papers (all read like in build_for_cached_skeleton).
+    # The counts are adjusted by the delta, and the unfiltered count tables are
+    # read back from the patched filter cubes, which give the same tables as
+    # build (tests/test_filter_cubes.py). The scatter index, co-occurrence
+    # statistics and citation graph (with its PageRank) depend on the whole
+    # corpus and are rebuilt
+    df = _timed('prepare', prepare, df)
+    removed, added = prepare(removed.reset_index(drop=True)), prepare(added.reset_index(drop=True))
+    (removed_ranked, removed_shares), (added_ranked, added_shares) = _shares(removed), _shares(added)
+    cubes = tables['filter_cubes']
+    _timed('filter_cubes', cubes.patch, df, removed, removed_shares, added, added_shares)
+    tables.update(publications_hover_tables(*cubes.publications({})))
+    tables['grouped_data'] = cubes.dm_models_focus({})
+    top = df.nlargest(50, 'citations').reset_index(drop=True)
+    tables['top_titles'] = top_titles_table(top, arxiv_weights.ranked_classes(top['arxiv_class']))
+    for by in ('arxiv_category', 'arxiv_class'):
+        tables[by + '_metrics'] = arxiv_weights.patch_metrics(
+            tables[by + '_metrics'], arxiv_weights.weighted_metrics(removed_ranked, removed[ARXIV_METRICS], by),
+            arxiv_weights.weighted_metrics(added_ranked, added[ARXIV_METRICS], by), by)
+    tables['citations_downloads_index'] = _timed('citations_downloads_index', citations_downloads_index, df)
+    tables['theoretical_vs_experimental'] = cubes.theoretical_vs_experimental({}, RESEARCH_TYPE_AFTER)
+    tables['grouped_citation_data'] = cubes.citations_focus({}, CITATIONS_FOCUS_AFTER)
+    tables['grouped_data_2'] = cubes.theoretical_vs_experimental_citations({}, RESEARCH_TYPE_AFTER)
+    tables['entity_trends'] = _timed('entity_trends', entity_trends.patch_index, tables['entity_trends'], removed,
+                                     added, columnar_store.ENTITY_COLUMNS)
+    tables['co_occurrence'] = _timed('co_occurrence', co_occurrence.build, df, columnar_store.ENTITY_COLUMNS)
+    tables['citation_graph'] = _timed('citation_graph', citation_graph.build, df[CITATION_GRAPH_COLUMNS])
+    return tables
+
+
+def aggregates_path(version, cache_dir=data_loader.DATA_CACHE_DIR):
+    return os.path.join(cache_dir, f'aggregates-{version}-v{TABLES_VERSION}.pkl')
+
+
+def figures_path(version=None, cache_dir=data_loader.DATA_CACHE_DIR):
+    if FIGURES_PATH:
+        return FIGURES_PATH
+    version = version or data_loader.dataset_version('skeleton', cache_dir)
+    return os.path.join(cache_dir, f'figures-{version}-v{TABLES_VERSION}.pkl')
+
+
+def save(tables, version, path):
+    dest_dir = os.path.dirname(path) or '.'
+    os.makedirs(dest_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix='.aggregates-', suffix='.tmp')
+    os.close(fd)
+    try:
+        pd.to_pickle({'version': version, 'tables': tables}, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def load(path):
+    with startup_profile.stage('load aggregate tables'):
+        return pd.read_pickle(path)
+
+
+def build_for_cached_skeleton(path=None, cache_dir=data_loader.DATA_CACHE_DIR):
+    # Read from the memory-mapped Arrow copy; the citation lists (the largest
+    # list column) stay as Arrow offsets + values instead of one array per paper
+    df = columnar_store.load_dataset('skeleton', columns=SKELETON_COLUMNS, join_lists=ARXIV_CATEGORY_JOIN,
+                                    cache_dir=cache_dir, arrow_lists=CITATION_LIST_COLUMNS, mapped=True,
+                                    join_copies=DM_MODELS_JOIN)
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    with startup_profile.stage('build aggregate tables'):
+        tables = build(df)
+    return save(tables, version, path or aggregates_path(version, cache_dir))
+
+
+def patch_for_cached_skeleton(old_version, bibcodes, cache_dir=data_loader.DATA_CACHE_DIR):
+    # Tables of the cached skeleton patched from those of `old_version`, the
+    # version before a refresh replaced or added the papers `bibcodes`; built
+    # in full if the old tables or columnar copies are gone
+    old_tables = aggregates_path(old_version, cache_dir)
+    old_paths = [os.path.join(cache_dir, old_version + suffix) for suffix in ('.arrow', '.parquet')]
+    old_paths = [path for path in old_paths if os.path.exists(path)]
+    if not os.path.exists(old_tables) or not old_paths:
+        return build_for_cached_skeleton(cache_dir=cache_dir)
+    read = {'columns': SKELETON_COLUMNS, 'join_lists': ARXIV_CATEGORY_JOIN, 'arrow_lists': CITATION_LIST_COLUMNS,
+            'join_copies': DM_MODELS_JOIN}
+    df = columnar_store.load_dataset('skeleton', cache_dir=cache_dir, mapped=True, **read)
+    changed = pc.field('bibcode').isin(bibcodes)
+    removed = columnar_store.read_columns(old_paths[0], rows=changed, **read)
+    added = df[df['bibcode'].isin(bibcodes)]
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    with startup_profile.stage('patch aggregate tables'):
+        tables = patch(load(old_tables)['tables'], df, removed, added)
+    return save(tables, version, aggregates_path(version, cache_dir))
+
+
+def save_figures():
+    # app.py is imported without building its figures, then every figure is
+    # built here and saved for the app to load at startup
+    os.environ['FIGURE_BUILD'] = 'lazy'
+    if os.path.exists(figures_path()):
+        os.remove(figures_path())
+    import app
+    import figure_cache
+    figure_cache.warm()
+    return figure_cache.save(figures_path(), app.FIGURES_KEY)
+
+
+def build_figures(cache_dir=data_loader.DATA_CACHE_DIR):
+    # `python aggregates.py figures` in a new interpreter, since app.py loads
+    # the tables of $DATA_CACHE_DIR when it is imported
+    env = dict(os.environ, DATA_CACHE_DIR=cache_dir)
+    subprocess.run([sys.executable, os.path.abspath(__file__), 'figures'], env=env, check=True)
+    return figures_path(cache_dir=cache_dir)
+
+
+def load_or_build(cache_dir=data_loader.DATA_CACHE_DIR):
+    # Return the aggregate tables for the current dataset version, building them
+    # (and fetching the skeleton) only if they are missing
+    if AGGREGATES_PATH:
+        return load(AGGREGATES_PATH)['tables']
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    if version is not None and os.path.exists(aggregates_path(version, cache_dir)):
+        return load(aggregates_path(version, cache_dir))['tables']
+    return load(build_for_cached_skeleton(cache_dir=cache_dir))['tables']
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['figures']:
+        print(save_figures())
+        sys.exit()
+    if len(sys.argv) < 2 or sys.argv[1] != 'build':
+        sys.exit('usage: python aggregates.py build [output.pkl] | figures')
+    print(build_for_cached_skeleton(sys.argv[2] if len(sys.argv) > 2 else None))
+    # The search index is shipped with the tables; the web app does not build it
+    print(search_index.build_for_cached_skeleton())
+    # So are the static figures
+    if len(sys.argv) > 2:
+        os.environ['AGGREGATES_PATH'] = sys.argv[2]
+    print(save_figures())
@@ -2,125 +2,101 @@
 # coding: utf-8
 
 import dash
-from dash import dcc, html, Input, Output
+from dash import dcc, html, Input, Output, MATCH
+import plotly
 import plotly.express as px
 import pandas as pd
+import hashlib
+import itertools
+import json
+import numpy as np
 import os
-import requests
 import random
+from functools import lru_cache
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
-
-# Google Drive file ID
-file_id = '16lramFSvU4lzshUUMskGzfAi488IibiO'
-skeleton_id = '1WQgTgy5TXD3fDkFtJks5cxo75JUeO1m6'
-download_url = f'https://drive.google.com/uc?export=download&id={file_id}'
-download_skeleton = f'https://drive.google.com/uc?export=download&id={skeleton_id}'
-
-# Download the file
-response = requests.get(download_url)
-skeleton_response = requests.get(download_skeleton)
-open('df_unique.csv', 'wb').write(response.content)
-open('skeleton.pkl', 'wb').write(skeleton_response.content)
-
-# Load the CSV into a DataFrame
-df = pd.read_pickle('skeleton.pkl')
-df_unique = pd.read_csv('df_unique.csv')
+from plotly.io.json import to_json_plotly
+
+import aggregates
+import citation_graph
+import co_occurrence
+import entity_trends
+import figure_cache
+import rendering
+import request_metrics
+import search_index
+import startup_profile
+
+# Precomputed aggregate tables (see aggregates.py); the raw skeleton frame is
+# only loaded here when the tables for the current dataset version are missing
+aggs = aggregates.load_or_build()
 paper_counts = pd.read_csv('assets/paper_counts.csv')
 
-
-
-# Plot codes:
-# Replace NaN or empty arxiv_category with a placeholder "No class"
-df['arxiv_category'] = df['arxiv_category'].apply(lambda x: ', '.join(x) if isinstance(x, list) else (x if pd.notnull(x) else 'No class'))
-df['arxiv_category'] = df['arxiv_category'].replace('', 'No class')  # Ensure empty strings are replaced with "No class"
-
-# Group by 'year' and count the number of publications
-publications_per_year = df.groupby('year').size().reset_index(name='publication_count')
-
-# Create a DataFrame that includes the count and percentage of arxiv_category per year
-arxiv_distribution = df.groupby(['year', 'arxiv_category']).size().reset_index(name='category_count')
-arxiv_distribution = arxiv_distribution.merge(publications_per_year, on='year')
-arxiv_distribution['percentage'] = (arxiv_distribution['category_count'] / arxiv_distribution['publication_count']) * 100
-
-# Format arxiv_distribution for hover information
-# Sort arxiv_distribution by 'category_count' in descending order
-arxiv_distribution = arxiv_distribution.sort_values(by='category_count', ascending=False)
-
-# Create the 'formatted_info' column with the sorted data
-arxiv_distribution['formatted_info'] = arxiv_distribution.apply(
-    lambda row: f"{row['arxiv_category']}: {row['category_count']} ({row['percentage']:.1f}%)<br>", axis=1
-)
-
-# Aggregate formatted_info by year
-hover_data = arxiv_distribution.groupby('year')['formatted_info'].apply(lambda x: ''.join(x)).reset_index(name='arxiv_distribution')
-
-# Create a DataFrame with titles for years with 15 or fewer papers
-titles_per_year = df.groupby('year')['title'].apply(lambda x: '<br>'.join(x) if len(x) <= 15 else '').reset_index(name='titles')
-
-# Merge all hover data
-merged_df = publications_per_year.merge(hover_data, on='year', how='left').merge(titles_per_year, on='year', how='left')
+merged_df = aggs['merged_df']
 
 # Create the Plotly figure
-fig_X = go.Figure()
-
-# Add a line trace for publications per year
-fig_X.add_trace(go.Scatter(
-    x=merged_df['year'],
-    y=merged_df['publication_count'],
-    mode='lines+markers',
-    line=dict(color='#E09351', width=1),
-    marker=dict(size=8),
-    hovertemplate=(
-        '<b>Year:</b> %{x}<br>' +
-        '<b>Publications:</b> %{y}<br>' +
-        '<b>arXiv Categories:</b><br>%{customdata[0]}' +
-        '<br><b>Titles:</b><br>%{customdata[1]}<extra></extra>'
-        if '%{customdata[1]}' != '' else  # Display titles conditionally
-        '<b>Year:</b> %{x}<br>' +
-        '<b>Publications:</b> %{y}<br>' +
-        '<b>arXiv Categories:</b><br>%{customdata[0]}<extra></extra>'
-    ),
-    customdata=merged_df[['arxiv_distribution', 'titles']].values  # Pass both the arXiv distribution and titles
-))
-
-# Update the layout
-fig_X.update_layout(
-    font=dict(
-        family="DejaVu Sans Mono",  # Custom font
-        size=12,
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",  # Title font customization
-        size=18,
-        color='#fff8e8',  # Title color
-    ),
-    plot_bgcolor='#20272d',  # Custom background color
-    paper_bgcolor='#20272d',  # Custom outer background color
-    width=1000,  # Custom width
-    height=600,  # Custom height
-    xaxis=dict(
-        title_font=dict(color='#fff8e8'),  # X-axis label color
-        tickfont=dict(color='#fff8e8'),  # X-axis tick label color
-        gridcolor='rgba(255, 255, 255, 0.2)',  # X-axis grid color (faint white)
-        linecolor='rgba(255, 255, 255, 0.5)',  # X-axis line color
-        type='linear'
-    ),
-    yaxis=dict(
-        title_font=dict(color='#fff8e8'),  # Y-axis label color
-        tickfont=dict(color='#fff8e8'),  # Y-axis tick label color
-        gridcolor='rgba(255, 255, 255, 0.2)',  # Y-axis grid color (faint white)
-        linecolor='rgba(255, 255, 255, 0.5)',  # Y-axis line color
-        type='log',
-    ),
-    hoverlabel=dict(
-        bgcolor='#333333',
-        font_size=12,
-        font_family="DejaVu Sans Mono",
-        font_color='#FFF8E8'
-    ),
-    showlegend=False
-)
+def publications_figure(merged_df):
+    fig_X = go.Figure()
+
+    # Add a line trace for publications per year
+    fig_X.add_trace(rendering.scatter(
+        len(merged_df),
+        x=merged_df['year'],
+        y=merged_df['publication_count'],
+        mode='lines+markers',
+        line=dict(color='#E09351', width=1),
+        marker=dict(size=8),
+        hovertemplate=(
+            '<b>Year:</b> %{x}<br>' +
+            '<b>Publications:</b> %{y}<br>' +
+            '<b>arXiv Categories:</b><br>%{customdata[0]}' +
+            '<br><b>Titles:</b><br>%{customdata[1]}<extra></extra>'
+            if '%{customdata[1]}' != '' else  # Display titles conditionally
+            '<b>Year:</b> %{x}<br>' +
+            '<b>Publications:</b> %{y}<br>' +
+            '<b>arXiv Categories:</b><br>%{customdata[0]}<extra></extra>'
+        ),
+        customdata=merged_df[['arxiv_distribution', 'titles']].values  # Pass both the arXiv distribution and titles
+    ))
+
+    # Update the layout
+    fig_X.update_layout(
+        font=dict(
+            family="DejaVu Sans Mono",  # Custom font
+            size=12,
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",  # Title font customization
+            size=18,
+            color='#fff8e8',  # Title color
+        ),
+        plot_bgcolor='#20272d',  # Custom background color
+        paper_bgcolor='#20272d',  # Custom outer background color
+        width=1000,  # Custom width
+        height=600,  # Custom height
+        xaxis=dict(
+            title_font=dict(color='#fff8e8'),  # X-axis label color
+            tickfont=dict(color='#fff8e8'),  # X-axis tick label color
+            gridcolor='rgba(255, 255, 255, 0.2)',  # X-axis grid color (faint white)
+            linecolor='rgba(255, 255, 255, 0.5)',  # X-axis line color
+            type='linear'
+        ),
+        yaxis=dict(
+            title_font=dict(color='#fff8e8'),  # Y-axis label color
+            tickfont=dict(color='#fff8e8'),  # Y-axis tick label color
+            gridcolor='rgba(255, 255, 255, 0.2)',  # Y-axis grid color (faint white)
+            linecolor='rgba(255, 255, 255, 0.5)',  # Y-axis line color
+            type='log',
+        ),
+        hoverlabel=dict(
+            bgcolor='#333333',
+            font_size=12,
+            font_family="DejaVu Sans Mono",
+            font_color='#FFF8E8'
+        ),
+        showlegend=False
+    )
+    return fig_X
 
 #-> PLOT <-
 #dark matter models & research trends
@@ -128,523 +104,518 @@ spektrum = ['#FFF8E8', '#FCDCA4', '#FDBF7F','#FCB57A', '#EEB57C', '#EE9D6D', '#E
 random.shuffle(spektrum)
 
 
-category_data = df[['year', 'theory', 'particles', 'gravity', 'detectors', 'colliders', 'dm_models', 'telescopes', 'stellar_objects', 'methods', 'inferences']].copy()
-category_data['dm_models'] = category_data['dm_models'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-category_data['category'] = category_data['dm_models']
-category_data['research focus'] = None
-
-category_data.loc[category_data['particles'].notnull(), 'research focus'] = 'Particles'
-category_data.loc[category_data['gravity'].notnull(), 'research focus'] = 'Gravitational phenomena'
-category_data.loc[category_data['detectors'].notnull(), 'research focus'] = 'Detectors'
-category_data.loc[category_data['theory'].notnull(), 'research focus'] = 'Theories'
-category_data.loc[category_data['colliders'].notnull(), 'research focus'] = 'Colliders'
-category_data.loc[category_data['stellar_objects'].notnull(), 'research focus'] = 'Stellar Objects'
-category_data.loc[category_data['methods'].notnull(), 'research focus'] = 'Methods'
-category_data.loc[category_data['inferences'].notnull(), 'research focus'] = 'Inferences'
-category_data.loc[category_data['telescopes'].notnull(), 'research focus'] = 'Telescopes'
-
-category_data = category_data.dropna(subset=['category', 'research focus'])
-grouped_data = category_data.groupby(['year', 'category', 'research focus']).size().reset_index(name='counts')
-
-
-fig_1 = px.bar(
-    grouped_data,
-    x='year',
-    y='counts',
-    color='category',
-    facet_row='research focus',
-    labels={'year': 'Year', 'counts': 'Number of papers', 'category': 'Dark Matter Models'},
-    color_discrete_sequence=spektrum
-)
+grouped_data = aggs['grouped_data']
 
-fig_1.update_layout(
-    font=dict(family="DejaVu Sans Mono", size=12, color='#fff8e8'),
-    plot_bgcolor='#20272d',
-    paper_bgcolor='#20272d',
-    width=1000,
-    height=3400,
-    xaxis=dict(
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)'
-    ),
-    yaxis=dict(
+
+def dm_models_figure(grouped_data):
+    fig_1 = px.bar(
+        grouped_data,
+        x='year',
+        y='counts',
+        color='category',
+        facet_row='research focus',
+        labels={'year': 'Year', 'counts': 'Number of papers', 'category': 'Dark Matter Models'},
+        color_discrete_sequence=spektrum
+    )
+
+    fig_1.update_layout(
+        font=dict(family="DejaVu Sans Mono", size=12, color='#fff8e8'),
+        plot_bgcolor='#20272d',
+        paper_bgcolor='#20272d',
+        width=1000,
+        height=3400,
+        xaxis=dict(
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)'
+        ),
+        yaxis=dict(
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)'
+        ),
+        hoverlabel=dict(
+            bgcolor='#333333',
+            font_size=12,
+            font_family="DejaVu Sans Mono",
+            font_color='#FFF8E8'
+        ),
+        showlegend=False
+    )
+
+    fig_1.update_yaxes(type='log', matches='y', gridcolor='rgba(255, 255, 255, 0.2)', linecolor='rgba(255, 255, 255, 0.5)')
+    fig_1.update_xaxes(
+        matches='x',
+        showticklabels=True,
         title_font=dict(color='#fff8e8'),
         tickfont=dict(color='#fff8e8'),
         gridcolor='rgba(255, 255, 255, 0.2)',
         linecolor='rgba(255, 255, 255, 0.5)'
-    ),
-    hoverlabel=dict(
-        bgcolor='#333333',
-        font_size=12,
-        font_family="DejaVu Sans Mono",
-        font_color='#FFF8E8'
-    ),
-    showlegend=False
-)
+    )
+    fig_1.for_each_annotation(lambda a: a.update(textangle=90, font=dict(color='#fff8e8')))
+    return fig_1
 
-fig_1.update_yaxes(type='log', matches='y', gridcolor='rgba(255, 255, 255, 0.2)', linecolor='rgba(255, 255, 255, 0.5)')
-fig_1.update_xaxes(
-    matches='x',
-    showticklabels=True,
-    title_font=dict(color='#fff8e8'),
-    tickfont=dict(color='#fff8e8'),
-    gridcolor='rgba(255, 255, 255, 0.2)',
-    linecolor='rgba(255, 255, 255, 0.5)'
-)
-fig_1.for_each_annotation(lambda a: a.update(textangle=90, font=dict(color='#fff8e8')))
 
 # most cited titles by arXiv
-top_titles = df.nlargest(50, 'citations')
-flat_data = top_titles.explode(['arxiv_category', 'citations']).reset_index(drop=True)
-
-# Replace None or NaN in 'arxiv_category' with a placeholder
-flat_data['arxiv_category'] = flat_data['arxiv_category'].fillna('Unknown')
-
-# Create a combined column for the title and citations for easier labeling
-flat_data['title_citation'] = flat_data['title'] + " (" + flat_data['citations'].astype(str) + " citations)"
+flat_data = aggs['top_titles']
 
 # Sunburst plot where each arxiv_category has an outer ring of individual titles
-fig_3 = px.sunburst(
-    flat_data,
-    path=['arxiv_category', 'title_citation'],
-    values='citations',
-    #title="Top 50 Most Cited Titles Grouped by arxiv_category",
-    color='arxiv_category',  # Color by category for easy distinction
-    color_discrete_sequence=px.colors.qualitative.Pastel  # Soft color palette for clarity
-)
+def top_titles_figure(flat_data):
+    fig_3 = px.sunburst(
+        flat_data,
+        path=['arxiv_category', 'title_citation'],
+        values='citations',
+        #title="Top 50 Most Cited Titles Grouped by arxiv_category",
+        color='arxiv_category',  # Color by category for easy distinction
+        color_discrete_sequence=px.colors.qualitative.Pastel  # Soft color palette for clarity
+    )
 
-# Customize layout with larger size and styling
-fig_3.update_layout(
-    font=dict(
-        family="DejaVu Sans Mono",  # Custom font
-        size=14,  # Larger font size for readability
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",
-        size=20,  # Larger title font
-        color='#fff8e8',  # Title color
-    ),
-    plot_bgcolor='#20272d',  # Background color
-    paper_bgcolor='#20272d',  # Outer background color
-    margin=dict(t=60, l=10, r=10, b=10),  # Adjusting margins
-    width=700,  # Increased width
-    height=700,  # Increased height
-    hoverlabel=dict(  # Hover label customization
-        font=dict(family="DejaVu Sans Mono"),
-        bgcolor='#333333',
-        font_color='#fff8e8'
+    # Customize layout with larger size and styling
+    fig_3.update_layout(
+        font=dict(
+            family="DejaVu Sans Mono",  # Custom font
+            size=14,  # Larger font size for readability
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",
+            size=20,  # Larger title font
+            color='#fff8e8',  # Title color
+        ),
+        plot_bgcolor='#20272d',  # Background color
+        paper_bgcolor='#20272d',  # Outer background color
+        margin=dict(t=60, l=10, r=10, b=10),  # Adjusting margins
+        width=700,  # Increased width
+        height=700,  # Increased height
+        hoverlabel=dict(  # Hover label customization
+            font=dict(family="DejaVu Sans Mono"),
+            bgcolor='#333333',
+            font_color='#fff8e8'
+        )
     )
-)
-# Update hovertemplate to show both citation count and percentage
-fig_3.update_traces(
-    hovertemplate="<b>%{label}</b><br>Citations: %{value}<br>Percentage: %{percentParent:.2%}",
-)
+    # Update hovertemplate to show both citation count and percentage; citations
+    # are split over a paper's arXiv categories by relevance, hence the rounding
+    fig_3.update_traces(
+        hovertemplate="<b>%{label}</b><br>Citations: %{value:,.0f}<br>Percentage: %{percentParent:.2%}",
+    )
+    return fig_3
+
+
+# METRICS VS ARXIV
+# Relevance-weighted paper counts, citations and downloads per arXiv category
+# and classification (see arxiv_weights.py)
+ARXIV_CLASSES_SHOWN = 25
+
+
+def arxiv_metrics_figure(metrics, by, title):
+    colors = {'papers': '#AED3D4', 'citations': '#FCC405', 'downloads': '#EC5B1D'}
+    fig = go.Figure()
+    for metric in ['papers'] + aggregates.ARXIV_METRICS:
+        fig.add_trace(go.Bar(
+            x=metrics[by],
+            y=metrics[metric],
+            name=metric.capitalize(),
+            marker_color=colors.get(metric),
+            hovertemplate='<b>%{x}</b><br>' + metric.capitalize() + ': %{y:,.1f}<extra></extra>',
+        ))
+    fig.update_layout(
+        title=title,
+        barmode='group',
+        yaxis=dict(type='log', title='Relevance-weighted total', gridcolor='#444444'),
+        xaxis=dict(tickangle=-45),
+        font=dict(family='DejaVu Sans Mono', size=12, color='#fff8e8'),
+        plot_bgcolor='#20272d',
+        paper_bgcolor='#20272d',
+        legend=dict(orientation='h', y=1.08, x=0),
+        margin=dict(t=90, l=60, r=20, b=160),
+        height=600,
+        hoverlabel=dict(font=dict(family='DejaVu Sans Mono'), bgcolor='#333333', font_color='#fff8e8'),
+    )
+    return fig
 
 
-# CITATIONS VS DOWNLOADS
-# Create the bubble plot using Plotly
-fig_4 = px.scatter(
-    df,
-    x='citations_normalized',
-    y='downloads',
-    size='citations',  # Size of the bubbles based on downloads
-    hover_data=['title', 'first_author', 'year'],  # Hover info for papers
-    #title='Top Cited Papers vs. Downloads',
-    labels={'citations_normalized': 'Normalized Citations', 'downloads': 'Downloads'},
-    opacity=0.7,  # Slight transparency for better overlapping visibility
-    size_max=40,  # Maximum bubble size
-)
 
-# Customize layout
-fig_4.update_layout(
-    font=dict(
-        family="DejaVu Sans Mono",  # Custom font
-        size=12,
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",
-        size=18,
-        color='#fff8e8',  # Title color
-    ),
-    plot_bgcolor='#20272d',  # Background color
-    paper_bgcolor='#20272d',  # Outer background
-    width=1000,  # Custom width
-    height=600,  # Custom height
-    xaxis=dict(
-        title_font=dict(color='#fff8e8'),  # X-axis label color
-        tickfont=dict(color='#fff8e8'),  # X-axis tick label color
-        gridcolor='rgba(255, 255, 255, 0.2)',  # Grid color
-        linecolor='rgba(255, 255, 255, 0.5)',  # Axis line color
-        type='log'
-    ),
-    yaxis=dict(
-        title_font=dict(color='#fff8e8'),  # Y-axis label color
-        tickfont=dict(color='#fff8e8'),  # Y-axis tick label color
-        gridcolor='rgba(255, 255, 255, 0.2)',  # Grid color
-        linecolor='rgba(255, 255, 255, 0.5)',  # Axis line color
-        type='log',
-    ),
-    hoverlabel=dict(
-        bgcolor='#333333',  # Background color for hover labels
-        font_size=12,  # Font size for hover labels
-        font_family="DejaVu Sans Mono",  # Hover font
-        font_color='#FFF8E8'  # Text color for hover labels
-    )
-)
 
-# Customize marker styling (bubbles)
-fig_4.update_traces(
-    marker=dict(
-        color='#F2A604',  # Custom color for bubbles
-        line=dict(
-            width=0.5,
-            color='#20272d'  # Border color around bubbles
+# CITATIONS VS DOWNLOADS
+# Embedding every paper makes the figure several megabytes, so the default view
+# is a log-binned density of the whole corpus with the most cited papers drawn
+# as bubbles on top. Zooming in fetches only the papers inside the viewport from
+# the spatial index built in aggregates.py (see update_citations_downloads).
+citations_index = aggs['citations_downloads_index']
+CITATIONS_OUTLIERS = 500  # bubbles drawn over the density overview
+CITATIONS_POINT_BUDGET = 5000  # most bubbles sent for a zoomed-in viewport
+citations_sizeref = 2.0 * max(citations_index.points['citations'].max(), 1) / (40 ** 2)  # Maximum bubble size 40
+
+def citations_downloads_figure(points, viewport=None, total=None):
+    fig = go.Figure()
+
+    # Density of all papers; empty bins are left transparent
+    density = citations_index.density.T
+    fig.add_trace(go.Heatmap(
+        x=citations_index.x_edges,
+        y=citations_index.y_edges,
+        z=np.where(density > 0, np.log10(np.maximum(density, 1)), np.nan),
+        customdata=density.astype(int),
+        colorscale='electric',
+        showscale=False,
+        opacity=0.6,
+        hovertemplate='Papers in bin: %{customdata}<extra></extra>',
+    ))
+
+    # Bubbles for individual papers (WebGL once there are many of them)
+    fig.add_trace(rendering.scatter(
+        len(points),
+        x=points['citations_normalized'],
+        y=points['downloads'],
+        mode='markers',
+        customdata=points[['title', 'first_author', 'year']].to_numpy(dtype=object, na_value=None),
+        hovertemplate=(
+            'Normalized Citations=%{x}<br>Downloads=%{y}<br>citations=%{marker.size}<br>'
+            'title=%{customdata[0]}<br>first_author=%{customdata[1]}<br>year=%{customdata[2]}<extra></extra>'
+        ),
+        marker=dict(
+            size=points['citations'],  # Size of the bubbles based on citations
+            sizemode='area',
+            sizeref=citations_sizeref,
+            color='#F2A604',  # Custom color for bubbles
+            opacity=0.7,  # Slight transparency for better overlapping visibility
+            line=dict(
+                width=0.5,
+                color='#20272d'  # Border color around bubbles
+            )
         )
+    ))
+
+    # Customize layout
+    fig.update_layout(
+        font=dict(
+            family="DejaVu Sans Mono",  # Custom font
+            size=12,
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",
+            size=18,
+            color='#fff8e8',  # Title color
+        ),
+        plot_bgcolor='#20272d',  # Background color
+        paper_bgcolor='#20272d',  # Outer background
+        width=1000,  # Custom width
+        height=600,  # Custom height
+        xaxis=dict(
+            title='Normalized Citations',
+            title_font=dict(color='#fff8e8'),  # X-axis label color
+            tickfont=dict(color='#fff8e8'),  # X-axis tick label color
+            gridcolor='rgba(255, 255, 255, 0.2)',  # Grid color
+            linecolor='rgba(255, 255, 255, 0.5)',  # Axis line color
+            type='log'
+        ),
+        yaxis=dict(
+            title='Downloads',
+            title_font=dict(color='#fff8e8'),  # Y-axis label color
+            tickfont=dict(color='#fff8e8'),  # Y-axis tick label color
+            gridcolor='rgba(255, 255, 255, 0.2)',  # Grid color
+            linecolor='rgba(255, 255, 255, 0.5)',  # Axis line color
+            type='log',
+        ),
+        hoverlabel=dict(
+            bgcolor='#333333',  # Background color for hover labels
+            font_size=12,  # Font size for hover labels
+            font_family="DejaVu Sans Mono",  # Hover font
+            font_color='#FFF8E8'  # Text color for hover labels
+        ),
+        showlegend=False,
+        uirevision='citations-downloads',  # Keep the user's zoom when the points are swapped
     )
-)
 
+    if viewport is not None:
+        # Log axes take their range in log10 units, which is what the index uses
+        fig.update_layout(xaxis_range=list(viewport[0]), yaxis_range=list(viewport[1]))
+        if total is not None and total > len(points):
+            fig.add_annotation(
+                text=f'Showing the {len(points)} most cited of {total} papers in view',
+                xref='paper', yref='paper', x=0, y=1.05, showarrow=False, font=dict(color='#fff8e8'),
+            )
+    return fig
 
-# theoretical vs experimental
-# Filter data for years after 1980
-df_filtered = df[df['year'] > 1980]
-
-# Ensure that `bibcode` is included in the filtered DataFrame
-theoretical_vs_experimental_df = df_filtered[['year', 'particles', 'gravity', 'detectors', 'colliders', 'stellar_objects', 'methods', 'inferences', 'telescopes', 'dm_models', 'bibcode']].copy()
-
-# Define research focus based on non-null values, same as before
-theoretical_vs_experimental_df['category'] = None
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['particles'].notnull(), 'category'] = 'Particles'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['gravity'].notnull(), 'category'] = 'Gravity'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['detectors'].notnull(), 'category'] = 'Detectors'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['colliders'].notnull(), 'category'] = 'Colliders'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['stellar_objects'].notnull(), 'category'] = 'Stellar Objects'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['methods'].notnull(), 'category'] = 'Methods'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['inferences'].notnull(), 'category'] = 'Inferences'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['telescopes'].notnull(), 'category'] = 'Telescopes'
-theoretical_vs_experimental_df.loc[theoretical_vs_experimental_df['dm_models'].notnull(), 'category'] = 'Dark matter models'
-
-# Drop rows without a category
-theoretical_vs_experimental_df = theoretical_vs_experimental_df.dropna(subset=['category'])
-
-# Map categories to "Theoretical" or "Experimental"
-theoretical_map = {
-    'Particles': 'Experimental', 'Detectors': 'Experimental', 'Colliders': 'Experimental', 'Telescopes': 'Experimental',
-    'Gravity': 'Theoretical', 'Dark matter models': 'Theoretical', 'Stellar Objects': 'Theoretical', 'Methods': 'Theoretical', 'Inferences': 'Theoretical'
-}
-theoretical_vs_experimental_df['research_type'] = theoretical_vs_experimental_df['category'].map(theoretical_map)
 
-# Group by year, category, and research type, counting unique bibcodes
-grouped_data = theoretical_vs_experimental_df.groupby(['year', 'category', 'research_type'])['bibcode'].nunique().reset_index(name='counts')
+@lru_cache(maxsize=None)
+def citations_overview_figure():
+    # Default (zoomed-out) view, also restored when the axes are reset
+    return citations_downloads_figure(citations_index.outliers(CITATIONS_OUTLIERS))
 
 
-# Separate the data for experimental and theoretical subplots
-experimental_data = grouped_data[grouped_data['research_type'] == 'Experimental']
-theoretical_data = grouped_data[grouped_data['research_type'] == 'Theoretical']
+# theoretical vs experimental
+grouped_data = aggs['theoretical_vs_experimental']
 
-# Define color palettes
-experimental_colors = ['#AED3D4', '#65D4CC', '#5E9E95', '#A4D4AC']
-theoretical_colors = ['#ECD305', '#FCC405', '#F2A604', '#DC8334', '#EC5B1D']
 
-# Create subplot
-fig_5 = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=("Experimental Research", "Theoretical Research"),
-    shared_yaxes=True
-)
+def theoretical_vs_experimental_figure(grouped_data):
+    # Separate the data for experimental and theoretical subplots
+    experimental_data = grouped_data[grouped_data['research_type'] == 'Experimental']
+    theoretical_data = grouped_data[grouped_data['research_type'] == 'Theoretical']
 
-# Add experimental bars
-for i, category in enumerate(experimental_data['category'].unique()):
-    subset = experimental_data[experimental_data['category'] == category]
-    fig_5.add_trace(
-        go.Bar(
-            x=subset['year'],
-            y=subset['counts'],
-            name=category,
-            marker_color=experimental_colors[i % len(experimental_colors)]
-        ),
-        row=1, col=1
-    )
+    # Define color palettes
+    experimental_colors = ['#AED3D4', '#65D4CC', '#5E9E95', '#A4D4AC']
+    # One colour per theoretical category of aggregates.RESEARCH_TYPE (six)
+    theoretical_colors = ['#ECD305', '#FCC405', '#F2A604', '#DC8334', '#EC5B1D', '#B8431A']
 
-# Add theoretical bars
-for i, category in enumerate(theoretical_data['category'].unique()):
-    subset = theoretical_data[theoretical_data['category'] == category]
-    fig_5.add_trace(
-        go.Bar(
-            x=subset['year'],
-            y=subset['counts'],
-            name=category,
-            marker_color=theoretical_colors[i % len(theoretical_colors)]
-        ),
-        row=1, col=2
+    # Create subplot
+    fig_5 = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Experimental Research", "Theoretical Research"),
+        shared_yaxes=True
     )
 
-# Update layout
-fig_5.update_layout(
-    font=dict(
-        family="DejaVu Sans Mono",
-        size=12,
-        color='#fff8e8'
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",
-        size=18,
-        color='#fff8e8'
-    ),
-    plot_bgcolor='#20272d',
-    paper_bgcolor='#20272d',
-    width=1000,
-    height=600,
-    yaxis_type="linear",
-    yaxis2_type='linear',
-    xaxis=dict(
-        title="Year",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    xaxis2=dict(
-        title="Year",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    yaxis=dict(
-        title="Papers",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    yaxis2=dict(
-        title="Papers",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    hoverlabel=dict(
-        bgcolor='#333333',
-        font_size=12,
-        font_family="DejaVu Sans Mono",
-        font_color='#FFF8E8'
-    ),
-    barmode='stack'
-)
-
-#FIG 6
-import numpy as np
-df_b = df[df['year'] > 1933]
-research_data = df_b[['year', 'theory', 'particles', 'gravity', 'detectors', 'colliders', 'dm_models', 'telescopes', 'stellar_objects', 'methods', 'inferences', 'citations']].copy()
-
-research_data['research_focus'] = None
+    # Add experimental bars
+    for i, category in enumerate(experimental_data['category'].unique()):
+        subset = experimental_data[experimental_data['category'] == category]
+        fig_5.add_trace(
+            go.Bar(
+                x=subset['year'],
+                y=subset['counts'],
+                name=category,
+                marker_color=experimental_colors[i % len(experimental_colors)]
+            ),
+            row=1, col=1
+        )
 
-research_data.loc[research_data['theory'].notnull(), 'research_focus'] = 'Theories'
-research_data.loc[research_data['particles'].notnull(), 'research_focus'] = 'Particles'
-research_data.loc[research_data['gravity'].notnull(), 'research_focus'] = 'Gravitational phenomena'
-research_data.loc[research_data['detectors'].notnull(), 'research_focus'] = 'Detectors'
-research_data.loc[research_data['colliders'].notnull(), 'research_focus'] = 'Colliders'
-research_data.loc[research_data['stellar_objects'].notnull(), 'research_focus'] = 'Stellar Objects'
-research_data.loc[research_data['methods'].notnull(), 'research_focus'] = 'Methods'
-research_data.loc[research_data['inferences'].notnull(), 'research_focus'] = 'Inferences'
-research_data.loc[research_data['telescopes'].notnull(), 'research_focus'] = 'Telescopes'
-research_data.loc[research_data['dm_models'].notnull(), 'research_focus'] = 'Dark Matter Models'
+    # Add theoretical bars
+    for i, category in enumerate(theoretical_data['category'].unique()):
+        subset = theoretical_data[theoretical_data['category'] == category]
+        fig_5.add_trace(
+            go.Bar(
+                x=subset['year'],
+                y=subset['counts'],
+                name=category,
+                marker_color=theoretical_colors[i % len(theoretical_colors)]
+            ),
+            row=1, col=2
+        )
 
-research_data = research_data.dropna(subset=['research_focus'])
+    # Update layout
+    fig_5.update_layout(
+        font=dict(
+            family="DejaVu Sans Mono",
+            size=12,
+            color='#fff8e8'
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",
+            size=18,
+            color='#fff8e8'
+        ),
+        plot_bgcolor='#20272d',
+        paper_bgcolor='#20272d',
+        width=1000,
+        height=600,
+        yaxis_type="linear",
+        yaxis2_type='linear',
+        xaxis=dict(
+            title="Year",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        xaxis2=dict(
+            title="Year",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        yaxis=dict(
+            title="Papers",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        yaxis2=dict(
+            title="Papers",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        hoverlabel=dict(
+            bgcolor='#333333',
+            font_size=12,
+            font_family="DejaVu Sans Mono",
+            font_color='#FFF8E8'
+        ),
+        barmode='stack'
+    )
+    return fig_5
 
-grouped_citation_data = research_data.groupby(['year', 'research_focus'])['citations'].sum().unstack(fill_value=0)
+#FIG 6
+grouped_citation_data = aggs['grouped_citation_data']
 
-grouped_citation_data_log = np.log10(grouped_citation_data + 1)  
+def citations_focus_figure(grouped_citation_data):
+    grouped_citation_data_log = np.log10(grouped_citation_data + 1)  
 
-fig_6 = px.imshow(
-    grouped_citation_data_log.T, 
-    aspect='auto',
-    labels=dict(x="Year", y="Research Focus", color="Citations"),
-    color_continuous_scale='electric',
-)
+    fig_6 = px.imshow(
+        grouped_citation_data_log.T, 
+        aspect='auto',
+        labels=dict(x="Year", y="Research Focus", color="Citations"),
+        color_continuous_scale='electric',
+    )
 
-fig_6.update_layout(
-    hoverlabel=dict(
-        bgcolor='#333333',
-        font_size=12,
-        font_family="DejaVu Sans Mono",
-        font_color='#FFF8E8'
-    ),
-    font=dict(
-        family="DejaVu Sans Mono", 
-        size=12,
-        color='#fff8e8',  
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",
-        size=18,
-        color='#fff8e8',  
-    ),
-    plot_bgcolor='#20272d',  
-    paper_bgcolor='#20272d',  
-    width=1000,  
-    height=600, 
-)
+    fig_6.update_layout(
+        hoverlabel=dict(
+            bgcolor='#333333',
+            font_size=12,
+            font_family="DejaVu Sans Mono",
+            font_color='#FFF8E8'
+        ),
+        font=dict(
+            family="DejaVu Sans Mono", 
+            size=12,
+            color='#fff8e8',  
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",
+            size=18,
+            color='#fff8e8',  
+        ),
+        plot_bgcolor='#20272d',  
+        paper_bgcolor='#20272d',  
+        width=1000,  
+        height=600, 
+    )
 
-fig_6.update_traces(
-    hovertemplate='Year: %{x}<br>Research Focus: %{y}<br>Citations: %{customdata}<extra></extra>',
-    customdata=grouped_citation_data.T.values  
-)
+    fig_6.update_traces(
+        hovertemplate='Year: %{x}<br>Research Focus: %{y}<br>Citations: %{customdata}<extra></extra>',
+        customdata=grouped_citation_data.T.values  
+    )
 
-tickvals_log = np.log10([1, 10, 100, 1000, 10000, 100000])  
-ticktext_normal = ['1', '10', '100', '1k', '10k', '100k'] 
+    tickvals_log = np.log10([1, 10, 100, 1000, 10000, 100000])  
+    ticktext_normal = ['1', '10', '100', '1k', '10k', '100k'] 
 
-fig_6.update_coloraxes(
-    colorbar_tickvals=tickvals_log,  
-    colorbar_ticktext=ticktext_normal  
-)
+    fig_6.update_coloraxes(
+        colorbar_tickvals=tickvals_log,  
+        colorbar_ticktext=ticktext_normal  
+    )
+    return fig_6
 
 
 # PLOT 7
-df_filtered_2 = df[df['year'] > 1980]
-
-# Ensure that `bibcode` and `citations` are included in the filtered DataFrame
-theoretical_vs_experimental_df_2 = df_filtered_2[['year', 'particles', 'gravity', 'detectors', 'colliders', 'stellar_objects', 'methods', 'inferences', 'telescopes', 'dm_models', 'bibcode', 'citations']].copy()
-
-# Define research focus based on non-null values
-theoretical_vs_experimental_df_2['category'] = None
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['particles'].notnull(), 'category'] = 'Particles'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['gravity'].notnull(), 'category'] = 'Gravity'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['detectors'].notnull(), 'category'] = 'Detectors'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['colliders'].notnull(), 'category'] = 'Colliders'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['stellar_objects'].notnull(), 'category'] = 'Stellar Objects'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['methods'].notnull(), 'category'] = 'Methods'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['inferences'].notnull(), 'category'] = 'Inferences'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['telescopes'].notnull(), 'category'] = 'Telescopes'
-theoretical_vs_experimental_df_2.loc[theoretical_vs_experimental_df_2['dm_models'].notnull(), 'category'] = 'Dark Matter Models'
-
-# Drop rows without a category
-theoretical_vs_experimental_df_2 = theoretical_vs_experimental_df_2.dropna(subset=['category'])
-
-# Map categories to "Theoretical" or "Experimental"
-theoretical_map_2 = {
-    'Particles': 'Experimental', 'Detectors': 'Experimental', 'Colliders': 'Experimental', 'Telescopes': 'Experimental',
-    'Gravity': 'Theoretical', 'Dark Matter Models': 'Theoretical', 'Stellar Objects': 'Theoretical', 'Methods': 'Theoretical', 'Inferences': 'Theoretical'
-}
-theoretical_vs_experimental_df_2['research_type'] = theoretical_vs_experimental_df_2['category'].map(theoretical_map_2)
-
-# Group by year, category, and research type, summing citations
-grouped_data_2 = theoretical_vs_experimental_df_2.groupby(['year', 'category', 'research_type'])['citations'].sum().reset_index(name='total_citations')
-
-# Separate the data for experimental and theoretical subplots
-experimental_data_2 = grouped_data_2[grouped_data_2['research_type'] == 'Experimental']
-theoretical_data_2 = grouped_data_2[grouped_data_2['research_type'] == 'Theoretical']
-
-# Define color palettes
-experimental_colors_2 = ['#AED3D4', '#65D4CC', '#5E9E95', '#A4D4AC']
-theoretical_colors_2 = ['#ECD305', '#FCC405', '#F2A604', '#DC8334', '#EC5B1D']
+grouped_data_2 = aggs['grouped_data_2']
+
+def theoretical_vs_experimental_citations_figure(grouped_data_2):
+    # Separate the data for experimental and theoretical subplots
+    experimental_data_2 = grouped_data_2[grouped_data_2['research_type'] == 'Experimental']
+    theoretical_data_2 = grouped_data_2[grouped_data_2['research_type'] == 'Theoretical']
+
+    # Define color palettes
+    experimental_colors_2 = ['#AED3D4', '#65D4CC', '#5E9E95', '#A4D4AC']
+    # One colour per theoretical category of aggregates.RESEARCH_TYPE (six)
+    theoretical_colors_2 = ['#ECD305', '#FCC405', '#F2A604', '#DC8334', '#EC5B1D', '#B8431A']
+
+    # Create subplot
+    fig_7 = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Experimental Research", "Theoretical Research"),
+        shared_yaxes=True
+    )
 
-# Create subplot
-fig_7 = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=("Experimental Research", "Theoretical Research"),
-    shared_yaxes=True
-)
+    # Add experimental bars
+    for i, category in enumerate(experimental_data_2['category'].unique()):
+        subset = experimental_data_2[experimental_data_2['category'] == category]
+        fig_7.add_trace(
+            go.Bar(
+                x=subset['year'],
+                y=subset['total_citations'],  # Use citation totals
+                name=category,
+                marker_color=experimental_colors_2[i % len(experimental_colors_2)]
+            ),
+            row=1, col=1
+        )
 
-# Add experimental bars
-for i, category in enumerate(experimental_data_2['category'].unique()):
-    subset = experimental_data_2[experimental_data_2['category'] == category]
-    fig_7.add_trace(
-        go.Bar(
-            x=subset['year'],
-            y=subset['total_citations'],  # Use citation totals
-            name=category,
-            marker_color=experimental_colors_2[i % len(experimental_colors_2)]
-        ),
-        row=1, col=1
-    )
+    # Add theoretical bars
+    for i, category in enumerate(theoretical_data_2['category'].unique()):
+        subset = theoretical_data_2[theoretical_data_2['category'] == category]
+        fig_7.add_trace(
+            go.Bar(
+                x=subset['year'],
+                y=subset['total_citations'],  # Use citation totals
+                name=category,
+                marker_color=theoretical_colors_2[i % len(theoretical_colors_2)]
+            ),
+            row=1, col=2
+        )
 
-# Add theoretical bars
-for i, category in enumerate(theoretical_data_2['category'].unique()):
-    subset = theoretical_data_2[theoretical_data_2['category'] == category]
-    fig_7.add_trace(
-        go.Bar(
-            x=subset['year'],
-            y=subset['total_citations'],  # Use citation totals
-            name=category,
-            marker_color=theoretical_colors_2[i % len(theoretical_colors_2)]
-        ),
-        row=1, col=2
+    # Update layout with citation labels
+    fig_7.update_layout(
+        font=dict(
+            family="DejaVu Sans Mono",
+            size=12,
+            color='#fff8e8'
+        ),
+        title_font=dict(
+            family="DejaVu Sans Mono",
+            size=18,
+            color='#fff8e8'
+        ),
+        plot_bgcolor='#20272d',
+        paper_bgcolor='#20272d',
+        width=1000,
+        height=600,
+        yaxis_type="linear",
+        yaxis2_type='linear',
+        xaxis=dict(
+            title="Year",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        xaxis2=dict(
+            title="Year",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        yaxis=dict(
+            title="Total Citations",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        yaxis2=dict(
+            title="Total Citations",
+            title_font=dict(color='#fff8e8'),
+            tickfont=dict(color='#fff8e8'),
+            gridcolor='rgba(255, 255, 255, 0.2)',
+            linecolor='rgba(255, 255, 255, 0.5)',
+            griddash="dash",
+            showline=False,
+        ),
+        hoverlabel=dict(
+            bgcolor='#333333',
+            font_size=12,
+            font_family="DejaVu Sans Mono",
+            font_color='#FFF8E8'
+        ),
+        barmode='stack'
     )
-
-# Update layout with citation labels
-fig_7.update_layout(
-    font=dict(
-        family="DejaVu Sans Mono",
-        size=12,
-        color='#fff8e8'
-    ),
-    title_font=dict(
-        family="DejaVu Sans Mono",
-        size=18,
-        color='#fff8e8'
-    ),
-    plot_bgcolor='#20272d',
-    paper_bgcolor='#20272d',
-    width=1000,
-    height=600,
-    yaxis_type="linear",
-    yaxis2_type='linear',
-    xaxis=dict(
-        title="Year",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    xaxis2=dict(
-        title="Year",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    yaxis=dict(
-        title="Total Citations",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    yaxis2=dict(
-        title="Total Citations",
-        title_font=dict(color='#fff8e8'),
-        tickfont=dict(color='#fff8e8'),
-        gridcolor='rgba(255, 255, 255, 0.2)',
-        linecolor='rgba(255, 255, 255, 0.5)',
-        griddash="dash",
-        showline=False,
-    ),
-    hoverlabel=dict(
-        bgcolor='#333333',
-        font_size=12,
-        font_family="DejaVu Sans Mono",
-        font_color='#FFF8E8'
-    ),
-    barmode='stack'
-)
+    return fig_7
 
 
 spektrum_2 = ['#F2A604', '#ED90AE', '#59A689', '#5DAA53', '#0A4E6B', '#232323']
@@ -653,6 +624,86 @@ spektrum_2 = ['#F2A604', '#ED90AE', '#59A689', '#5DAA53', '#0A4E6B', '#232323']
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server
 
+# Latency and payload histograms per route and per callback, served in the
+# Prometheus format from /_metrics; installed before any callback is registered
+request_metrics.init_app(app, pages=lambda: ROUTES)
+
+# Global filters (year range, arXiv category, research focus; see
+# filter_cubes.py). Filtered variants of these figures are rebuilt from slices
+# of the prefix-summed cubes and served by the figure cache as ?filters=<json>
+filter_index = aggs['filter_cubes']
+FILTERED_FIGURES = {
+    'fig_X': lambda filters: publications_figure(
+        aggregates.publications_hover_tables(*filter_index.publications(filters))['merged_df']),
+    'fig_1': lambda filters: dm_models_figure(filter_index.dm_models_focus(filters)),
+    'fig_5': lambda filters: theoretical_vs_experimental_figure(
+        filter_index.theoretical_vs_experimental(filters, aggregates.RESEARCH_TYPE_AFTER)),
+    'fig_6': lambda filters: citations_focus_figure(
+        filter_index.citations_focus(filters, aggregates.CITATIONS_FOCUS_AFTER)),
+    'fig_7': lambda filters: theoretical_vs_experimental_citations_figure(
+        filter_index.theoretical_vs_experimental_citations(filters, aggregates.RESEARCH_TYPE_AFTER)),
+}
+
+# Static figures are serialized and compressed once, then fetched by the graphs
+# from /_figures/ instead of being embedded in every page layout. They are built
+# lazily, so the server accepts requests before they exist: with FIGURE_BUILD
+# 'background' (the default) a thread builds them right after startup, 'lazy'
+# leaves each one to its first request and 'eager' builds them all during the
+# import (what the preloading gunicorn master does, see gunicorn.conf.py).
+# /_ready answers 503 until every figure is built. Figures prebuilt by
+# `python aggregates.py build` are loaded first and never rebuilt; they are
+# keyed by this file and the plotly version, so a code change invalidates them.
+FIGURE_BUILD = os.environ.get('FIGURE_BUILD', 'background')
+with open(__file__, 'rb') as source:
+    FIGURES_KEY = hashlib.sha256(source.read()).hexdigest() + '-plotly-' + plotly.__version__
+figure_cache.init_app(server)
+for figure_name, factory in FILTERED_FIGURES.items():
+    figure_cache.register_factory(figure_name, factory)
+for graph_id, figure_name, builder in [
+    ('all-papers-img', 'fig_X', lambda: publications_figure(aggs['merged_df'])),
+    ('barplot-dm-models', 'fig_1', lambda: dm_models_figure(aggs['grouped_data'])),
+    ('titles-arXiv-fig', 'fig_3', lambda: top_titles_figure(aggs['top_titles'])),
+    ('metrics-vs-arXiv-class-fig', 'fig_arxiv_class', lambda: arxiv_metrics_figure(
+        aggs['arxiv_class_metrics'].head(ARXIV_CLASSES_SHOWN), 'arxiv_class',
+        f'Metrics vs. arXiv classification (top {ARXIV_CLASSES_SHOWN})')),
+    ('metrics-vs-arXiv-category-fig', 'fig_arxiv_category', lambda: arxiv_metrics_figure(
+        aggs['arxiv_category_metrics'], 'arxiv_category', 'Metrics vs. arXiv category')),
+    ('citations-downloads-scatter', 'fig_4', citations_overview_figure),
+    ('theoretical-experimental-papers-fig', 'fig_5', lambda: theoretical_vs_experimental_figure(
+        aggs['theoretical_vs_experimental'])),
+    ('citations-research-focus-fig', 'fig_6', lambda: citations_focus_figure(aggs['grouped_citation_data'])),
+    ('theoretical-experimental-citations-fig', 'fig_7',
+     lambda: theoretical_vs_experimental_citations_figure(aggs['grouped_data_2'])),
+]:
+    figure_cache.register_lazy(figure_name, builder)
+    figure_cache.bind(app, graph_id, figure_name, 'figure-filters' if figure_name in FILTERED_FIGURES else None)
+
+# Per-year term frequencies for the entity pages, also served as JSON from
+# /api/entity-trends/<category>
+entity_index = aggs['entity_trends']
+entity_trends.init_app(server, entity_index)
+
+# Sparse co-occurrence counts between entity columns for the /matrix heatmaps,
+# also served as JSON from /api/co-occurrence/<rows>/<columns>
+co_occurrence_index = aggs['co_occurrence']
+co_occurrence.init_app(server, co_occurrence_index)
+co_occurrence_years = (int(co_occurrence_index.years[0]), int(co_occurrence_index.years[-1]))
+
+# Citation graph with precomputed PageRank, degrees and communities; the
+# /citation_network page and /api/citation-graph/<bibcode> serve k-hop
+# neighbourhoods from it
+citation_index = aggs['citation_graph']
+citation_graph.init_app(server, citation_index)
+citation_graph_start = citation_index.bibcode(citation_index.top(1)[0])
+CITATION_GRAPH_NODES = citation_graph.DEFAULT_NODES  # default node budget of the citation network view
+
+# Full-text search (SQLite FTS5 file built offline next to the cached data, see
+# search_index.py), served from /api/search and the /search page; None when no
+# index was built, and search then reports itself as unavailable
+with startup_profile.stage('search index'):
+    search_db = search_index.find()
+search_index.init_app(server, search_db)
+
 # Use a single dark theme for all components
 dark_theme = {
     'background': "#20272D",  # Darkest color for the background
@@ -667,6 +718,7 @@ sidebar = html.Div(
         dcc.Dropdown(
             id='page-selector-dropdown',
             options=[
+                {'label': 'Search papers', 'value': '/search'},
                 {'label': 'Dark Matter publications', 'value': '/papers'},
                 {'label': 'Dark Matter Models', 'value': '/dmm'},
                 {'label': 'Co-occurrence graphs', 'value': '/co_occurrence'},
@@ -693,6 +745,33 @@ sidebar = html.Div(
             style={'color': dark_theme['text'], 'backgroundColor': dark_theme['background']}  # Dropdown's visible part
         ),
         html.Hr(style={'border': '1px solid #E09351FF', 'width': '85%', 'margin': '10px auto', 'opacity': '0.7'}),
+        html.P("filters:", id='filters-text', style={'textAlign': 'center', 'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text']}),
+        dcc.RangeSlider(
+            id='filter-years',
+            min=filter_index.first_year, max=filter_index.last_year, step=1,
+            value=[filter_index.first_year, filter_index.last_year],
+            marks={year: str(year) for year in range(filter_index.first_year, filter_index.last_year + 1) if year % 20 == 0},
+            tooltip={'placement': 'bottom'}
+        ),
+        dcc.Dropdown(
+            id='filter-categories',
+            options=filter_index.categories,
+            multi=True,
+            placeholder='arXiv category',
+            className='custom-dropdown',
+            style={'color': dark_theme['text'], 'backgroundColor': dark_theme['background'], 'marginTop': '10px'}
+        ),
+        dcc.Dropdown(
+            id='filter-focus',
+            options=filter_index.focus_labels,
+            multi=True,
+            placeholder='research focus',
+            className='custom-dropdown',
+            style={'color': dark_theme['text'], 'backgroundColor': dark_theme['background'], 'marginTop': '10px'}
+        ),
+        html.P(id='filter-summary', style={'textAlign': 'center', 'fontFamily': 'DejaVu Sans Mono', 'fontSize': '12px', 'color': dark_theme['text']}),
+        dcc.Store(id='figure-filters'),
+        html.Hr(style={'border': '1px solid #E09351FF', 'width': '85%', 'margin': '10px auto', 'opacity': '0.7'}),
         
         # Clickable "About" text added
         dcc.Link(
@@ -759,7 +838,7 @@ html.P(
     }
 ),
         html.Div(
-            dcc.Graph(id='barplot-dm-models', figure=fig_1, style={'width': '80%', 'height': 'auto', 'marginBottom': '20px'}),
+            dcc.Graph(id='barplot-dm-models', style={'width': '80%', 'height': 'auto', 'marginBottom': '20px'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
 
@@ -973,11 +1052,22 @@ html.P(
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
 
+# Term counts the entity pages show; update_entity_trends serves no others
+ENTITY_TRENDS_TOPS = (15, 20, 'all')
+
+def entity_trends_graph(category, top):
+    # Small-multiples of the `top` most mentioned terms ('all' for every term),
+    # filled by update_entity_trends once the graph is mounted
+    return html.Div(
+        dcc.Graph(id={'type': 'entity-trends', 'category': category, 'top': top}),
+        style={'display': 'flex', 'justifyContent': 'center'}
+    )
+
 def page_particles_layout():
     return html.Div([
         html.H1('PARTICLES', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
-        html.Img(id='particles-img', src='assets/top_20_particles_grid_dark.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('particles', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -986,9 +1076,9 @@ def page_gravity_layout():
         html.H1('GRAVITATIONAL PHENOMENA', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='gravity-img', src='assets/top15_gravity_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('gravity', 15),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Img(id='gravity-all-img', src='assets/all_gravity_terms_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('gravity', 'all'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -997,7 +1087,7 @@ def page_theories_layout():
         html.H1('THEORY', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='theory-img', src='assets/top20_theory_grid_dark.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('theory', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1006,7 +1096,7 @@ def page_telescopes_layout():
         html.H1('TELESCOPES', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='telescopes-img', src='assets/top20_telescopes_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('telescopes', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1015,7 +1105,7 @@ def page_detectors_layout():
         html.H1('DETECTORS', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='detector-img', src='assets/top20_detectors_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('detectors', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1024,7 +1114,7 @@ def page_colliders_layout():
         html.H1('COLLIDERS', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='colliders-img', src='assets/top20_colliders_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('colliders', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1033,7 +1123,7 @@ def page_inferences_layout():
         html.H1('INFERENCES', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='inferences-img', src='assets/top20_inferences_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('inferences', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1042,7 +1132,7 @@ def page_methods_layout():
         html.H1('METHODS', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='methods-img', src='assets/top20_methods_grid.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('methods', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1051,7 +1141,7 @@ def page_stellar_objects_layout():
         html.H1('STELLAR OBJECTS', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
         html.H2('Grid plot showing frequency of reference over time.', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
-        html.Img(id='stellar-objects-img', src='assets/top20_stellar_objects.svg', style={'width': '80%', 'height': 'auto'}),
+        entity_trends_graph('stellar_objects', 20),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
 
@@ -1112,7 +1202,6 @@ def page_metrics_layout():
         html.Div(
             dcc.Graph(
                 id='citations-downloads-scatter',
-                figure=fig_4,
                 style={
                     'width': '80%',      # Controls the container size of the graph
                     'height': 'auto', 
@@ -1259,22 +1348,8 @@ def page_arXiv_layout():
             }
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        # Center the images
-        html.Img(id='metrics-vs-arXiv-class-img', src='assets/metrics_vs_arXiv_classification.svg', style={
-            'width': '80%', 
-            'height': 'auto', 
-            'margin': '0 auto', 
-            'display': 'block', 
-            'marginBottom': '20px'
-        }),
-        
-        html.Img(id='metrics-vs-arXiv_cat', src='assets/metrics_vs_arXiv_category.svg', style={
-            'width': '80%', 
-            'height': 'auto', 
-            'margin': '0 auto',  # Centers image horizontally
-            'display': 'block',  # Centers image within its block
-            'marginBottom': '20px'
-        }),
+        dcc.Graph(id='metrics-vs-arXiv-class-fig', style={'width': '80%', 'margin': '0 auto', 'marginBottom': '20px'}),
+        dcc.Graph(id='metrics-vs-arXiv-category-fig', style={'width': '80%', 'margin': '0 auto', 'marginBottom': '20px'}),
 # PLOT 2
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.H1('2.', style={
@@ -1311,7 +1386,7 @@ def page_arXiv_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            dcc.Graph(id='titles-arXiv-fig', figure=fig_3, style={'width': '40%', 'height': 'auto'}),
+            dcc.Graph(id='titles-arXiv-fig', style={'width': '40%', 'height': 'auto'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
@@ -1481,7 +1556,7 @@ def page_research_focus_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            dcc.Graph(id='theoretical-experimental-papers-fig', figure=fig_5, style={'width': '80%', 'height': 'auto'}),
+            dcc.Graph(id='theoretical-experimental-papers-fig', style={'width': '80%', 'height': 'auto'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
 
@@ -1521,7 +1596,7 @@ def page_research_focus_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            dcc.Graph(id='theoretical-experimental-citations-fig', figure=fig_7, style={'width': '80%', 'height': 'auto'}),
+            dcc.Graph(id='theoretical-experimental-citations-fig', style={'width': '80%', 'height': 'auto'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
 # PLOT 3
@@ -1560,7 +1635,7 @@ def page_research_focus_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            dcc.Graph(id='citations-research-focus-fig', figure=fig_6, style={'width': '80%', 'height': 'auto'}),
+            dcc.Graph(id='citations-research-focus-fig', style={'width': '80%', 'height': 'auto'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
 
@@ -2295,9 +2370,10 @@ def page_citation_network_layout():
         }),
         
         html.P(
-            'Citation network for papers with "dark matter" as keyword. Nodes are papers, links citations. Colors are given by arXiv classification, node size by number of citations. '
-            'Navigate by click and drag, select any paper by clicking to view its connections, arXiv classification, year of publication, metric data, et.c. Most papers reference papers '
-            'from their own arXiv classification, implying a low grade of interdisciplinarity.',
+            'Citation network for papers with "dark matter" as keyword. Nodes are papers, links citations between papers of the dataset. Colors are given by arXiv '
+            'category, node size by number of citations. The network shows the neighbourhood of one paper: its references and citing papers, ring by ring, '
+            'keeping the papers with the highest PageRank when a ring gets crowded. Search for a paper by title or bibcode, or click any node to move there. '
+            'Most papers reference papers from their own arXiv classification, implying a low grade of interdisciplinarity.',
             style={
                 'fontFamily': 'DejaVu Sans Mono',
                 'color': dark_theme['text'], 
@@ -2311,20 +2387,19 @@ def page_citation_network_layout():
             }
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        # Embed the HTML file in an Iframe
+        html.Div([
+            dcc.Dropdown(id='citation-graph-center', value=citation_graph_start, clearable=False,
+                         placeholder='Search papers...', style={'fontFamily': 'DejaVu Sans Mono', 'fontSize': '12px', 'marginBottom': '12px'}),
+            html.Label('Hops', style={'fontFamily': 'DejaVu Sans Mono', 'fontSize': '12px', 'color': dark_theme['text']}),
+            dcc.Slider(id='citation-graph-hops', min=1, max=citation_graph.MAX_HOPS, step=1, value=citation_graph.DEFAULT_HOPS,
+                       marks={hops: str(hops) for hops in range(1, citation_graph.MAX_HOPS + 1)}),
+            html.Label('Papers', style={'fontFamily': 'DejaVu Sans Mono', 'fontSize': '12px', 'color': dark_theme['text']}),
+            dcc.Slider(id='citation-graph-nodes', min=50, max=500, step=50, value=CITATION_GRAPH_NODES,
+                       marks={nodes: str(nodes) for nodes in (50, 100, 200, 300, 400, 500)}),
+        ], style={'width': '80%', 'margin': '0 auto'}),
         html.Div(
-            html.Iframe(
-                src="assets/network4/index.html",  # Load from assets directory
-                style={
-                    "width": "1000px",   # Adjust as needed
-                    "height": "750px", # Match the network height
-                    "border": "none",
-                    "display": "block",
-                    "margin": "0 auto",
-                    "fontFamily": "DejaVu Sans Mono",
-                }
-            ),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the Iframe
+            dcc.Graph(id='citation-graph'),
+            style={'display': 'flex', 'justifyContent': 'center'}
         ),
 
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
@@ -2349,46 +2424,41 @@ def page_matrix_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            html.Img(id='co_occurrence_dm_models_and_theories', src='assets/co_occurrence_dm_models_and_theories.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
+            dcc.RangeSlider(
+                id='co-occurrence-years',
+                min=co_occurrence_years[0], max=co_occurrence_years[1], step=1,
+                value=list(co_occurrence_years),
+                marks={year: str(year) for year in range(co_occurrence_years[0], co_occurrence_years[1] + 1) if year % 10 == 0},
+                tooltip={'placement': 'bottom'}
+            ),
+            style={'width': '80%', 'margin': '0 auto'}
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_particles', src='assets/co_occurrence_dm_models_and_particles.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('theory'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_detectors', src='assets/co_occurrence_dm_models_and_detectors.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('particles'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_colliders', src='assets/co_occurrence_dm_models_and_colliders.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('detectors'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_telescopes', src='assets/co_occurrence_dm_models_and_telescopes.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('colliders'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_inferences', src='assets/co_occurrence_dm_models_and_inferences.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('telescopes'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_methods', src='assets/co_occurrence_dm_models_and_methods.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('inferences'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
-        html.Div(
-            html.Img(id='co_occurrence_dm_models_and_gravity', src='assets/co_occurrence_dm_models_and_gravity.svg', style={'width': '80%', 'height': 'auto'}),
-            style={'display': 'flex', 'justifyContent': 'center'}  # Center the image
-        ),
+        co_occurrence_graph('methods'),
+        html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
+        co_occurrence_graph('gravity'),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
     ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
+
+def co_occurrence_graph(column):
+    # dm_models x `column` heatmap, filled by update_co_occurrence
+    return html.Div(
+        dcc.Graph(id={'type': 'co-occurrence', 'column': column}),
+        style={'display': 'flex', 'justifyContent': 'center'}
+    )
+
 def page_papers_layout():
     return html.Div([
         html.H1('History of Dark Matter Publishing', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
@@ -2409,7 +2479,7 @@ def page_papers_layout():
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
         html.Div(
-            dcc.Graph(id='all-papers-img', figure=fig_X, style={'width': '80%', 'height': 'auto'}),
+            dcc.Graph(id='all-papers-img', style={'width': '80%', 'height': 'auto'}),
             style={'display': 'flex', 'justifyContent': 'center'}
         ),
         html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '80%', 'margin': '10px auto', 'opacity': '0.5'}),
@@ -2432,67 +2502,122 @@ app.layout = html.Div(id='main-div', style={'fontFamily': 'DejaVu Sans Mono', 'b
 def update_url_from_dropdown(selected_page):
     return selected_page
 
+def page_search_layout():
+    return html.Div([
+        html.H1('SEARCH', style={'fontFamily': 'DejaVu Sans Mono', 'fontWeight': '400', 'color': dark_theme['text'], 'textAlign': 'left', 'marginLeft': '10%'}),
+        html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '40%', 'margin': '10px 0', 'opacity': '0.5', 'marginLeft': '10%'}),
+        dcc.Input(
+            id='search-query',
+            type='search',
+            debounce=True,
+            placeholder='Search titles, abstracts and keywords',
+            style={'width': '80%', 'marginLeft': '10%', 'padding': '8px', 'fontFamily': 'DejaVu Sans Mono',
+                   'color': dark_theme['text'], 'backgroundColor': dark_theme['background'], 'border': '1px solid #E09351FF'}
+        ),
+        html.Div(id='search-results', style={'width': '80%', 'marginLeft': '10%', 'marginTop': '20px'}),
+        html.Hr(style={'border': '0.5px solid #E09351FF', 'width': '70%', 'margin': '10px auto', 'opacity': '0.5'}),
+    ], style={'marginLeft': '18%', 'padding': '20px', 'backgroundColor': dark_theme['background']})
+
+def page_not_found_layout():
+    return html.Div([
+        html.H1("404 - Page Not Found", style={'textAlign': 'center', 'color': 'red'}),
+        html.P("The page you are looking for does not exist.", style={'textAlign': 'center'}),
+    ])
+
+# Page routes: pathname -> layout factory
+ROUTES = {
+    '/dmm': page_dmm_layout,
+    '/papers': page_papers_layout,
+    '/particles': page_particles_layout,
+    '/gravity': page_gravity_layout,
+    '/theories': page_theories_layout,
+    '/telescopes': page_telescopes_layout,
+    '/detectors': page_detectors_layout,
+    '/colliders': page_colliders_layout,
+    '/inferences': page_inferences_layout,
+    '/methods': page_methods_layout,
+    '/stellar_objects': page_stellar_objects_layout,
+    '/mass_range': page_mass_range_layout,
+    '/metrics': page_metrics_layout,
+    '/authors': page_authors_layout,
+    '/arXiv': page_arXiv_layout,
+    '/keywords': page_keywords_layout,
+    '/research_focus': page_research_focus_layout,
+    '/co_occurrence': page_co_occurrence_layout,
+    '/about': page_about_layout,
+    '/citation_network': page_citation_network_layout,
+    '/matrix': page_matrix_layout,
+    '/search': page_search_layout,
+}
+
+# Built layouts, already converted to plain JSON-ready dicts, so navigating only
+# costs a lookup and a fast encode of the cached payload. The aggregate tables
+# are only loaded at import, so layouts never go stale within a process: a new
+# dataset version (e.g. after refresh.py) takes a restart to be served.
+_layout_cache = {}
+
+def cached_layout(pathname):
+    # Unknown paths share one cache entry so arbitrary URLs cannot grow the cache
+    key = pathname if pathname in ROUTES else None
+    if key not in _layout_cache:
+        layout = ROUTES.get(key, page_not_found_layout)()
+        _layout_cache[key] = json.loads(to_json_plotly(layout))
+    return _layout_cache[key]
+
 # Callback to display the appropriate page content
 @app.callback(
     Output('page-content', 'children'),
     [Input('url', 'pathname')]
 )
 def display_page(pathname):
-    if pathname == '/dmm':
-        return page_dmm_layout()
-    elif pathname == '/papers':
-        return page_papers_layout()
-    elif pathname == '/particles':
-        return page_particles_layout()
-    elif pathname == '/gravity':
-        return page_gravity_layout()
-    elif pathname == '/theories':
-        return page_theories_layout()
-    elif pathname == '/telescopes':
-        return page_telescopes_layout()
-    elif pathname == '/detectors':
-        return page_detectors_layout()
-    elif pathname == '/colliders':
-        return page_colliders_layout()
-    elif pathname == '/inferences':
-        return page_inferences_layout()
-    elif pathname == '/methods':
-        return page_methods_layout()
-    elif pathname == '/stellar_objects':
-        return page_stellar_objects_layout()
-    elif pathname == '/mass_range':
-        return page_mass_range_layout()
-    elif pathname == '/metrics':
-        return page_metrics_layout()
-    elif pathname == '/authors':
-        return page_authors_layout()
-    elif pathname == '/arXiv':
-        return page_arXiv_layout()
-    elif pathname == '/keywords':
-        return page_keywords_layout()
-    elif pathname == '/research_focus':
-        return page_research_focus_layout()
-    elif pathname == '/co_occurrence':
-        return page_co_occurrence_layout()
-    elif pathname == '/about':
-        return page_about_layout()
-    elif pathname == '/citation_network':
-        return page_citation_network_layout()
-    elif pathname == '/matrix':
-        return page_matrix_layout()
-    else:
-        return html.Div([
-            html.H1("404 - Page Not Found", style={'textAlign': 'center', 'color': 'red'}),
-            html.P("The page you are looking for does not exist.", style={'textAlign': 'center'}),
-        ])
+    return cached_layout(pathname)
 
-# Updated callback to only return the sunburst plot
+# Global filters: the store holds only the non-default parts, and stays empty
+# when nothing is filtered so the graphs keep using the static figures
+@app.callback(
+    Output('figure-filters', 'data'),
+    Output('filter-summary', 'children'),
+    Input('filter-years', 'value'),
+    Input('filter-categories', 'value'),
+    Input('filter-focus', 'value')
+)
+def update_filters(years, categories, focus):
+    filters = {}
+    if years and list(years) != [filter_index.first_year, filter_index.last_year]:
+        filters['years'] = years
+    if categories:
+        filters['categories'] = sorted(categories)
+    if focus:
+        filters['focus'] = sorted(focus)
+    papers, citations = filter_index.totals(filters)
+    return filters or None, f'{papers:,} papers, {citations:,} citations'
+
+# Search results, ranked by the FTS5 index (see search_index.py)
 @app.callback(
-    Output('sunburst-dm-models', 'figure'),  # Only Sunburst output
-    Input('url', 'pathname')
+    Output('search-results', 'children'),
+    Input('search-query', 'value')
 )
-def update_plots(pathname):
-    # Sunburst plot (static)
+def update_search_results(query):
+    if search_db is None:
+        return html.P(search_index.UNAVAILABLE.capitalize() + '.',
+                      style={'fontFamily': 'DejaVu Sans Mono', 'color': dark_theme['text']})
+    results = search_index.search(search_db, query or '', limit=50)
+    if query and not results:
+        return html.P('No papers found.', style={'fontFamily': 'DejaVu Sans Mono', 'color': dark_theme['text']})
+    return [
+        html.Div([
+            html.A(result['title'], href=f"https://ui.adsabs.harvard.edu/abs/{result['bibcode']}/abstract", target='_blank',
+                   style={'fontFamily': 'DejaVu Sans Mono', 'color': '#E09351'}),
+            html.P(f"{result['year']} | {result['citations']} citations | {result['arxiv_class'] or 'No class'}",
+                   style={'fontFamily': 'DejaVu Sans Mono', 'fontSize': '12px', 'color': dark_theme['text'], 'margin': '4px 0 16px 0'}),
+        ])
+        for result in results
+    ]
+
+# DMM sunburst (static): built once and served from the figure cache. The
+# binding is keyed on the graph itself, so it only fires when the /dmm layout
+# mounts 'sunburst-dm-models' instead of on every navigation
+def dmm_sunburst_figure():
     fig_sunburst = px.sunburst(
         paper_counts, path=['dm_category', 'dm_models'], values='paper_count',
         color_discrete_sequence=spektrum_2
@@ -2503,9 +2628,243 @@ def update_plots(pathname):
         paper_bgcolor=dark_theme['background'],
         margin=dict(t=50, l=25, r=25, b=25)
     )
-
     return fig_sunburst
 
+figure_cache.register_lazy('fig_sunburst', dmm_sunburst_figure)
+figure_cache.bind(app, 'sunburst-dm-models', 'fig_sunburst')
+
+@lru_cache(maxsize=64)
+def entity_trends_figure(category, top):
+    terms = entity_trends.trends(entity_index, category, None if top == 'all' else top)['terms']
+    years = entity_index[category]['years']
+    columns = 4
+    rows = max(1, -(-len(terms) // columns))
+    fig = make_subplots(
+        rows=rows, cols=columns, subplot_titles=[term['term'] for term in terms],
+        shared_xaxes=True, horizontal_spacing=0.05, vertical_spacing=0.3 / rows
+    )
+    for i, term in enumerate(terms):
+        fig.add_trace(go.Bar(
+            x=years, y=term['counts'], marker_color='#E09351',
+            hovertemplate='%{x}: %{y} papers<extra>' + term['term'] + '</extra>'
+        ), row=i // columns + 1, col=i % columns + 1)
+
+    fig.update_layout(
+        font=dict(family="DejaVu Sans Mono", size=10, color=dark_theme['text']),
+        plot_bgcolor=dark_theme['background'],
+        paper_bgcolor=dark_theme['background'],
+        width=1000,
+        height=160 * rows + 80,
+        margin=dict(t=40, l=40, r=20, b=40),
+        bargap=0.1,
+        showlegend=False
+    )
+    fig.update_annotations(font=dict(size=11, color=dark_theme['text']))
+    fig.update_xaxes(gridcolor='rgba(255, 255, 255, 0.2)', linecolor='rgba(255, 255, 255, 0.5)')
+    fig.update_yaxes(gridcolor='rgba(255, 255, 255, 0.2)', linecolor='rgba(255, 255, 255, 0.5)')
+    return fig
+
+# Entity pages: each small-multiples graph is built from the trend index the
+# first time it is requested
+@app.callback(
+    Output({'type': 'entity-trends', 'category': MATCH, 'top': MATCH}, 'figure'),
+    Input({'type': 'entity-trends', 'category': MATCH, 'top': MATCH}, 'id')
+)
+def update_entity_trends(graph_id):
+    # The id comes from the client: only the graphs of the entity pages are built
+    category, top = graph_id.get('category'), graph_id.get('top')
+    if not isinstance(category, str) or category not in entity_index or top not in ENTITY_TRENDS_TOPS:
+        raise dash.exceptions.PreventUpdate
+    return entity_trends_figure(category, top)
+
+CO_OCCURRENCE_TOP = 30  # terms per heatmap axis
+
+@lru_cache(maxsize=256)
+def co_occurrence_figure(column, start, end):
+    rows, columns, counts = co_occurrence_index.table('dm_models', column, (start, end), CO_OCCURRENCE_TOP)
+    fig = go.Figure(go.Heatmap(
+        z=counts, x=columns, y=rows,
+        colorscale=[[0, dark_theme['background']], [1, '#E09351']],
+        hovertemplate='%{y} & %{x}: %{z} papers<extra></extra>'
+    ))
+    fig.update_layout(
+        title=f'Dark matter models & {column.replace("_", " ")} ({start}-{end})',
+        font=dict(family="DejaVu Sans Mono", size=10, color=dark_theme['text']),
+        plot_bgcolor=dark_theme['background'],
+        paper_bgcolor=dark_theme['background'],
+        width=1000,
+        height=max(400, 22 * len(rows) + 200),
+        xaxis=dict(tickangle=-45, showgrid=False),
+        yaxis=dict(autorange='reversed', showgrid=False),
+        hoverlabel=dict(bgcolor='#333333', font_size=12, font_family="DejaVu Sans Mono", font_color='#FFF8E8')
+    )
+    return fig
+
+# Co-occurrence heatmaps: recomputed from the sparse index for the selected
+# year range
+@app.callback(
+    Output({'type': 'co-occurrence', 'column': MATCH}, 'figure'),
+    Input({'type': 'co-occurrence', 'column': MATCH}, 'id'),
+    Input('co-occurrence-years', 'value')
+)
+def update_co_occurrence(graph_id, years):
+    column = graph_id.get('column')
+    if not isinstance(column, str) or column not in co_occurrence_index.incidence:
+        raise dash.exceptions.PreventUpdate
+    first, last = co_occurrence_years
+    start, end = years if isinstance(years, (list, tuple)) and len(years) == 2 else co_occurrence_years
+    # Bounded to the indexed years like the slider, so the figure cache only
+    # ever holds ranges the layout can produce
+    start, end = sorted([citation_graph.clamp(start, first, first, last), citation_graph.clamp(end, last, first, last)])
+    return co_occurrence_figure(column, start, end)
+
+def citation_graph_option(bibcode):
+    node = citation_index.find(bibcode)
+    title = citation_index.title(node) or bibcode
+    return {'label': f'{title[:90]} ({citation_index.years[node]})', 'value': bibcode}
+
+# Paper picker of the citation network: the current paper plus the full-text
+# search results for what is being typed
+@app.callback(
+    Output('citation-graph-center', 'options'),
+    Input('citation-graph-center', 'search_value'),
+    Input('citation-graph-center', 'value')
+)
+def update_citation_graph_options(search_value, bibcode):
+    options = [citation_graph_option(bibcode)] if citation_index.find(bibcode) is not None else []
+    if search_value:
+        if citation_index.find(search_value.strip()) is not None:
+            options.append(citation_graph_option(search_value.strip()))
+        for result in search_index.search(search_db, search_value, limit=20) if search_db else []:
+            if citation_index.find(result['bibcode']) is not None:
+                options.append(citation_graph_option(result['bibcode']))
+    return list({option['value']: option for option in options}.values())
+
+# Clicking a node re-centres the network on it
+@app.callback(
+    Output('citation-graph-center', 'value'),
+    Input('citation-graph', 'clickData'),
+    prevent_initial_call=True
+)
+def recenter_citation_graph(click_data):
+    point = (click_data or {}).get('points', [{}])[0]
+    if point.get('customdata') is None:
+        raise dash.exceptions.PreventUpdate
+    return point['customdata'][0]
+
+@lru_cache(maxsize=128)
+def citation_graph_figure(bibcode, hops, max_nodes):
+    # Radial layout: the selected paper in the middle, hop h on the circle of
+    # radius h, each ring ordered by community and then PageRank so that
+    # communities stay together
+    subgraph = citation_index.subgraph(citation_index.find(bibcode), hops, max_nodes)
+    nodes = pd.DataFrame(subgraph['nodes'])
+    nodes['x'], nodes['y'] = 0.0, 0.0
+    for hop, ring in nodes[nodes['hop'] > 0].groupby('hop'):
+        ring = ring.sort_values(['community', 'pagerank'], ascending=[True, False])
+        angles = np.linspace(0, 2 * np.pi, len(ring), endpoint=False)
+        nodes.loc[ring.index, 'x'] = hop * np.cos(angles)
+        nodes.loc[ring.index, 'y'] = hop * np.sin(angles)
+
+    edges = np.asarray(subgraph['edges'], dtype=np.int64).reshape(-1, 2)
+    edge_x = np.column_stack([nodes['x'].to_numpy()[edges[:, 0]], nodes['x'].to_numpy()[edges[:, 1]], np.full(len(edges), None)]).ravel()
+    edge_y = np.column_stack([nodes['y'].to_numpy()[edges[:, 0]], nodes['y'].to_numpy()[edges[:, 1]], np.full(len(edges), None)]).ravel()
+    fig = go.Figure(go.Scattergl(x=edge_x, y=edge_y, mode='lines', line=dict(width=0.5, color='#555555'),
+                                 hoverinfo='skip', showlegend=False))
+
+    nodes['category'] = nodes['arxiv_category'].str.split(', ').str[0]
+    colors = dict(zip(sorted(nodes['category'].unique()), itertools.cycle(px.colors.qualitative.Pastel)))
+    for category, group in nodes.groupby('category'):
+        fig.add_trace(go.Scattergl(
+            x=group['x'], y=group['y'], mode='markers', name=category,
+            marker=dict(size=6 + 3 * np.log1p(group['citations']), color=colors[category],
+                        line=dict(width=[2 if hop == 0 else 0 for hop in group['hop']], color='#FFF8E8')),
+            customdata=group[['bibcode', 'title', 'year', 'citations', 'pagerank', 'in_degree', 'out_degree', 'community']].to_numpy(),
+            hovertemplate=('<b>%{customdata[1]}</b><br>%{customdata[0]} (%{customdata[2]})<br>Citations: %{customdata[3]}<br>'
+                           'PageRank: %{customdata[4]}x average<br>Cited by / cites in dataset: %{customdata[5]} / %{customdata[6]}<br>'
+                           'Community: %{customdata[7]}<extra>' + category + '</extra>'),
+        ))
+    fig.update_layout(
+        font=dict(family="DejaVu Sans Mono", size=10, color=dark_theme['text']),
+        plot_bgcolor=dark_theme['background'],
+        paper_bgcolor=dark_theme['background'],
+        width=1000,
+        height=800,
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False, scaleanchor='x'),
+        legend=dict(orientation='h', y=-0.02),
+        margin=dict(t=20, l=20, r=20, b=20),
+        hoverlabel=dict(bgcolor='#333333', font_size=12, font_family="DejaVu Sans Mono", font_color='#FFF8E8')
+    )
+    return fig
+
+@app.callback(
+    Output('citation-graph', 'figure'),
+    Input('citation-graph-center', 'value'),
+    Input('citation-graph-hops', 'value'),
+    Input('citation-graph-nodes', 'value')
+)
+def update_citation_graph(bibcode, hops, max_nodes):
+    if citation_index.find(bibcode) is None:
+        bibcode = citation_graph_start
+    # The sliders bound these in the browser only; clamp them like the API does
+    hops = citation_graph.clamp(hops, citation_graph.DEFAULT_HOPS, 1, citation_graph.MAX_HOPS)
+    max_nodes = citation_graph.clamp(max_nodes, CITATION_GRAPH_NODES, 1, citation_graph.MAX_NODES)
+    return citation_graph_figure(bibcode, hops, max_nodes)
+
+def citations_viewport(relayout_data):
+    # (x_range, y_range) in log10 units from a zoom/pan event, 'reset' when the
+    # axes were autoscaled and None for unrelated relayout events
+    if any(key.endswith('autorange') for key in relayout_data):
+        return 'reset'
+    x0, x1, y0, y1 = citations_index.bounds
+    x_range = (relayout_data.get('xaxis.range[0]', x0), relayout_data.get('xaxis.range[1]', x1))
+    y_range = (relayout_data.get('yaxis.range[0]', y0), relayout_data.get('yaxis.range[1]', y1))
+    if 'xaxis.range' in relayout_data:
+        x_range = relayout_data['xaxis.range']
+    if 'yaxis.range' in relayout_data:
+        y_range = relayout_data['yaxis.range']
+    # The event comes from the client; ignore it unless both ranges are two
+    # finite numbers
+    try:
+        (x_start, x_end), (y_start, y_end) = x_range, y_range
+        x_range, y_range = (float(x_start), float(x_end)), (float(y_start), float(y_end))
+    except (TypeError, ValueError):
+        return None
+    if not np.isfinite(x_range + y_range).all():
+        return None
+    if (x_range, y_range) == ((x0, x1), (y0, y1)):
+        return None
+    return x_range, y_range
+
+# Level of detail for the citations vs. downloads chart: swap in the papers
+# inside the visible viewport whenever the user zooms or pans
+@app.callback(
+    Output('citations-downloads-scatter', 'figure', allow_duplicate=True),
+    Input('citations-downloads-scatter', 'relayoutData'),
+    prevent_initial_call=True
+)
+def update_citations_downloads(relayout_data):
+    viewport = citations_viewport(relayout_data or {})
+    if viewport is None:
+        return dash.no_update
+    if viewport == 'reset':
+        return citations_overview_figure()
+    points, total = citations_index.query(*viewport, CITATIONS_POINT_BUDGET)
+    return citations_downloads_figure(points, viewport, total)
+
+
+# Build the static figures (see FIGURE_BUILD) and report the startup stages
+# when STARTUP_PROFILE is set, also served from /_startup
+startup_profile.init_app(server)
+with startup_profile.stage('load prebuilt figures'):
+    figure_cache.load(aggregates.figures_path(), FIGURES_KEY)
+if FIGURE_BUILD == 'eager':
+    figure_cache.warm()
+elif FIGURE_BUILD == 'background':
+    figure_cache.warm_in_background()
+startup_profile.summary('app loaded')
+
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8054))
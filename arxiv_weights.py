@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# arXiv relevance weighting (the R pivot pipeline on the about page, vectorized).
+#
+# ADS lists a paper's arXiv classes in order of significance, so the class at
+# rank r gets the relevance weight 1 / 2^(r-1). Here arxiv_class is exploded
+# once, the rank is the position inside each paper's list, and the category of
+# every class comes from a lookup table over the distinct classes instead of a
+# regex per row. `share` normalizes the weights per paper, so relevance-weighted
+# counts still add up to the number of papers.
+
+import numpy as np
+import pandas as pd
+
+# Class prefix -> arxiv_category, first match wins (same order as the R case_when)
+ARXIV_CATEGORIES = [
+    ('astro', 'astrophysics'),
+    ('cond-mat', 'condensed matter'),
+    ('hep-', 'high-energy physics'),
+    ('math', 'mathematics'),
+    ('cs', 'computer science'),
+    ('quant-ph', 'quantum physics'),
+    ('gr-qc', 'general relativity and quantum cosmology'),
+    ('nucl-', 'nuclear physics'),
+    ('physics', 'physics'),
+    ('q-bio', 'quantitative biology'),
+    ('q-fin', 'quantitative finance'),
+    ('stat', 'statistics'),
+    ('econ', 'economics'),
+    ('eess', 'electrical engineering and systems science'),
+    ('nlin', 'nonlinear sciences'),
+]
+OTHER = 'Other'
+NO_CLASS = 'No class'
+
+
+def category(arxiv_class):
+    for prefix, name in ARXIV_CATEGORIES:
+        if arxiv_class.startswith(prefix):
+            return name
+    return OTHER
+
+
+def categories(arxiv_classes):
+    # Vectorized `category`: one prefix scan per distinct class
+    codes, uniques = pd.factorize(np.asarray(arxiv_classes, dtype=object))
+    lookup = np.array([category(arxiv_class) for arxiv_class in uniques] + [None], dtype=object)
+    return lookup[codes]
+
+
+def relevance_weight(rank):
+    return 0.5 ** (np.asarray(rank) - 1)
+
+
+def ranked_classes(arxiv_class):
+    # One row per (paper, arxiv_class): paper is the position in `arxiv_class`
+    # (a series of lists), rank starts at 1, weight = 1 / 2^(rank-1) and share
+    # the weight divided by the paper's total weight
+    exploded = pd.Series(np.asarray(arxiv_class, dtype=object)).explode().dropna()
+    paper = exploded.index.to_numpy()
+    # Rows of a paper are contiguous after explode, so the rank is the offset
+    # from the paper's first row
+    starts = np.r_[0, np.flatnonzero(np.diff(paper)) + 1]
+    first_row = np.repeat(starts, np.diff(np.r_[starts, len(paper)]))
+    rank = np.arange(len(paper)) - first_row + 1
+    weight = relevance_weight(rank)
+    total = np.bincount(paper, weights=weight, minlength=len(arxiv_class))
+    classes = exploded.to_numpy(dtype=object)
+    return pd.DataFrame({
+        'paper': paper,
+        'rank': rank,
+        'arxiv_class': pd.Categorical(classes),
+        'arxiv_category': pd.Categorical(categories(classes)),
+        'weight': weight,
+        'share': weight / total[paper],
+    })
+
+
+def category_shares(ranked, papers):
+    # (paper, arxiv_category, share) of the given papers, with the shares of
+    # classes in the same category summed; papers without any class get
+    # NO_CLASS with share 1
+    ranked = ranked[ranked['paper'].isin(papers)]
+    shares = ranked.groupby(['paper', 'arxiv_category'], observed=True)['share'].sum().reset_index()
+    shares['arxiv_category'] = shares['arxiv_category'].astype(object)
+    missing = np.setdiff1d(papers, shares['paper'].to_numpy())
+    unclassified = pd.DataFrame({'paper': missing, 'arxiv_category': NO_CLASS, 'share': 1.0})
+    return pd.concat([shares, unclassified], ignore_index=True).sort_values('paper', kind='stable')
+
+
+def weighted_metrics(ranked, values, by):
+    # Relevance-weighted paper counts and metric sums per `by` (arxiv_class or
+    # arxiv_category); `values` is a frame of per-paper metrics
+    weighted = values.to_numpy(dtype=np.float64)[ranked['paper'].to_numpy()] * ranked[['share']].to_numpy()
+    table = pd.DataFrame(weighted, columns=values.columns).fillna(0)
+    table.insert(0, 'papers', ranked['share'].to_numpy())
+    table.insert(0, by, ranked[by].astype(object).to_numpy())
+    return table.groupby(by).sum().sort_values('papers', ascending=False).reset_index()
+
+
+def patch_metrics(table, removed, added, by):
+    # weighted_metrics table less the one of the `removed` papers and plus the
+    # one of `added`; classes left without papers are dropped
+    sums = table.set_index(by).sub(removed.set_index(by), fill_value=0).add(added.set_index(by), fill_value=0)
+    sums = sums[sums['papers'].round(9) > 0]
+    return sums.sort_values('papers', ascending=False).reset_index()
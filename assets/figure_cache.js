@@ -0,0 +1,19 @@
+/* Loads pre-serialized figures from /_figures/ (see figure_cache.py).
+   'no-cache' makes the browser revalidate its copy with the ETag, so an
+   unchanged figure comes back as an empty 304. Non-empty filters are sent
+   as ?filters=<json> and answered with a filtered variant of the figure. */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    figure_cache: {
+        load: function(url, filters) {
+            if (filters) {
+                url += '?filters=' + encodeURIComponent(JSON.stringify(filters));
+            }
+            return fetch(url, {cache: 'no-cache'}).then(function(response) {
+                if (!response.ok) {
+                    throw new Error('Could not load figure ' + url + ': ' + response.status);
+                }
+                return response.json();
+            });
+        }
+    }
+});
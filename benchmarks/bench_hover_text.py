@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark for the fig_X hover-text pipeline (aggregates.publications_tables).
+#
+# Times the Arrow-side arxiv_category join, prepare() and publications_tables()
+# on synthetic corpora of increasing size and reports the cost per 1k papers,
+# which should stay flat if the pipeline scales linearly.
+#
+# Usage:
+#   python benchmarks/bench_hover_text.py [N_PAPERS ...]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aggregates  # noqa: E402
+import columnar_store  # noqa: E402
+import synthetic  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 44_000, 177_000, 708_000]
+REPEATS = 3
+
+
+def best_of(function, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run(n_papers, tmp_dir):
+    path = synthetic.write_skeleton(n_papers, os.path.join(tmp_dir, f'skeleton-{n_papers}.parquet'))
+
+    def load():
+        return columnar_store.read_columns(path, aggregates.FIG_X_COLUMNS + [c for c, _ in aggregates.RESEARCH_FOCUS],
+                                           join_lists=aggregates.ARXIV_CATEGORY_JOIN)
+
+    load_time, df = best_of(load)
+    prepare_time, df = best_of(lambda: aggregates.prepare(df.copy()))
+    tables_time, _ = best_of(lambda: aggregates.publications_tables(df))
+    return {'papers': n_papers, 'load': load_time, 'prepare': prepare_time, 'publications_tables': tables_time}
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'papers':>9} {'load (s)':>9} {'prepare (s)':>12} {'tables (s)':>11} {'total (s)':>10} {'ms / 1k':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            result = run(size, tmp_dir)
+            total = result['load'] + result['prepare'] + result['publications_tables']
+            print(f"{size:>9} {result['load']:>9.3f} {result['prepare']:>12.3f} {result['publications_tables']:>11.3f} "
+                  f"{total:>10.3f} {1e6 * total / size:>8.3f}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# End-to-end benchmark suite on synthetic corpora (see synthetic.py).
+#
+# For every corpus size a fresh process gets its own data cache holding only
+# the synthetic skeleton, then times:
+#   - the loader: reading the skeleton columns from Parquet, writing the Arrow
+#     IPC copy and reading it back memory-mapped (columnar_store.py)
+#   - the aggregation blocks: prepare, arxiv_distribution (publications_tables),
+#     grouped_data, grouped_citation_data, the fig_7 grouping and the whole
+#     aggregates.build, then the search index build
+#   - importing app.py on the built tables
+#   - building each static figure and serializing it to JSON
+#   - display_page for every route through the Flask test client, cold (layout
+#     cache empty) and warm
+# Timings are the best of a few repeats (cold page renders run once). Results
+# go to benchmarks/results/<commit>.json, so runs on two commits can be
+# compared with --compare.
+#
+# Usage:
+#   python benchmarks/run.py                          # 10k, 177k and 1M papers
+#   python benchmarks/run.py 10000 --repeats 5
+#   python benchmarks/run.py --compare results/abc1234.json results/def5678.json
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [10_000, 177_000, 1_000_000]
+REPEATS = 3
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def best_of(function, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return round(min(timings), 6), result
+
+
+def _display_page(client, pathname):
+    response = client.post('/_dash-update-component', json={
+        'output': 'page-content.children',
+        'outputs': {'id': 'page-content', 'property': 'children'},
+        'inputs': [{'id': 'url', 'property': 'pathname', 'value': pathname}],
+        'changedPropIds': ['url.pathname'],
+    })
+    if response.status_code != 200:
+        raise RuntimeError(f'display_page({pathname!r}) answered {response.status_code}')
+    return len(response.data)
+
+
+def measure(n_papers, cache_dir, repeats):
+    # Runs in a fresh process with DATA_CACHE_DIR=cache_dir
+    import synthetic
+    import data_loader
+
+    timings = {}
+    start = time.perf_counter()
+    path = synthetic.write_skeleton(n_papers, os.path.join(cache_dir, 'synthetic.parquet'))
+    data_loader.add_file('skeleton', path, '.parquet', cache_dir)
+    timings['generate'] = round(time.perf_counter() - start, 6)
+
+    import aggregates
+    import columnar_store
+
+    def load(mapped):
+        return columnar_store.load_dataset('skeleton', columns=aggregates.SKELETON_COLUMNS,
+                                           join_lists=aggregates.ARXIV_CATEGORY_JOIN,
+                                           arrow_lists=aggregates.CITATION_LIST_COLUMNS, cache_dir=cache_dir,
+                                           mapped=mapped, join_copies=aggregates.DM_MODELS_JOIN)
+
+    timings['load_parquet'], _ = best_of(lambda: load(False), repeats)
+    start = time.perf_counter()
+    columnar_store.mapped_path('skeleton', cache_dir)
+    timings['write_arrow_ipc'] = round(time.perf_counter() - start, 6)
+    timings['load_mapped'], df = best_of(lambda: load(True), repeats)
+
+    timings['prepare'], prepared = best_of(lambda: aggregates.prepare(df.copy()), repeats)
+    import arxiv_weights
+    import numpy as np
+    ranked = arxiv_weights.ranked_classes(prepared['arxiv_class'])
+    shares = arxiv_weights.category_shares(ranked, np.arange(len(prepared)))
+    for name, function in [
+        ('arxiv_distribution', lambda: aggregates.publications_tables(prepared, shares)),
+        ('grouped_data', lambda: aggregates.dm_models_focus_table(prepared)),
+        ('grouped_citation_data', lambda: aggregates.citations_focus_table(prepared)),
+        ('fig_7_grouping', lambda: aggregates.theoretical_vs_experimental_citations_table(prepared)),
+    ]:
+        timings['aggregate_' + name], _ = best_of(function, repeats)
+    start = time.perf_counter()
+    aggregates.build_for_cached_skeleton(cache_dir=cache_dir)
+    timings['aggregates_build'] = round(time.perf_counter() - start, 6)
+    import search_index
+    start = time.perf_counter()
+    search_index.build_for_cached_skeleton(cache_dir)
+    timings['search_index_build'] = round(time.perf_counter() - start, 6)
+
+    # The app serves from the tables just built; figures are left to this script
+    os.environ['FIGURE_BUILD'] = 'lazy'
+    os.chdir(ROOT)
+    start = time.perf_counter()
+    import app
+    timings['import_app'] = round(time.perf_counter() - start, 6)
+
+    import figure_cache
+    import plotly.io as pio
+    figure_sizes = {}
+    for name in figure_cache.pending():
+        timings['figure_' + name], figure = best_of(figure_cache.builder(name), repeats)
+        timings['to_json_' + name], body = best_of(
+            lambda: pio.to_json(figure, validate=False, engine=figure_cache.JSON_ENGINE), repeats)
+        figure_sizes[name] = len(body)
+
+    client = app.server.test_client()
+    page_sizes = {}
+    for pathname in app.ROUTES:
+        app._layout_cache.clear()
+        start = time.perf_counter()
+        page_sizes[pathname] = _display_page(client, pathname)
+        timings['page_cold_' + pathname] = round(time.perf_counter() - start, 6)
+        timings['page_warm_' + pathname], _ = best_of(lambda: _display_page(client, pathname), repeats)
+
+    return {
+        'papers': n_papers,
+        'seconds': timings,
+        'figure_bytes': figure_sizes,
+        'page_bytes': page_sizes,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_size(n_papers, repeats):
+    # One subprocess per size, so every run starts cold and app.py is imported
+    # against its own cache
+    with tempfile.TemporaryDirectory(prefix='bench-cache-') as cache_dir:
+        env = dict(os.environ, DATA_CACHE_DIR=cache_dir)
+        env.pop('AGGREGATES_PATH', None)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker', str(n_papers), cache_dir, '--repeats',
+             str(repeats)],
+            env=env, check=True, stdout=subprocess.PIPE, text=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def commit():
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True).stdout.strip()
+    head = git('rev-parse', '--short', 'HEAD') or 'unknown'
+    return head + '-dirty' if git('status', '--porcelain', '--untracked-files=no') else head
+
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = {run['papers']: run for run in json.load(f)['runs']}
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{'papers':>9} {'stage':<36} {'old (s)':>9} {'new (s)':>9} {'ratio':>7}")
+    for run in new['runs']:
+        before = old.get(run['papers'])
+        if before is None:
+            continue
+        for stage, seconds in run['seconds'].items():
+            if stage in before['seconds']:
+                previous = before['seconds'][stage]
+                ratio = seconds / previous if previous else float('nan')
+                print(f"{run['papers']:>9} {stage:<36} {previous:>9.4f} {seconds:>9.4f} {ratio:>7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark loading, aggregation, figures and page renders.')
+    parser.add_argument('sizes', nargs='*', type=int, help='corpus sizes (default: 10k, 177k, 1M papers)')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='repeats per timing (best is kept)')
+    parser.add_argument('--output', default=None, help='results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two results files')
+    parser.add_argument('--worker', nargs=2, metavar=('PAPERS', 'CACHE_DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.worker:
+        print(json.dumps(measure(int(args.worker[0]), args.worker[1], args.repeats)))
+        return
+
+    results = {
+        'commit': commit(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'runs': [],
+    }
+    for size in args.sizes or DEFAULT_SIZES:
+        run = run_size(size, args.repeats)
+        results['runs'].append(run)
+        seconds = run['seconds']
+        print(f"{size:>9} papers: load {seconds['load_mapped']:.3f} s (Parquet {seconds['load_parquet']:.3f} s), "
+              f"aggregates {seconds['aggregates_build']:.3f} s, app import {seconds['import_app']:.3f} s, "
+              f"peak {run['peak_rss_mb']:.0f} MB", flush=True)
+
+    output = args.output or os.path.join(RESULTS_DIR, results['commit'] + '.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Synthetic corpus mimicking the skeleton schema, for offline benchmarks.
+#
+# Everything is generated column-wise (list columns are built straight from
+# offsets + values arrays), so even the 1M paper corpus only takes seconds.
+#
+# Usage:
+#   python benchmarks/synthetic.py 177000 synthetic.parquet
+
+import os
+import sys
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arxiv_weights  # noqa: E402
+import columnar_store  # noqa: E402
+
+ENTITY_TERMS = {
+    'theory': ['general relativity', 'mond', 'supersymmetry', 'string theory', 'inflation', 'quantum field theory',
+               'modified gravity', 'extra dimensions', 'grand unified theory', 'technicolor'],
+    'particles': ['neutrino', 'axion', 'photon', 'higgs boson', 'neutralino', 'gravitino', 'sterile neutrino',
+                  'positron', 'antiproton', 'dark photon', 'majoron', 'graviton'],
+    'gravity': ['gravitational lensing', 'rotation curve', 'black hole', 'gravitational wave', 'tidal stream',
+                'weak lensing', 'strong lensing', 'dynamical friction'],
+    'detectors': ['xenon1t', 'lux', 'cdms', 'pandax', 'lz', 'cresst', 'dama', 'icecube', 'super-kamiokande'],
+    'colliders': ['lhc', 'tevatron', 'lep', 'hera', 'belle', 'babar'],
+    'dm_models': ['weakly interacting massive particle', 'axion', 'sterile neutrino', 'fuzzy dark matter',
+                  'primordial black hole', 'self-interacting dark matter', 'warm dark matter', 'cold dark matter',
+                  'neutralino', 'gravitino', 'dark photon', 'asymmetric dark matter', 'massive compact halo object'],
+    'telescopes': ['hubble', 'fermi-lat', 'planck', 'chandra', 'xmm-newton', 'wmap', 'hess', 'magic', 'veritas',
+                   'sdss', 'gaia', 'jwst'],
+    'stellar_objects': ['white dwarf', 'neutron star', 'dwarf galaxy', 'globular cluster', 'brown dwarf',
+                        'red giant', 'pulsar', 'magnetar'],
+    'methods': ['n-body simulation', 'monte carlo', 'bayesian inference', 'machine learning', 'markov chain monte carlo',
+                'hydrodynamical simulation', 'likelihood analysis'],
+    'inferences': ['rotation curve', 'cmb anisotropy', 'bullet cluster', 'big bang nucleosynthesis', 'baryon acoustic oscillation',
+                   'missing satellites', 'cusp-core problem'],
+}
+
+ARXIV_CLASSES = ['astro-ph', 'astro-ph.CO', 'astro-ph.GA', 'astro-ph.HE', 'hep-ph', 'hep-th', 'hep-ex', 'gr-qc',
+                 'nucl-th', 'nucl-ex', 'physics.ins-det', 'quant-ph', 'cond-mat.stat-mech', 'math-ph']
+
+# Share of papers mentioning at least one term of each entity type
+ENTITY_SHARE = 0.3
+ARXIV_SHARE = 0.85
+
+
+def _list_column(rng, n_papers, vocabulary, share, max_terms=3):
+    # Random list<string> column: `share` of the rows get 1..max_terms terms,
+    # the rest are null
+    present = rng.random(n_papers) < share
+    counts = np.where(present, rng.integers(1, max_terms + 1, n_papers), 0)
+    offsets = np.zeros(n_papers + 1, dtype=np.int32)
+    np.cumsum(counts, out=offsets[1:])
+    values = pa.array(np.asarray(vocabulary, dtype=object)[rng.integers(0, len(vocabulary), offsets[-1])], pa.string())
+    lists = pa.ListArray.from_arrays(pa.array(offsets), values)
+    return pc.if_else(pa.array(present), lists, pa.nulls(n_papers, lists.type))
+
+
+def make_skeleton(n_papers, seed=0):
+    rng = np.random.default_rng(seed)
+
+    # Publication counts grow roughly exponentially with time
+    years = np.arange(1933, 2025)
+    weights = np.exp((years - years[0]) / 12.0)
+    year = rng.choice(years, size=n_papers, p=weights / weights.sum()).astype(np.int16)
+    order = np.argsort(year, kind='stable')
+    year = year[order]
+
+    index = np.arange(n_papers)
+    bibcode = np.char.add(np.char.add(year.astype(str), 'Syn..'), np.char.zfill(index.astype(str), 9))
+    citations = (rng.zipf(1.9, n_papers) - 1).clip(0, 20000).astype(np.int32)
+    downloads = (citations * rng.uniform(0.5, 4.0, n_papers) + rng.integers(0, 60, n_papers)).astype(np.int32)
+    citations_normalized = (citations / rng.integers(1, 12, n_papers)).astype(np.float32)
+
+    columns = {
+        'bibcode': pa.array(bibcode, pa.string()),
+        'year': pa.array(year, pa.int16()),
+        'title': pa.array(np.char.add('Synthetic dark matter paper ', index.astype(str)), pa.string()),
+        'first_author': pa.array(np.char.add('Author ', rng.integers(0, max(n_papers // 6, 1), n_papers).astype(str)),
+                                 pa.string()).dictionary_encode(),
+        'citations': pa.array(citations),
+        'downloads': pa.array(downloads),
+        'citations_normalized': pa.array(citations_normalized),
+    }
+    for column, terms in ENTITY_TERMS.items():
+        columns[column] = _list_column(rng, n_papers, terms, ENTITY_SHARE)
+
+    arxiv_class = _list_column(rng, n_papers, ARXIV_CLASSES, ARXIV_SHARE)
+    columns['arxiv_class'] = arxiv_class
+    flat_category = arxiv_weights.categories(arxiv_class.values.to_numpy(zero_copy_only=False))
+    columns['arxiv_category'] = pa.ListArray.from_arrays(arxiv_class.offsets, pa.array(flat_category, pa.string()),
+                                                         mask=arxiv_class.is_null())
+
+    # Abstracts mention a handful of the entity terms
+    all_terms = sorted({term for terms in ENTITY_TERMS.values() for term in terms})
+    abstract_terms = _list_column(rng, n_papers, all_terms, 1.0, max_terms=6)
+    columns['abstract'] = pc.binary_join_element_wise(
+        'We study', pc.binary_join(abstract_terms, ' and '), 'in dark matter halos.', ' ')
+
+    # Citation lists point at random papers of the corpus, capped at 50 entries
+    n_citing = np.minimum(citations, 50)
+    offsets = np.zeros(n_papers + 1, dtype=np.int32)
+    np.cumsum(n_citing, out=offsets[1:])
+    citing = pa.array(rng.integers(0, n_papers, offsets[-1]))
+    # (pa.array may split a large numpy string array into chunks)
+    bibcodes = columns['bibcode']
+    if isinstance(bibcodes, pa.ChunkedArray):
+        bibcodes = bibcodes.combine_chunks()
+    columns['citation'] = pa.ListArray.from_arrays(pa.array(offsets), bibcodes.take(citing))
+
+    return pa.table(columns)
+
+
+def write_skeleton(n_papers, path, seed=0):
+    columnar_store.write_table(make_skeleton(n_papers, seed), path)
+    return path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit('usage: python benchmarks/synthetic.py N_PAPERS OUTPUT.parquet')
+    print(write_skeleton(int(sys.argv[1]), sys.argv[2]))
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Citation graph of the corpus with precomputed node metrics.
+#
+# The per-paper `citation` lists (bibcodes of the citing papers) are resolved
+# against the corpus once into a CSR adjacency matrix, edge citing -> cited,
+# so only citations between papers of the dataset are kept. PageRank, in/out
+# degree and community labels (label propagation on the undirected graph) are
+# computed at build time with the other aggregate tables. The citation network
+# page then asks for the neighbourhood of one paper: a breadth-first search of
+# k hops that keeps the highest-ranked neighbours until a node budget is
+# reached, served as compact column-oriented JSON from
+# /api/citation-graph/<bibcode>.
+#
+# Everything is kept in numpy and Arrow buffers rather than Python objects (the
+# bibcode lookup is a binary search over a sorted fixed-width array instead of
+# a dict), so the graph loaded once by a preloading server stays shared between
+# forked workers; see gunicorn.conf.py.
+
+import flask
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from scipy import sparse
+
+import columnar_store
+
+API_ROUTE = '/api/citation-graph/'
+DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-10
+PAGERANK_ITERATIONS = 100
+PROPAGATION_ITERATIONS = 20
+MAX_HOPS = 3
+MAX_NODES = 1000
+DEFAULT_HOPS = 2
+DEFAULT_NODES = 200
+
+
+def clamp(value, default, low, high):
+    # int(value) bounded to [low, high]; the default when it is missing or not
+    # a number (request arguments and callback inputs come from the client)
+    try:
+        value = int(value)
+    except (TypeError, ValueError, OverflowError):
+        value = default
+    return min(max(value, low), high)
+
+
+def adjacency(bibcodes, offsets, values):
+    # papers x papers CSR matrix with a 1 at (citing, cited); the citing papers
+    # of paper i are values[offsets[i]:offsets[i + 1]]
+    cited = np.repeat(np.arange(len(bibcodes)), np.diff(offsets))
+    citing = pd.Index(bibcodes).get_indexer(values.to_numpy(zero_copy_only=False))
+    inside = citing >= 0
+    matrix = sparse.csr_matrix(
+        (np.ones(inside.sum(), dtype=np.int8), (citing[inside], cited[inside])),
+        shape=(len(bibcodes), len(bibcodes)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return matrix
+
+
+def pagerank(matrix, damping=DAMPING, tolerance=PAGERANK_TOLERANCE, iterations=PAGERANK_ITERATIONS):
+    # Power iteration; the rank of papers without any reference in the corpus
+    # (dangling nodes) is spread evenly over all papers
+    n = matrix.shape[0]
+    out_degree = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    transition = sparse.diags(np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)) @ matrix
+    transition = transition.T.tocsr()
+    rank = np.full(n, 1.0 / n)
+    for _ in range(iterations):
+        previous = rank
+        rank = damping * (transition @ rank + rank[dangling].sum() / n) + (1 - damping) / n
+        if np.abs(rank - previous).sum() < tolerance:
+            break
+    return rank
+
+
+def label_propagation(matrix, iterations=PROPAGATION_ITERATIONS):
+    # Community labels: every paper repeatedly takes the most common label
+    # among itself and its neighbours (ties go to the smallest label), all
+    # papers at once, until nothing changes
+    n = matrix.shape[0]
+    undirected = ((matrix + matrix.T + sparse.identity(n, format='csr')) > 0).tocoo()
+    rows, cols = undirected.row, undirected.col
+    labels = np.arange(n)
+    for _ in range(iterations):
+        pairs = rows.astype(np.int64) * n + labels[cols]
+        keys, counts = np.unique(pairs, return_counts=True)
+        key_rows = keys // n
+        # Per row, the label with the highest count (keys are sorted by row,
+        # then label, so a stable sort on -count keeps the smallest label first)
+        order = np.lexsort((-counts, key_rows))
+        first = np.r_[True, key_rows[order][1:] != key_rows[order][:-1]]
+        new_labels = labels.copy()
+        new_labels[key_rows[order][first]] = (keys % n)[order][first]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    # Renumber by community size, 0 = largest
+    _, codes, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+    by_size = np.empty(len(sizes), dtype=np.int32)
+    by_size[np.argsort(-sizes, kind='stable')] = np.arange(len(sizes))
+    return by_size[codes]
+
+
+class CitationGraph:
+    def __init__(self, df):
+        self.bibcodes = pa.array(df['bibcode'].to_numpy(dtype=object), pa.string())
+        self.titles = pa.array(df['title'].to_numpy(dtype=object), pa.string(), from_pandas=True)
+        self.years = df['year'].to_numpy()
+        self.citations = df['citations'].fillna(0).to_numpy(dtype=np.int64)
+        self.arxiv_category = pa.array(df['arxiv_category'].astype(str).to_numpy(dtype=object),
+                                       pa.string()).dictionary_encode()
+        # Sorted UTF-8 bibcodes and their positions, for find()
+        keys = np.array([bibcode.encode() for bibcode in df['bibcode']], dtype=bytes)
+        self._order = np.argsort(keys, kind='stable').astype(np.int32)
+        self._sorted_bibcodes = keys[self._order]
+
+        self.out_edges = adjacency(df['bibcode'].to_numpy(dtype=object), *columnar_store.list_parts(df['citation']))
+        self.in_edges = self.out_edges.T.tocsr()
+        self.in_degree = np.diff(self.in_edges.indptr).astype(np.int32)
+        self.out_degree = np.diff(self.out_edges.indptr).astype(np.int32)
+        self.pagerank = pagerank(self.out_edges)
+        self.community = label_propagation(self.out_edges)
+
+    def find(self, bibcode):
+        # Position of a bibcode, or None
+        if not isinstance(bibcode, str):
+            return None
+        key = bibcode.encode()
+        i = np.searchsorted(self._sorted_bibcodes, key)
+        if i < len(self._sorted_bibcodes) and self._sorted_bibcodes[i] == key:
+            return int(self._order[i])
+        return None
+
+    def bibcode(self, node):
+        return self.bibcodes[node].as_py()
+
+    def title(self, node):
+        return self.titles[node].as_py()
+
+    def top(self, n):
+        # The n papers with the highest PageRank
+        return np.argsort(-self.pagerank, kind='stable')[:n]
+
+    def _neighbours(self, node):
+        return np.union1d(self.out_edges.indices[self.out_edges.indptr[node]:self.out_edges.indptr[node + 1]],
+                          self.in_edges.indices[self.in_edges.indptr[node]:self.in_edges.indptr[node + 1]])
+
+    def neighbourhood(self, node, hops=2, max_nodes=200):
+        # (nodes, hop distance of each node): breadth-first over citations in
+        # both directions; when a hop would exceed the budget only its
+        # highest-PageRank papers are kept
+        nodes, distances = [node], [0]
+        seen = {node}
+        frontier = np.array([node])
+        for hop in range(1, hops + 1):
+            if len(nodes) >= max_nodes or not len(frontier):
+                break
+            candidates = np.unique(np.concatenate([self._neighbours(n) for n in frontier]))
+            candidates = np.array([c for c in candidates if c not in seen], dtype=np.int64)
+            candidates = candidates[np.argsort(-self.pagerank[candidates], kind='stable')][:max_nodes - len(nodes)]
+            nodes.extend(candidates.tolist())
+            distances.extend([hop] * len(candidates))
+            seen.update(candidates.tolist())
+            frontier = candidates
+        return np.array(nodes), np.array(distances)
+
+    def subgraph(self, node, hops=2, max_nodes=200):
+        # JSON-ready neighbourhood: node attributes as parallel lists and edges
+        # as [citing, cited] positions in those lists
+        nodes, distances = self.neighbourhood(node, hops, max_nodes)
+        block = self.out_edges[nodes][:, nodes].tocoo()
+        return {
+            'center': self.bibcode(node),
+            'nodes': {
+                'bibcode': self.bibcodes.take(nodes).to_pylist(),
+                'title': self.titles.take(nodes).to_pylist(),
+                'year': self.years[nodes].tolist(),
+                'citations': self.citations[nodes].tolist(),
+                'arxiv_category': self.arxiv_category.take(nodes).to_pylist(),
+                # PageRank relative to the average paper
+                'pagerank': np.round(self.pagerank[nodes] * len(self.bibcodes), 4).tolist(),
+                'in_degree': self.in_degree[nodes].tolist(),
+                'out_degree': self.out_degree[nodes].tolist(),
+                'community': self.community[nodes].tolist(),
+                'hop': distances.tolist(),
+            },
+            'edges': np.column_stack([block.row, block.col]).tolist(),
+        }
+
+
+def build(df):
+    return CitationGraph(df)
+
+
+def init_app(server, graph):
+    def respond(bibcode):
+        node = graph.find(bibcode)
+        if node is None:
+            flask.abort(404)
+        args = flask.request.args
+        hops = clamp(args.get('hops'), DEFAULT_HOPS, 0, MAX_HOPS)
+        max_nodes = clamp(args.get('max_nodes'), DEFAULT_NODES, 1, MAX_NODES)
+        return flask.jsonify(graph.subgraph(node, hops, max_nodes))
+
+    server.add_url_rule(API_ROUTE + '<path:bibcode>', 'citation_graph', respond)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Streaming abstract cleaning and lemmatization (the step that produced
+# csv_data/prior_to_lemmatization.csv, see the about page).
+#
+# Abstracts are read from the Parquet store in fixed-size record batches and
+# cleaned by a process pool: HTML tags and entities are stripped, LaTeX markup
+# is reduced to its text (\Lambda -> lambda, {\rm CDM} -> cdm, $ and braces
+# dropped) while sub/superscripts and operators stay, text is lowercased,
+# acronyms are expanded to the canonical names of entities.py (wimp -> weakly
+# interacting massive particle) and stopwords are removed. Ambiguous acronyms
+# (entities.AMBIGUOUS_ACRONYMS: "SFD maps", "ADM mass") are only expanded in
+# abstracts that also spell out the model, as in "asymmetric dark matter (ADM)".
+# Plural nouns are then reduced to their singular as a light lemmatization.
+#
+# Every chunk is written to its own shard (clean-000000.parquet, ...) as soon as
+# it is done and only a few chunks are in flight at a time, so memory stays
+# bounded and an interrupted run skips the finished shards when restarted.
+#
+# Usage:
+#   python clean_abstracts.py clean/                       # the cached skeleton
+#   python clean_abstracts.py clean/ --source papers.parquet --workers 8
+
+import argparse
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import columnar_store
+import data_loader
+import entities
+
+CHUNK_SIZE = 5000  # abstracts per shard
+SETTINGS_NAME = 'pipeline.json'
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here hers herself
+him himself his how i if in into is it its itself just me more most my myself no nor not now of off on once only or
+other our ours ourselves out over own same she should so some such than that the their theirs them themselves then
+there these they this those through to too under until up very was we were what when where which while who whom why
+will with would you your yours yourself yourselves
+""".split())
+
+HTML_TAG = re.compile(r'<[^>]+>')
+# Formatting commands whose argument is kept as plain text
+LATEX_FORMAT = re.compile(r'\\(?:rm|it|bf|sf|tt|cal|mathrm|mathit|mathbf|mathcal|mathsf|text|textrm|textit|textbf|emph|'
+                          r'operatorname|left|right|big|Big|bigg|Bigg)\b')
+# Symbols that would otherwise lose their meaning
+LATEX_SYMBOLS = {
+    r'\sim': '~', r'\simeq': '~', r'\approx': '~', r'\lesssim': '<~', r'\gtrsim': '>~', r'\la': '<~', r'\ga': '>~',
+    r'\leq': '<=', r'\le': '<=', r'\geq': '>=', r'\ge': '>=', r'\times': 'x', r'\pm': '+/-', r'\propto': 'propto',
+    r'\odot': 'sun', r'\sun': 'sun', r'\infty': 'infinity', r'\%': '%', r'\&': '&',
+}
+LATEX_SYMBOL = re.compile('|'.join(re.escape(symbol) + r'(?![a-zA-Z])'
+                                   for symbol in sorted(LATEX_SYMBOLS, key=len, reverse=True)))
+# Any other command (\Lambda, \alpha, ...) keeps its name
+LATEX_COMMAND = re.compile(r'\\([a-zA-Z]+)')
+ACRONYM = re.compile(r'\b(?:' + '|'.join(re.escape(synonym) for synonym in
+                                          sorted(entities.SYNONYMS, key=len, reverse=True)) + r')\b')
+WHITESPACE = re.compile(r'\s+')
+WORD_EDGES = '.,;:!?"\'()[]'
+
+# Endings and words that look plural but are not (mass, virus, analysis, gas, physics, ...)
+SINGULAR_ENDINGS = ('ss', 'us', 'is', 'as', 'ics')
+SINGULAR_WORDS = frozenset(['species', 'series', 'lens', 'cosmos', 'chaos', 'always', 'perhaps', 'whereas', 'thus',
+                            'does', 'news'])
+
+
+def strip_markup(text):
+    # ~ is a non-breaking space in LaTeX; \sim becomes ~ below
+    text = HTML_TAG.sub(' ', html.unescape(text)).replace('~', ' ')
+    text = LATEX_SYMBOL.sub(lambda match: ' ' + LATEX_SYMBOLS[match.group(0)] + ' ', text)
+    text = LATEX_FORMAT.sub(' ', text)
+    text = LATEX_COMMAND.sub(r'\1', text)
+    return text.replace('$', ' ').replace('{', '').replace('}', '')
+
+
+def lemma(word):
+    # Regular noun plurals only: galaxies -> galaxy, halos -> halo, masses -> mass
+    if len(word) <= 3 or not word.isalpha() or word.endswith(SINGULAR_ENDINGS) or word in SINGULAR_WORDS:
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('sses', 'shes', 'ches', 'xes')):
+        return word[:-2]
+    if word.endswith('s'):
+        return word[:-1]
+    return word
+
+
+def expand_acronyms(text):
+    def expansion(match):
+        acronym = match.group(0)
+        canonical = entities.SYNONYMS[acronym]
+        if acronym in entities.AMBIGUOUS_ACRONYMS and canonical not in text:
+            return acronym
+        return canonical
+    return ACRONYM.sub(expansion, text)
+
+
+def clean(text):
+    # (cleaned text, lemmatized text) of one abstract
+    if not isinstance(text, str):
+        return None, None
+    text = expand_acronyms(strip_markup(text).lower())
+    words = [word for word in WHITESPACE.split(text) if word and word.strip(WORD_EDGES) not in STOPWORDS]
+    lemmas = []
+    for word in words:
+        core = word.strip(WORD_EDGES)
+        lemmas.append(word.replace(core, lemma(core), 1) if core else word)
+    return ' '.join(words), ' '.join(lemmas)
+
+
+def clean_chunk(bibcodes, abstracts):
+    cleaned = [clean(abstract) for abstract in abstracts]
+    return pa.table({
+        'bibcode': pa.array(bibcodes, pa.string()),
+        'abstract_clean': pa.array([text for text, _ in cleaned], pa.string()),
+        'abstract_lemmatized': pa.array([lemmas for _, lemmas in cleaned], pa.string()),
+    })
+
+
+def _clean_shard(bibcodes, abstracts, path):
+    # Runs in a worker: clean one chunk and write its shard
+    table = clean_chunk(bibcodes, abstracts)
+    columnar_store.write_table(table, path)
+    return table.num_rows
+
+
+def shard_path(out_dir, chunk):
+    return os.path.join(out_dir, f'clean-{chunk:06d}.parquet')
+
+
+def shard_paths(out_dir):
+    return sorted(os.path.join(out_dir, name) for name in os.listdir(out_dir)
+                  if name.startswith('clean-') and name.endswith('.parquet'))
+
+
+def read_clean(out_dir):
+    # All shards as one table, in source order
+    return pa.concat_tables(pq.read_table(path) for path in shard_paths(out_dir))
+
+
+def _check_settings(out_dir, settings):
+    # Shards are only reusable for the same source and chunk size
+    path = os.path.join(out_dir, SETTINGS_NAME)
+    try:
+        with open(path) as f:
+            if json.load(f) != settings:
+                raise ValueError(f'{out_dir} was cleaned from another source or chunk size; use another directory')
+    except FileNotFoundError:
+        columnar_store.write_atomic(path, lambda f: json.dump(settings, f, indent=2))
+
+
+def run(source, out_dir, workers=None, chunk_size=CHUNK_SIZE):
+    os.makedirs(out_dir, exist_ok=True)
+    parquet = pq.ParquetFile(source)
+    total = parquet.metadata.num_rows
+    _check_settings(out_dir, {'source': os.path.abspath(source), 'rows': total, 'chunk_size': chunk_size})
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    done = skipped = 0
+    pending = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        batches = parquet.iter_batches(batch_size=chunk_size, columns=['bibcode', 'abstract'])
+        for chunk, batch in enumerate(batches):
+            path = shard_path(out_dir, chunk)
+            if os.path.exists(path):
+                skipped += batch.num_rows
+                continue
+            # At most two chunks per worker are read ahead
+            while len(pending) >= 2 * workers:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done += future.result()
+                    pending.pop(future)
+                _report(done, skipped, total, start)
+            future = pool.submit(_clean_shard, batch.column('bibcode').to_pylist(), batch.column('abstract').to_pylist(), path)
+            pending[future] = chunk
+        for future in list(pending):
+            done += future.result()
+            _report(done, skipped, total, start)
+
+    elapsed = time.perf_counter() - start
+    print(f'{done} abstracts cleaned in {elapsed:.1f} s ({done / max(elapsed, 1e-9):.0f}/s), '
+          f'{skipped} already done, {len(shard_paths(out_dir))} shards in {out_dir}')
+    return shard_paths(out_dir)
+
+
+def _report(done, skipped, total, start):
+    elapsed = time.perf_counter() - start
+    rate = done / max(elapsed, 1e-9)
+    remaining = total - done - skipped
+    eta = remaining / rate if rate else float('nan')
+    print(f'{done + skipped}/{total} abstracts ({100 * (done + skipped) / max(total, 1):.0f}%), '
+          f'{rate:.0f} abstracts/s, ETA {eta:.0f} s', flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Clean and lemmatize abstracts into Parquet shards.')
+    parser.add_argument('out_dir', help='directory for the clean-*.parquet shards')
+    parser.add_argument('--source', default=None, help='Parquet file with bibcode and abstract columns '
+                                                       '(default: the cached skeleton)')
+    parser.add_argument('--workers', type=int, default=None, help='processes (default: all cores)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='abstracts per shard')
+    args = parser.parse_args(argv)
+    source = args.source or columnar_store.columnar_path('skeleton', data_loader.DATA_CACHE_DIR)
+    run(source, args.out_dir, args.workers, args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Sparse entity-by-entity co-occurrence counts.
+#
+# Every entity list column is integer-coded once into a papers x terms incidence
+# matrix (CSR, one row per paper, papers sorted by year). The co-occurrence
+# counts of two columns are then a single sparse product A.T @ B, and a year
+# range is just a contiguous slice of rows, so a filtered matrix costs a few
+# milliseconds instead of a pass over the per-paper lists.
+
+import flask
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+API_ROUTE = '/api/co-occurrence/'
+MAX_TERMS = 100  # terms per axis in an API response
+
+
+def incidence_matrix(series):
+    # (vocabulary, papers x terms CSR matrix); a term listed twice in one paper
+    # still counts once
+    exploded = pd.Series(series.to_numpy()).explode().dropna()
+    codes, vocabulary = pd.factorize(exploded.to_numpy())
+    matrix = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.int32), (exploded.index.to_numpy(), codes)),
+        shape=(len(series), len(vocabulary)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return np.asarray(vocabulary, dtype=object), matrix
+
+
+class CoOccurrence:
+    def __init__(self, df, columns):
+        df = df.sort_values('year', kind='stable')
+        self.years = df['year'].to_numpy()
+        self.vocabularies = {}
+        self.incidence = {}
+        for column in columns:
+            self.vocabularies[column], self.incidence[column] = incidence_matrix(df[column])
+
+    def _rows(self, year_range):
+        if year_range is None:
+            return 0, len(self.years)
+        start, end = year_range
+        return np.searchsorted(self.years, start, 'left'), np.searchsorted(self.years, end, 'right')
+
+    def counts(self, row_column, col_column, year_range=None):
+        # Sparse row_column x col_column matrix of papers mentioning both terms
+        start, stop = self._rows(year_range)
+        rows = self.incidence[row_column][start:stop]
+        cols = self.incidence[col_column][start:stop]
+        return (rows.T @ cols).tocsr()
+
+    def table(self, row_column, col_column, year_range=None, top=None):
+        # (row terms, column terms, dense counts) for the `top` terms of each axis
+        # with the most co-occurrences; terms without any are dropped
+        counts = self.counts(row_column, col_column, year_range)
+        row_order = self._top(np.asarray(counts.sum(axis=1)).ravel(), top)
+        col_order = self._top(np.asarray(counts.sum(axis=0)).ravel(), top)
+        dense = counts[row_order][:, col_order].toarray()
+        return self.vocabularies[row_column][row_order], self.vocabularies[col_column][col_order], dense
+
+    @staticmethod
+    def _top(totals, top):
+        order = np.argsort(-totals, kind='stable')
+        order = order[totals[order] > 0]
+        return order[:top] if top is not None else order
+
+
+def build(df, columns):
+    return CoOccurrence(df[['year'] + list(columns)], columns)
+
+
+def init_app(server, index):
+    def respond(row_column, col_column):
+        if row_column not in index.incidence or col_column not in index.incidence:
+            flask.abort(404)
+        args = flask.request.args
+        start, end = args.get('start', type=int), args.get('end', type=int)
+        year_range = None if start is None and end is None else (
+            start if start is not None else index.years[0],
+            end if end is not None else index.years[-1],
+        )
+        top = min(max(args.get('top', MAX_TERMS, type=int), 1), MAX_TERMS)
+        rows, columns, counts = index.table(row_column, col_column, year_range, top)
+        return flask.jsonify({'rows': rows.tolist(), 'columns': columns.tolist(), 'counts': counts.tolist()})
+
+    server.add_url_rule(API_ROUTE + '<row_column>/<col_column>', 'co_occurrence', respond)
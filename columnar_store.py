@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Columnar (Parquet) copies of the skeleton and df_unique datasets.
+#
+# The pickle/CSV sources are converted once into typed Parquet files: integer and
+# float columns get narrow numeric types, repetitive strings (authors, entity
+# terms, arXiv classes) are dictionary-encoded and list columns are stored as
+# native list<string> columns. Readers then only pull the columns they need.
+#
+# Next to each Parquet file an uncompressed Arrow IPC copy (<sha256>.arrow) can
+# be written. It is opened with mmap, so reading it decodes nothing and copies
+# nothing: list columns are an offsets array plus one flat values array, and
+# every process that opens the file (server workers, offline batch jobs) shares
+# the same page-cache pages read-only.
+#
+# Usage:
+#   python columnar_store.py                 # convert the cached datasets
+#   python columnar_store.py mapped          # ... and write their Arrow IPC copies
+#   python columnar_store.py skeleton.pkl out.parquet
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import data_loader
+import startup_profile
+
+# Entity list columns extracted from the abstracts
+ENTITY_COLUMNS = ['theory', 'particles', 'gravity', 'detectors', 'colliders', 'dm_models',
+                  'telescopes', 'stellar_objects', 'methods', 'inferences']
+
+# Narrow types for the scalar columns the app reads
+COLUMN_TYPES = {
+    'year': pa.int16(),
+    'citations': pa.int32(),
+    'downloads': pa.int32(),
+    'reads': pa.int32(),
+    'citations_normalized': pa.float32(),
+    'bibcode': pa.string(),
+    'title': pa.string(),
+    'first_author': pa.dictionary(pa.int32(), pa.string()),
+}
+
+# Columns read back as pandas categoricals
+DICTIONARY_COLUMNS = ['first_author']
+
+
+def _is_list(value):
+    return isinstance(value, (list, tuple, np.ndarray))
+
+
+def _list_array(series):
+    # Lists stay lists, scalars become one-element lists (a bare "astro-ph" string
+    # is a single class), empty strings become empty lists and NaN/None stay null
+    values = []
+    for value in series:
+        if _is_list(value):
+            values.append([str(v) for v in value])
+        elif isinstance(value, str):
+            values.append([value] if value else [])
+        else:
+            values.append(None)
+    return pa.array(values, type=pa.list_(pa.string()))
+
+
+def _text_array(series):
+    # ADS returns titles as one-element lists
+    values = [value[0] if _is_list(value) and len(value) else value for value in series]
+    values = [value if isinstance(value, str) else None for value in values]
+    return pa.array(values, type=pa.string())
+
+
+def to_arrow(frame):
+    arrays = {}
+    for column in frame.columns:
+        series = frame[column]
+        if column in COLUMN_TYPES and column not in ('bibcode', 'title', 'first_author'):
+            numeric = pd.to_numeric(series, errors='coerce')
+            arrays[column] = pa.array(numeric, from_pandas=True).cast(COLUMN_TYPES[column], safe=False)
+        elif column in ('bibcode', 'title', 'first_author'):
+            arrays[column] = _text_array(series)
+            if column in DICTIONARY_COLUMNS:
+                arrays[column] = arrays[column].dictionary_encode()
+        elif series.dtype == object and series.map(_is_list).any():
+            arrays[column] = _list_array(series)
+        elif series.dtype == object:
+            arrays[column] = _text_array(series)
+        else:
+            arrays[column] = pa.array(series, from_pandas=True)
+    return pa.table(arrays)
+
+
+def write_atomic(path, write, mode='w'):
+    # Call write(f) on a temp file next to `path`, then rename it into place, so
+    # readers (and a crashed writer) never see a half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.columnar-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def write_table(table, dest_path):
+    write_atomic(dest_path, lambda f: pq.write_table(table, f, compression='zstd', use_dictionary=True), 'wb')
+
+
+def convert(source_path, dest_path):
+    if source_path.endswith('.csv'):
+        frame = pd.read_csv(source_path)
+    else:
+        frame = pd.read_pickle(source_path)
+    write_table(to_arrow(frame.reset_index(drop=True)), dest_path)
+    return dest_path
+
+
+def write_ipc(source_path, dest_path):
+    # Parquet -> uncompressed Arrow IPC file; the file format allows a single
+    # dictionary per column, so those of the row groups are unified
+    table = pq.read_table(source_path, read_dictionary=DICTIONARY_COLUMNS)
+    options = pa.ipc.IpcWriteOptions(unify_dictionaries=True)
+
+    def write(f):
+        with pa.ipc.new_file(f, table.schema, options=options) as writer:
+            writer.write_table(table)
+    return write_atomic(dest_path, write, 'wb')
+
+
+def read_mapped(path, columns=None):
+    # Zero-copy table over a memory-mapped Arrow IPC file
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table.select(list(columns)) if columns is not None else table
+
+
+def list_parts(column):
+    # (offsets, flat values) of a list column, a pyarrow (chunked) array or a
+    # pandas series (pd.ArrowDtype or lists of strings); row i is
+    # values[offsets[i]:offsets[i + 1]] and null lists are empty
+    if isinstance(column, pd.Series) and isinstance(column.dtype, pd.ArrowDtype):
+        array = pa.array(column.array)
+    elif isinstance(column, pd.Series):
+        array = pa.array(column, pa.list_(pa.string()), from_pandas=True)
+    else:
+        array = column
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    lengths = pc.fill_null(pc.list_value_length(array), 0).to_numpy()
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets, pc.list_flatten(array)
+
+
+def read_columns(path, columns=None, join_lists=None, arrow_lists=(), join_copies=None, rows=None):
+    # List columns come back as numpy arrays of strings (or None). Columns named in
+    # `join_lists` ({column: separator}) are instead joined inside Arrow and
+    # returned as categoricals, which avoids a Python-level join per row, and
+    # the ones in `arrow_lists` stay Arrow-backed (pd.ArrowDtype) instead of
+    # becoming one numpy array per row. `join_copies` are joined the same way
+    # into an extra '<column>_joined' categorical, keeping the list column.
+    # `rows`, a pyarrow.compute expression, selects the rows before any
+    # conversion. Arrow IPC files are memory-mapped
+    columns = list(columns) if columns is not None else None
+    if path.endswith('.arrow'):
+        table = read_mapped(path, columns)
+        if rows is not None:
+            table = table.filter(rows)
+    else:
+        dictionary = [c for c in DICTIONARY_COLUMNS if columns is None or c in columns]
+        table = pq.read_table(path, columns=columns, read_dictionary=dictionary, filters=rows)
+    for column, separator in (join_copies or {}).items():
+        table = table.append_column(column + '_joined', pc.dictionary_encode(pc.binary_join(table.column(column), separator)))
+    for column, separator in (join_lists or {}).items():
+        index = table.schema.get_field_index(column)
+        joined = pc.binary_join(table.column(column), separator)
+        table = table.set_column(index, column, pc.dictionary_encode(joined))
+    arrow_types = {table.schema.field(column).type for column in arrow_lists if column in table.column_names}
+    return table.to_pandas(types_mapper={t: pd.ArrowDtype(t) for t in arrow_types}.get)
+
+
+def columnar_path(name, cache_dir=data_loader.DATA_CACHE_DIR):
+    # Convert the cached download on first use; the Parquet file is keyed by the
+    # sha256 of its source so a new download is converted again
+    source_path = data_loader.fetch(name, cache_dir)
+    version = data_loader.dataset_version(name, cache_dir)
+    dest_path = os.path.join(cache_dir, f'{version}.parquet')
+    if not os.path.exists(dest_path):
+        with startup_profile.stage(f'convert {name} to Parquet'):
+            convert(source_path, dest_path)
+    return dest_path
+
+
+def mapped_path(name, cache_dir=data_loader.DATA_CACHE_DIR):
+    # Arrow IPC copy of the Parquet file, written on first use under the same hash
+    parquet_path = columnar_path(name, cache_dir)
+    dest_path = parquet_path[:-len('.parquet')] + '.arrow'
+    if not os.path.exists(dest_path):
+        with startup_profile.stage(f'write {name} Arrow IPC copy'):
+            write_ipc(parquet_path, dest_path)
+    return dest_path
+
+
+def open_mapped(name, columns=None, cache_dir=data_loader.DATA_CACHE_DIR):
+    return read_mapped(mapped_path(name, cache_dir), columns)
+
+
+def load_dataset(name, columns=None, join_lists=None, cache_dir=data_loader.DATA_CACHE_DIR, arrow_lists=(),
+                 mapped=False, join_copies=None):
+    path = mapped_path(name, cache_dir) if mapped else columnar_path(name, cache_dir)
+    with startup_profile.stage(f'parse {name}'):
+        return read_columns(path, columns, join_lists, arrow_lists, join_copies)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        print(convert(sys.argv[1], sys.argv[2]))
+    else:
+        for dataset_name in data_loader.DATASETS:
+            print(dataset_name, mapped_path(dataset_name) if sys.argv[1:] == ['mapped'] else columnar_path(dataset_name))
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Cached, content-addressed loader for the datasets hosted on Google Drive.
+#
+# Every file is stored as data_cache/<sha256>.<ext> and data_cache/manifest.json
+# maps the dataset name to that hash together with the ETag and size reported by
+# the server. A warm start is a manifest lookup plus a stat() call; the network is
+# only touched on a cache miss (or when DATA_REVALIDATE=1 asks for a conditional
+# request). Downloads are streamed in chunks to a temp file in the cache directory
+# and renamed into place, so a crash never leaves a half-written file behind.
+#
+# Files built locally (the skeleton patched by refresh.py) are recorded with
+# 'source': 'local' and are never revalidated against Google Drive, which would
+# replace them with the older upstream copy.
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import requests
+
+import startup_profile
+
+DATA_CACHE_DIR = os.environ.get('DATA_CACHE_DIR', 'data_cache')
+MANIFEST_NAME = 'manifest.json'
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Google Drive file IDs
+DATASETS = {
+    'df_unique': {'file_id': '16lramFSvU4lzshUUMskGzfAi488IibiO', 'suffix': '.csv'},
+    'skeleton': {'file_id': '1WQgTgy5TXD3fDkFtJks5cxo75JUeO1m6', 'suffix': '.pkl'},
+}
+
+
+def download_url(file_id, confirm=False):
+    url = f'https://drive.google.com/uc?export=download&id={file_id}'
+    # Large files are answered with a "virus scan warning" HTML page unless the
+    # download is confirmed up front
+    return url + '&confirm=t' if confirm else url
+
+
+def _manifest_path(cache_dir):
+    return os.path.join(cache_dir, MANIFEST_NAME)
+
+
+def read_manifest(cache_dir=DATA_CACHE_DIR):
+    try:
+        with open(_manifest_path(cache_dir)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest, cache_dir):
+    # Same temp-file-and-rename dance as the data files, so concurrent workers
+    # never read a truncated manifest
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.manifest-', suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, _manifest_path(cache_dir))
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_path(name, cache_dir=DATA_CACHE_DIR, verify=False):
+    # Return the local path of a cached dataset, or None on a miss
+    entry = read_manifest(cache_dir).get(name)
+    if not entry:
+        return None
+    path = os.path.join(cache_dir, entry['file'])
+    try:
+        if os.path.getsize(path) != entry['size']:
+            return None
+    except OSError:
+        return None
+    if verify and _sha256_file(path) != entry['sha256']:
+        return None
+    return path
+
+
+def dataset_version(name, cache_dir=DATA_CACHE_DIR):
+    # The sha256 of the cached file doubles as the dataset version
+    entry = read_manifest(cache_dir).get(name)
+    return entry['sha256'] if entry else None
+
+
+def _stream_to_cache(response, suffix, cache_dir):
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.download-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        sha256 = digest.hexdigest()
+        file_name = sha256 + suffix
+        os.replace(tmp_path, os.path.join(cache_dir, file_name))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return file_name, sha256, size
+
+
+def _get(url, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    response = requests.get(url, headers=headers, stream=True, timeout=60)
+    response.raise_for_status()
+    return response
+
+
+def fetch(name, cache_dir=DATA_CACHE_DIR, revalidate=None):
+    # Return the local path of dataset `name`, downloading it only on a cache miss
+    if revalidate is None:
+        revalidate = os.environ.get('DATA_REVALIDATE') == '1'
+
+    path = cached_path(name, cache_dir)
+    if path and (not revalidate or read_manifest(cache_dir)[name].get('source') == 'local'):
+        return path
+
+    with startup_profile.stage(f'download {name}'):
+        return _download(name, path, cache_dir)
+
+
+def _download(name, path, cache_dir):
+    os.makedirs(cache_dir, exist_ok=True)
+    dataset = DATASETS[name]
+    manifest = read_manifest(cache_dir)
+    etag = manifest.get(name, {}).get('etag') if path else None
+
+    response = _get(download_url(dataset['file_id']), etag=etag)
+    if response.status_code == 304:
+        response.close()
+        return path
+    if response.headers.get('Content-Type', '').startswith('text/html'):
+        # Google Drive interstitial instead of the file itself
+        response.close()
+        response = _get(download_url(dataset['file_id'], confirm=True))
+        if response.headers.get('Content-Type', '').startswith('text/html'):
+            response.close()
+            raise RuntimeError(f'Google Drive returned an HTML page instead of {name}')
+
+    with response:
+        file_name, sha256, size = _stream_to_cache(response, dataset['suffix'], cache_dir)
+
+    # Re-read the manifest in case another worker updated it while we were downloading
+    manifest = read_manifest(cache_dir)
+    manifest[name] = {
+        'file': file_name,
+        'sha256': sha256,
+        'size': size,
+        'etag': response.headers.get('ETag'),
+        'source': 'drive',
+        'downloaded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+    _write_manifest(manifest, cache_dir)
+    return os.path.join(cache_dir, file_name)
+
+
+def add_file(name, path, suffix, cache_dir=DATA_CACHE_DIR):
+    # Move a locally built file into the cache under its sha256 and make it the
+    # current version of dataset `name` (used by refresh.py for patched data)
+    sha256 = _sha256_file(path)
+    file_name = sha256 + suffix
+    os.replace(path, os.path.join(cache_dir, file_name))
+    manifest = read_manifest(cache_dir)
+    manifest[name] = {
+        'file': file_name,
+        'sha256': sha256,
+        'size': os.path.getsize(os.path.join(cache_dir, file_name)),
+        'etag': None,
+        'source': 'local',
+        'downloaded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+    _write_manifest(manifest, cache_dir)
+    return os.path.join(cache_dir, file_name)
+
+
+if __name__ == '__main__':
+    for dataset_name in DATASETS:
+        print(dataset_name, fetch(dataset_name))
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Entity extraction for the entity list columns (dm_models, particles, theory, ...).
+#
+# The about page describes one `|`-joined regex per category, each run over
+# every abstract. Here the terms of all categories go into a single trie over
+# word tokens instead, so one pass over an abstract's tokens finds the entities
+# of every category: at each token the trie is walked as far as the text
+# allows, and the longest term starting there wins (per category, without
+# overlaps, like the longest-first alternation it replaces). Hyphens and
+# whitespace both separate tokens, so "self-interacting" and "self interacting"
+# are the same term, and every term maps to its canonical name, which merges
+# synonyms such as "WIMP" and "weakly interacting massive particle" while
+# matching.
+#
+# The dm_models terms are the ones listed on the about page; the other
+# categories take their vocabulary from the terms already present in the
+# columnar store, so new papers are tagged consistently with the existing ones.
+# Large batches are split into chunks and spread over a process pool.
+#
+# Usage:
+#   python entities.py papers.parquet entities.parquet --workers 8
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import columnar_store
+
+CHUNK_SIZE = 2000  # abstracts per process pool task
+
+# Words, with any other non-space, non-hyphen character as a token of its own
+TOKEN = re.compile(r'\w+|[^\w\s-]')
+
+# Dark matter models (see the NLP section of the about page): canonical name ->
+# the other spellings and acronyms that mean the same model
+DM_MODELS = {
+    'self-interacting dark matter': ['sidm'],
+    'warm dark matter': ['wdm'],
+    'axion': ['axions'],
+    'axion-like particle': ['axion-like particles', 'alp'],
+    'sterile neutrino dark matter': [],
+    'sterile neutrino': [],
+    'fuzzy dark matter': ['fdm'],
+    'supersymmetric dark matter': [],
+    'neutralino dark matter': [],
+    'neutralino': [],
+    'kaluza-klein dark matter': [],
+    'kaluza-klein': [],
+    'weakly interacting massive particle': ['weakly interacting massive particles', 'wimp', 'wimps'],
+    'gravitino dark matter': [],
+    'gravitino': [],
+    'tachyon dark matter': [],
+    'tachyon': [],
+    'scalar field dark matter': ['sfdm'],
+    'vector dark matter': ['vdm'],
+    'primordial black hole': ['primordial black holes', 'pbh'],
+    'superfluid dark matter': ['sfd'],
+    'quintessence dark matter': ['qdm'],
+    'quintessence': [],
+    'ultralight dark matter': ['uldm'],
+    'non-thermal dark matter': [],
+    'mirror dark matter': [],
+    'macroscopic dark matter': ['macdm'],
+    'asymmetric dark matter': ['adm'],
+    'composite dark matter': [],
+    'leptophilic dark matter': [],
+    'bosonic dark matter': ['bdm'],
+    'anapole dark matter': [],
+    'wimpzilla': [],
+    'self-annihilating dark matter': [],
+    'massive compact halo object': ['massive compact halo objects', 'machos'],
+    'super weakly interacting massive particle': ['super weakly interacting massive particles', 'swimp', 'swimps'],
+    'fermionic dark matter': [],
+    'little higgs': [],
+    'qcd axion': ['qcd axions', 'quantum chromodynamics axions'],
+    'emergent gravity': [],
+    'glueball dark matter': [],
+    'glueball': [],
+    'strongly interacting massive particle': ['strongly interacting massive particles', 'simp', 'simps'],
+    'elastically decoupling relic': ['elder dm'],
+    'feebly interacting massive particle': ['feebly interacting massive particles', 'fimp', 'fimps'],
+    'decaying dark matter': [],
+    'dark photon': [],
+    'planckian interacting massive particle': ['planckian interacting massive particles', 'pimp'],
+    'dodelson-widrow sterile neutrino': ['sterile neutrino dark matter (dodelson-widrow)'],
+    'wimp-less dark matter': ['wimp-less dm'],
+    'composite asymmetric dark matter': ['composite adm'],
+    'self-interacting dark energy': ['siden'],
+    'hidden-sector dark matter': ['hidden-sector dm'],
+}
+
+# Spelling -> canonical name, applied to the terms of every category
+SYNONYMS = {synonym: canonical for canonical, synonyms in DM_MODELS.items() for synonym in synonyms}
+# Acronyms of SYNONYMS that commonly mean something else in the literature (SFD
+# dust maps, ADM mass, finite-difference methods, ...)
+AMBIGUOUS_ACRONYMS = frozenset(['sfd', 'adm', 'fdm', 'bdm', 'vdm'])
+
+
+def tokens(text):
+    return TOKEN.findall(text.lower())
+
+
+def canonical(term):
+    term = term.lower()
+    return SYNONYMS.get(term, term)
+
+
+def vocabularies(table, columns=None):
+    # {column: sorted distinct terms} of the entity list columns of a pyarrow table
+    vocabularies = {}
+    for column in columns or columnar_store.ENTITY_COLUMNS:
+        terms = pc.unique(pc.list_flatten(table.column(column))).to_pylist() if column in table.column_names else []
+        vocabularies[column] = sorted({term.lower() for term in terms if term})
+    vocabularies['dm_models'] = sorted(set(vocabularies.get('dm_models', [])) | set(DM_MODELS) | set(SYNONYMS))
+    return vocabularies
+
+
+class EntityExtractor:
+    def __init__(self, vocabularies):
+        self.columns = [column for column, terms in vocabularies.items() if terms]
+        # Nested dicts keyed by token; the None key of a node lists the
+        # (column, canonical name, ambiguous) triples of the terms ending there.
+        # An ambiguous acronym (AMBIGUOUS_ACRONYMS) only counts in a text that
+        # also spells out its canonical name, as in clean_abstracts.py
+        self.trie = {}
+        for column in self.columns:
+            for term in vocabularies[column]:
+                term_tokens = tokens(term)
+                if not term_tokens:
+                    continue
+                node = self.trie
+                for token in term_tokens:
+                    node = node.setdefault(token, {})
+                terms = node.setdefault(None, [])
+                if not any(existing == column for existing, _, _ in terms):
+                    terms.append((column, canonical(term), term in AMBIGUOUS_ACRONYMS))
+
+    def extract(self, text):
+        # {column: distinct canonical terms in order of appearance, or None}
+        text_tokens = tokens(text) if isinstance(text, str) else []
+        found = {column: {} for column in self.columns}
+        # Per column, the first token a new match may start at (no overlaps)
+        free = dict.fromkeys(self.columns, 0)
+        n = len(text_tokens)
+        spelled = None  # the tokens as one string, joined on the first ambiguous match
+        for i, token in enumerate(text_tokens):
+            node = self.trie.get(token)
+            if node is None:
+                continue
+            longest = {}
+            end = i + 1
+            while node is not None:
+                for column, term, ambiguous in node.get(None, ()):
+                    longest[column] = (end, term, ambiguous)
+                node = node.get(text_tokens[end]) if end < n else None
+                end += 1
+            for column, (match_end, term, ambiguous) in longest.items():
+                if ambiguous:
+                    if spelled is None:
+                        spelled = ' ' + ' '.join(text_tokens) + ' '
+                    if ' ' + ' '.join(tokens(term)) + ' ' not in spelled:
+                        continue
+                if i >= free[column]:
+                    found[column][term] = None
+                    free[column] = match_end
+        return {column: list(terms) or None for column, terms in found.items()}
+
+    def extract_many(self, texts):
+        results = [self.extract(text) for text in texts]
+        return {column: [result[column] for result in results] for column in self.columns}
+
+
+_extractor = None
+
+
+def _init_worker(vocabularies):
+    global _extractor
+    _extractor = EntityExtractor(vocabularies)
+
+
+def _extract_chunk(texts):
+    return _extractor.extract_many(texts)
+
+
+def extract_all(texts, vocabularies, workers=None, chunk_size=CHUNK_SIZE):
+    # {column: one entity list (or None) per text}; large inputs are extracted
+    # chunk by chunk in a process pool, each worker building its trie once
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(texts) <= chunk_size:
+        return EntityExtractor(vocabularies).extract_many(texts)
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(vocabularies,)) as pool:
+        for chunk in pool.map(_extract_chunk, chunks):
+            for column, values in chunk.items():
+                results.setdefault(column, []).extend(values)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract the entity columns from the abstracts of a Parquet file.')
+    parser.add_argument('source', help='Parquet file with bibcode and abstract (and optionally entity) columns')
+    parser.add_argument('dest', help='output Parquet file: bibcode plus one list column per category')
+    parser.add_argument('--workers', type=int, default=None, help='processes (default: all cores)')
+    parser.add_argument('--vocabulary', default=None, help='Parquet file whose entity columns give the vocabulary '
+                                                           '(default: the source file)')
+    args = parser.parse_args(argv)
+
+    source = pq.read_table(args.source)
+    vocabulary = pq.read_table(args.vocabulary) if args.vocabulary else source
+    results = extract_all(source.column('abstract').to_pylist(), vocabularies(vocabulary), args.workers)
+    table = pa.table({'bibcode': source.column('bibcode'),
+                      **{column: pa.array(values, pa.list_(pa.string())) for column, values in results.items()}})
+    columnar_store.write_table(table, args.dest)
+    print(f'{table.num_rows} abstracts -> {args.dest}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Per-year term frequencies for the entity list columns of the skeleton.
+#
+# The index is built with the other aggregate tables (see aggregates.py): for
+# every entity column it keeps the terms ordered by how many papers mention
+# them and a terms x years matrix of paper counts. The entity pages draw their
+# small-multiples from it, and /api/entity-trends/<category> serves the same
+# numbers as JSON, so they always follow the current dataset version.
+
+import flask
+import numpy as np
+import pandas as pd
+
+API_ROUTE = '/api/entity-trends/'
+MAX_TERMS = 100  # terms per API response
+
+
+def term_counts(df, column):
+    # Papers mentioning each term per year; a term listed twice in one paper
+    # is counted once
+    mentions = df[['year', column]].dropna(subset=[column]).explode(column).dropna(subset=[column])
+    mentions = mentions.reset_index().drop_duplicates(['index', column])
+    return mentions.groupby([column, 'year']).size().unstack(fill_value=0)
+
+
+def _entry(counts, years):
+    # Terms ordered by total mentions, ties by term as in term_counts
+    counts = counts.reindex(columns=years, fill_value=0).sort_index()
+    totals = counts.sum(axis=1).sort_values(ascending=False, kind='stable')
+    totals = totals[totals > 0]
+    return {
+        'years': years.astype(np.int16),
+        'terms': totals.index.astype(str).tolist(),
+        'totals': totals.to_numpy(dtype=np.int32),
+        'counts': counts.loc[totals.index].to_numpy(dtype=np.int32),
+    }
+
+
+def build_index(df, columns):
+    years = np.arange(df['year'].min(), df['year'].max() + 1)
+    return {column: _entry(term_counts(df, column), years) for column in columns}
+
+
+def patch_index(index, removed, added, columns):
+    # Index with the mentions of the `removed` papers taken out and those of
+    # `added` put in (a refreshed paper is in both, with its old and new row)
+    patched = {}
+    for column in columns:
+        entry = index[column]
+        years = entry['years'].astype(np.int64)
+        counts = pd.DataFrame(entry['counts'], index=entry['terms'], columns=years)
+        for frame, sign in ((removed, -1), (added, 1)):
+            if len(frame):
+                delta = term_counts(frame, column)
+                counts = counts.add(sign * delta.set_axis(delta.columns.astype(np.int64), axis=1), fill_value=0)
+        if len(added):
+            years = np.arange(min(years[0], added['year'].min()), max(years[-1], added['year'].max()) + 1)
+        patched[column] = _entry(counts.fillna(0).astype(np.int64), years)
+    return patched
+
+
+def trends(index, category, top=None):
+    # JSON-ready trends for the `top` most mentioned terms (all terms if None)
+    entry = index[category]
+    top = len(entry['terms']) if top is None else top
+    return {
+        'category': category,
+        'years': entry['years'].tolist(),
+        'terms': [
+            {'term': term, 'total': int(total), 'counts': counts.tolist()}
+            for term, total, counts in zip(entry['terms'][:top], entry['totals'][:top], entry['counts'][:top])
+        ],
+    }
+
+
+def init_app(server, index):
+    def respond(category):
+        if category not in index:
+            flask.abort(404)
+        top = min(max(flask.request.args.get('top', MAX_TERMS, type=int), 1), MAX_TERMS)
+        return flask.jsonify(trends(index, category, top))
+
+    server.add_url_rule(API_ROUTE + '<category>', 'entity_trends', respond)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Pre-serialized, pre-compressed JSON for the static dcc.Graph figures.
+#
+# Each registered figure is encoded once (with orjson when available) and kept
+# as identity, gzip and, if the brotli package is installed, brotli bytes. The
+# figures are served from /_figures/<name>.json with per-encoding ETags, and the
+# graphs fetch them through a clientside callback, so page layouts no longer
+# carry the figure JSON and repeat views are answered with a 304.
+#
+# Figures registered with a factory can also be requested with
+# ?filters=<json>; those variants are built on demand and kept in a small LRU.
+#
+# Figures registered lazily are only built on their first request or by warm(),
+# which the app can run in a background thread; /_ready answers 503 with the
+# figures still pending until all of them exist, so a load balancer can hold
+# traffic back while the server itself is already up.
+#
+# The built figures can also be saved to a file offline (`python aggregates.py
+# build` does it) and loaded at startup, so no process has to build them at all.
+# The file records a key (app.py derives it from its own source and the plotly
+# version) and is ignored when the key does not match.
+
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import traceback
+from collections import OrderedDict
+
+import flask
+import plotly.io as pio
+from dash import Input, Output
+
+import startup_profile
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+try:
+    import orjson  # noqa: F401
+    JSON_ENGINE = 'orjson'
+except ImportError:
+    JSON_ENGINE = 'json'
+
+FIGURE_ROUTE = '/_figures/'
+READY_ROUTE = '/_ready'
+FILTERED_CACHE_SIZE = 128  # filtered variants kept across all figures
+
+_figures = {}
+_factories = {}
+_builders = {}
+_build_lock = threading.Lock()
+_filtered = OrderedDict()
+_filtered_lock = threading.Lock()
+
+
+def _encode(figure, fast=False):
+    # Static figures are compressed once at the highest levels; filtered
+    # variants are built per request, so they use cheaper settings
+    body = pio.to_json(figure, validate=False, engine=JSON_ENGINE).encode('utf-8')
+    encoded = {'identity': body, 'gzip': gzip.compress(body, compresslevel=6 if fast else 9)}
+    if brotli is not None:
+        encoded['br'] = brotli.compress(body, quality=5 if fast else 11)
+    return {'digest': hashlib.sha256(body).hexdigest()[:32], 'encoded': encoded}
+
+
+def register(name, figure):
+    _figures[name] = _encode(figure)
+    return _figures[name]['digest']
+
+
+def register_lazy(name, builder):
+    # builder() -> figure, called once on the first request for the figure or by warm()
+    _builders[name] = builder
+
+
+def builder(name):
+    return _builders[name]
+
+
+def _static_entry(name):
+    entry = _figures.get(name)
+    if entry is None and name in _builders:
+        with _build_lock:
+            entry = _figures.get(name)
+            if entry is None:
+                with startup_profile.stage(f'figure {name}'):
+                    figure = _builders[name]()
+                with startup_profile.stage(f'serialize {name}'):
+                    entry = _figures[name] = _encode(figure)
+    return entry
+
+
+def pending():
+    # Lazily registered figures that are not built yet
+    return [name for name in _builders if name not in _figures]
+
+
+def warm():
+    # Build every pending figure; one that fails is left to its first request
+    for name in pending():
+        try:
+            _static_entry(name)
+        except Exception:
+            traceback.print_exc()
+
+
+def _warm_and_report():
+    warm()
+    startup_profile.summary('figures ready')
+
+
+def warm_in_background():
+    thread = threading.Thread(target=_warm_and_report, name='figure-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def save(path, key):
+    # Write every figure built so far, with `key`, atomically to `path`
+    dest_dir = os.path.dirname(path) or '.'
+    os.makedirs(dest_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix='.figures-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'key': key, 'figures': dict(_figures)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def load(path, key):
+    # Take the lazily registered figures from a file written by save() with the
+    # same key; returns the names loaded
+    try:
+        with open(path, 'rb') as f:
+            saved = pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+        return []
+    if saved.get('key') != key:
+        return []
+    loaded = [name for name in saved['figures'] if name in _builders]
+    for name in loaded:
+        _figures.setdefault(name, saved['figures'][name])
+    return loaded
+
+
+def register_factory(name, factory):
+    # factory(filters) -> figure, used for /_figures/<name>.json?filters=<json>
+    _factories[name] = factory
+
+
+def _filtered_entry(name, filters_json):
+    try:
+        filters = json.loads(filters_json)
+    except ValueError:
+        flask.abort(400)
+    if not isinstance(filters, dict):
+        flask.abort(400)
+    key = (name, json.dumps(filters, sort_keys=True))
+    with _filtered_lock:
+        if key in _filtered:
+            _filtered.move_to_end(key)
+            return _filtered[key]
+    try:
+        figure = _factories[name](filters)
+    except (TypeError, ValueError):
+        flask.abort(400)
+    entry = _encode(figure, fast=True)
+    with _filtered_lock:
+        _filtered[key] = entry
+        while len(_filtered) > FILTERED_CACHE_SIZE:
+            _filtered.popitem(last=False)
+    return entry
+
+
+def size(name, encoding='identity'):
+    return len(_static_entry(name)['encoded'][encoding])
+
+
+def _respond(name):
+    filters = flask.request.args.get('filters')
+    if filters and name in _factories:
+        entry = _filtered_entry(name, filters)
+    else:
+        entry = _static_entry(name)
+    if entry is None:
+        flask.abort(404)
+
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in entry['encoded'] and flask.request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+
+    etag = f"{entry['digest']}-{encoding}"
+    if etag in flask.request.if_none_match:
+        response = flask.Response(status=304)
+    else:
+        response = flask.Response(entry['encoded'][encoding], mimetype='application/json')
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    # Always revalidate; an unchanged figure costs a 304 with no body
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _ready():
+    waiting = pending()
+    return flask.jsonify({'ready': not waiting, 'pending': waiting}), 503 if waiting else 200
+
+
+def init_app(server):
+    server.add_url_rule(FIGURE_ROUTE + '<name>.json', 'cached_figure', _respond)
+    server.add_url_rule(READY_ROUTE, 'figures_ready', _ready)
+
+
+def bind(app, graph_id, name, filters_id=None):
+    # Fill `graph_id` with the cached figure as soon as the graph is mounted
+    # (see assets/figure_cache.js). With `filters_id`, the data of that
+    # dcc.Store is passed along as ?filters= and changes to it reload the figure
+    if filters_id is None:
+        app.clientside_callback(
+            f"function(_) {{ return window.dash_clientside.figure_cache.load('{FIGURE_ROUTE}{name}.json'); }}",
+            Output(graph_id, 'figure'),
+            Input(graph_id, 'id'),
+        )
+    else:
+        app.clientside_callback(
+            f"function(_, filters) {{ return window.dash_clientside.figure_cache.load('{FIGURE_ROUTE}{name}.json', filters); }}",
+            Output(graph_id, 'figure'),
+            Input(graph_id, 'id'),
+            Input(filters_id, 'data'),
+        )
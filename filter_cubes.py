@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Prefix-summed cubes behind the global figure filters (year range, arXiv
+# category, research focus).
+#
+# Paper counts, unique paper counts and citation sums are binned once into
+# year x (arxiv_category, research_focus) cubes and stored cumulatively along
+# the year axis. Only the (arxiv_category, research_focus) pairs that occur get
+# a column, as most of the label x focus combinations never do, and the cubes
+# are int32 unless a total would overflow it. A filter is then answered by
+# slicing: two rows give the totals of any year range, a diff over the slice
+# gives the per-year series, and the category / focus filters are masks over
+# the columns. The fig_1
+# counts and the relevance-weighted arXiv category counts of the fig_X hover
+# have one more axis, so they are kept as sparse lists of non-empty cells
+# instead.
+#
+# After a refresh the cubes are patched with the old and new rows of the
+# changed papers (FilterCubes.patch) instead of being binned again.
+
+import numpy as np
+import pandas as pd
+
+
+def _prefix(values, shape):
+    # Cumulative sums along the year axis with a leading row of zeros, so the
+    # sum over years [i, j) is cube[j] - cube[i]
+    dtype = np.int32 if values.sum() <= np.iinfo(np.int32).max else np.int64
+    cube = np.zeros((shape[0] + 1,) + shape[1:], dtype=dtype)
+    np.cumsum(values.reshape(shape), axis=0, out=cube[1:])
+    return cube
+
+
+class FilterCubes:
+    def __init__(self, df, arxiv_shares, research_focus_labels, research_type, titles_max_papers):
+        # Tables keep the year dtype of the static ones (aggregates.py)
+        year_values = df['year'].to_numpy()
+        self.year_dtype = year_values.dtype
+        self.citations_dtype = df['citations'].dtype
+        years = year_values.astype(np.int64)
+        self.first_year, self.last_year = int(years.min()), int(years.max())
+        self.research_type = research_type
+        self.titles_max_papers = titles_max_papers
+
+        arxiv_category = df['arxiv_category'].cat
+        self.labels = np.asarray(arxiv_category.categories, dtype=object)
+        self._label_parts = [set(label.split(', ')) for label in self.labels]
+        self.categories = sorted(set().union(*self._label_parts))
+        label_codes = arxiv_category.codes.to_numpy()
+
+        # The last slot of the focus axis holds papers without a research focus
+        self.focus_labels = list(research_focus_labels)
+        focus_codes = self._focus_codes(df)
+
+        # One column per (label, focus) pair that has papers
+        pairs = label_codes.astype(np.int64) * (len(self.focus_labels) + 1) + focus_codes
+        columns, column_codes = np.unique(pairs, return_inverse=True)
+        self._column_label, self._column_focus = np.divmod(columns, len(self.focus_labels) + 1)
+        shape = (self.last_year - self.first_year + 1, len(columns))
+        papers, unique_papers, citations = self._cell_values(df, years, column_codes, shape)
+        self.papers = _prefix(papers, shape)
+        self.unique_papers = _prefix(unique_papers, shape)
+        self.citations = _prefix(citations, shape)
+        # column -> research focus slot, to sum the columns of each focus
+        self._focus_columns = np.equal.outer(self._column_focus, np.arange(len(self.focus_labels) + 1)).astype(np.int64)
+
+        self.titles = self._titles(df, label_codes, focus_codes)
+        self.arxiv_cells = self._arxiv_cells(df, arxiv_shares, label_codes, focus_codes)
+        self.dm_cells = self._dm_cells(df, label_codes)
+
+    def _focus_codes(self, df):
+        focus = pd.Categorical(df['research_focus'], categories=self.focus_labels).codes
+        return np.where(focus < 0, len(self.focus_labels), focus)
+
+    def _cell_values(self, df, years, column_codes, shape):
+        # Papers, unique papers and citations per (year, column) cell, flattened
+        cells = (years - self.first_year) * shape[1] + column_codes
+        size = int(np.prod(shape))
+        # fig_5 counts unique bibcodes per (year, research focus)
+        unique = ~df.duplicated(['year', 'research_focus', 'bibcode']).to_numpy()
+        citations = df['citations'].fillna(0).to_numpy(dtype=np.float64)
+        return (np.bincount(cells, minlength=size), np.bincount(cells[unique], minlength=size),
+                np.rint(np.bincount(cells, weights=citations, minlength=size)).astype(np.int64))
+
+    def _titles(self, df, label_codes, focus_codes):
+        # Titles for the fig_X hover, only for the years that list them
+        year_values = df['year'].to_numpy()
+        per_year = np.diff(self.papers.sum(axis=1, dtype=np.int64))
+        small = per_year[year_values.astype(np.int64) - self.first_year] <= self.titles_max_papers
+        return pd.DataFrame({
+            'year': year_values[small], 'label': label_codes[small], 'focus': focus_codes[small],
+            'title': df['title'].to_numpy()[small],
+        })
+
+    def _arxiv_cells(self, df, arxiv_shares, label_codes, focus_codes):
+        # fig_X hover: relevance-weighted papers per (year, arxiv_category
+        # label, research focus, arXiv category) cell (see arxiv_weights.py)
+        paper = arxiv_shares['paper'].to_numpy()
+        return pd.DataFrame({
+            'year': df['year'].to_numpy()[paper], 'label': label_codes[paper], 'focus': focus_codes[paper],
+            'category': arxiv_shares['arxiv_category'].to_numpy(), 'share': arxiv_shares['share'].to_numpy(),
+        }).groupby(['year', 'label', 'focus', 'category'])['share'].sum().reset_index()
+
+    def _dm_cells(self, df, label_codes):
+        # fig_1: non-empty (year, arxiv_category, dm research focus, dm models) cells
+        dm = (df['dm_models'].notnull() & df['dm_research_focus'].notnull()).to_numpy()
+        dm_focus = pd.Categorical(df.loc[dm, 'dm_research_focus'], categories=self.focus_labels).codes
+        return pd.DataFrame({
+            'year': df['year'].to_numpy()[dm],
+            'label': label_codes[dm],
+            'focus': dm_focus,
+            'category': df.loc[dm, 'dm_models_joined'].astype(str).to_numpy(),
+        }).groupby(['year', 'label', 'focus', 'category']).size().reset_index(name='counts')
+
+    def patch(self, df, removed, removed_shares, added, added_shares):
+        # Take the papers of `removed` out and put those of `added` in (a
+        # changed paper is in both, with its old and new row), so the cubes
+        # match the patched corpus `df` without binning it again; only its
+        # titles are selected again, as a year may cross titles_max_papers.
+        # Frames are prepared like for the constructor, shares are per frame
+        self._add(removed, removed_shares, -1)
+        self._add(added, added_shares, 1)
+        self.titles = self._titles(df, self._label_codes(df), self._focus_codes(df))
+
+    def _add(self, df, arxiv_shares, sign):
+        if not len(df):
+            return
+        years = df['year'].to_numpy().astype(np.int64)
+        self._extend_years(int(years.min()), int(years.max()))
+        label_codes = self._label_codes(df)
+        focus_codes = self._focus_codes(df)
+        column_codes = self._column_codes(label_codes, focus_codes)
+        shape = (self.last_year - self.first_year + 1, len(self._column_label))
+        values = self._cell_values(df, years, column_codes, shape)
+        for name, delta in zip(('papers', 'unique_papers', 'citations'), values):
+            cube = getattr(self, name).astype(np.int64)
+            cube[1:] += sign * np.cumsum(delta.reshape(shape), axis=0)
+            setattr(self, name, cube.astype(np.int32 if cube[-1].sum() <= np.iinfo(np.int32).max else np.int64))
+        self.arxiv_cells = _merge_cells(self.arxiv_cells, self._arxiv_cells(df, arxiv_shares, label_codes, focus_codes),
+                                        'share', sign)
+        self.dm_cells = _merge_cells(self.dm_cells, self._dm_cells(df, label_codes), 'counts', sign)
+
+    def _extend_years(self, first_year, last_year):
+        # Years before the range get prefix rows of zeros, years after it
+        # repeat the last row (nothing is added to them yet)
+        before, after = max(self.first_year - first_year, 0), max(last_year - self.last_year, 0)
+        for name in ('papers', 'unique_papers', 'citations'):
+            cube = getattr(self, name)
+            setattr(self, name, np.concatenate([np.zeros((before,) + cube.shape[1:], dtype=cube.dtype), cube,
+                                                np.repeat(cube[-1:], after, axis=0)]))
+        self.first_year, self.last_year = self.first_year - before, self.last_year + after
+
+    def _label_codes(self, df):
+        # Codes into self.labels of a prepared arxiv_category column; labels
+        # the cubes have not seen yet are appended
+        arxiv_category = df['arxiv_category'].cat.remove_unused_categories().cat
+        codes = pd.Index(self.labels).get_indexer(arxiv_category.categories)
+        new = arxiv_category.categories[codes < 0]
+        if len(new):
+            codes[codes < 0] = np.arange(len(self.labels), len(self.labels) + len(new))
+            self.labels = np.append(self.labels, np.asarray(new, dtype=object))
+            self._label_parts += [set(label.split(', ')) for label in new]
+            self.categories = sorted(set().union(*self._label_parts))
+        return codes[arxiv_category.codes.to_numpy()]
+
+    def _column_codes(self, label_codes, focus_codes):
+        # Cube columns of (label, focus) pairs; pairs without a column get a
+        # new, empty one
+        width = len(self.focus_labels) + 1
+        pairs = label_codes.astype(np.int64) * width + focus_codes
+        new = np.setdiff1d(pairs, self._column_label * width + self._column_focus)
+        if len(new):
+            label, focus = np.divmod(new, width)
+            self._column_label = np.append(self._column_label, label)
+            self._column_focus = np.append(self._column_focus, focus)
+            self._focus_columns = np.equal.outer(self._column_focus, np.arange(width)).astype(np.int64)
+            for name in ('papers', 'unique_papers', 'citations'):
+                cube = getattr(self, name)
+                setattr(self, name, np.pad(cube, ((0, 0), (0, len(new)))))
+        return pd.Index(self._column_label * width + self._column_focus).get_indexer(pairs)
+
+    def _label_mask(self, categories):
+        # arxiv_category labels that list any of the selected categories
+        if not categories:
+            return np.ones(len(self.labels), dtype=bool)
+        selected = set(categories)
+        return np.array([not selected.isdisjoint(parts) for parts in self._label_parts])
+
+    def _focus_mask(self, focus):
+        if not focus:
+            return np.ones(len(self.focus_labels) + 1, dtype=bool)
+        return np.append(np.isin(self.focus_labels, focus), False)
+
+    def _year_range(self, filters, after=None):
+        start, end = filters.get('years') or (self.first_year, self.last_year)
+        start = max(int(start), self.first_year, after + 1 if after is not None else self.first_year)
+        end = min(int(end), self.last_year)
+        return start, end
+
+    def _column_mask(self, filters):
+        return (self._label_mask(filters.get('categories'))[self._column_label]
+                & self._focus_mask(filters.get('focus'))[self._column_focus])
+
+    def _window(self, cube, filters, after=None):
+        # (years, per-year values) for the filtered window, shaped
+        # years x (arxiv_category, research_focus) with filtered-out columns zeroed
+        start, end = self._year_range(filters, after)
+        if start > end:
+            return np.arange(0, dtype=self.year_dtype), np.zeros((0,) + cube.shape[1:], dtype=cube.dtype)
+        block = np.diff(cube[start - self.first_year:end - self.first_year + 2], axis=0)
+        return np.arange(start, end + 1, dtype=self.year_dtype), block * self._column_mask(filters)
+
+    def totals(self, filters):
+        # (papers, citations) matching the filters, straight from the prefix sums
+        start, end = self._year_range(filters)
+        if start > end:
+            return 0, 0
+        mask = self._column_mask(filters)
+        i, j = start - self.first_year, end - self.first_year + 1
+        return (int((self.papers[j] - self.papers[i])[mask].sum()),
+                int((self.citations[j] - self.citations[i])[mask].sum()))
+
+    def publications(self, filters):
+        # Inputs of aggregates.publications_hover_tables for the filtered papers
+        years, block = self._window(self.papers, filters)
+        per_year = block.sum(axis=1)
+        publications_per_year = pd.DataFrame({'year': years, 'publication_count': per_year})[per_year > 0]
+
+        cells = self.arxiv_cells[self._cell_mask(self.arxiv_cells, filters)]
+        arxiv_distribution = cells.groupby(['year', 'category'])['share'].sum().reset_index()
+        arxiv_distribution.columns = ['year', 'arxiv_category', 'category_count']
+
+        titles = self.titles[self._cell_mask(self.titles, filters)]
+        return publications_per_year, arxiv_distribution, titles.groupby('year')['title'].agg('<br>'.join)
+
+    def _cell_mask(self, cells, filters):
+        # Rows of a sparse (year, label, focus, ...) cell list matching the filters
+        start, end = self._year_range(filters)
+        return (
+            cells['year'].between(start, end)
+            & self._label_mask(filters.get('categories'))[cells['label']]
+            & self._focus_mask(filters.get('focus'))[cells['focus']]
+        )
+
+    def dm_models_focus(self, filters):
+        # Same layout as aggregates.dm_models_focus_table
+        cells = self.dm_cells
+        cells = cells[self._cell_mask(cells, filters)]
+        research_focus = pd.Series(np.asarray(self.focus_labels, dtype=object)[cells['focus']], index=cells.index, name='research focus')
+        return cells.groupby(['year', 'category', research_focus])['counts'].sum().reset_index()
+
+    def _by_focus(self, cube, filters, after):
+        # Per-year values by research focus, and whether a (year, focus) group has any paper
+        years, block = self._window(cube, filters, after)
+        _, papers = self._window(self.papers, filters, after)
+        return years, (block @ self._focus_columns)[:, :-1], (papers @ self._focus_columns)[:, :-1] > 0
+
+    def _research_type_table(self, cube, filters, after, value_name):
+        years, values, present = self._by_focus(cube, filters, after)
+        year_index, focus_index = np.nonzero(present)
+        table = pd.DataFrame({
+            'year': years[year_index],
+            'category': np.asarray(self.focus_labels, dtype=object)[focus_index],
+            value_name: values[year_index, focus_index],
+        })
+        table.insert(2, 'research_type', table['category'].map(self.research_type))
+        return table.sort_values(['year', 'category'], kind='stable').reset_index(drop=True)
+
+    def theoretical_vs_experimental(self, filters, after):
+        # Same layout as aggregates.theoretical_vs_experimental_table
+        return self._research_type_table(self.unique_papers, filters, after, 'counts')
+
+    def theoretical_vs_experimental_citations(self, filters, after):
+        # Same layout as aggregates.theoretical_vs_experimental_citations_table
+        table = self._research_type_table(self.citations, filters, after, 'total_citations')
+        return table.astype({'total_citations': self.citations_dtype})
+
+    def citations_focus(self, filters, after):
+        # Same layout as aggregates.citations_focus_table
+        years, values, present = self._by_focus(self.citations, filters, after)
+        rows, columns = present.any(axis=1), present.any(axis=0)
+        labels = np.asarray(self.focus_labels, dtype=object)[columns]
+        order = np.argsort(labels, kind='stable')
+        table = pd.DataFrame(values[rows][:, columns][:, order].astype(self.citations_dtype), index=pd.Index(years[rows], name='year'),
+                             columns=pd.Index(labels[order], name='research_focus'))
+        return table
+
+
+def _merge_cells(cells, delta, value, sign):
+    # Sparse cell list with the `value` of `delta` added (sign 1) or taken out
+    # (sign -1); cells left empty are dropped
+    delta = delta.assign(**{value: sign * delta[value]})
+    merged = pd.concat([cells, delta], ignore_index=True)
+    merged = merged.groupby(['year', 'label', 'focus', 'category'])[value].sum().reset_index()
+    return merged[merged[value].round(9) != 0].reset_index(drop=True)
+
+
+def build(df, arxiv_shares, research_focus_labels, research_type, titles_max_papers):
+    return FilterCubes(df, arxiv_shares, research_focus_labels, research_type, titles_max_papers)
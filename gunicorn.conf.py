@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Production server configuration (preload and fork).
+#
+# The master process imports app.py once: the aggregate tables, indexes and
+# serialized figures are loaded before any worker exists, and every worker is
+# forked from it, sharing those pages copy-on-write instead of loading its own
+# copy. The large structures are numpy arrays and Arrow buffers rather than
+# columns of Python objects, so serving requests does not write to them;
+# refcount updates on the remaining objects are kept off the shared pages by
+# moving everything the master allocated into the permanent GC generation
+# (gc.freeze) right before forking, so the workers' garbage collector never
+# touches it.
+#
+# The static figures are loaded in the master from the file written by
+# `python aggregates.py build` (see app.py). Any figure missing from it, e.g.
+# after a change to app.py, is built in the master before the workers are
+# forked (FIGURE_BUILD=eager; a background thread would not survive the fork):
+# the server then starts accepting connections only once they are all built,
+# which takes about a minute at 1M papers (fig_1 alone is most of it), in
+# exchange for every worker sharing the same figures from the first request.
+# Set FIGURE_BUILD=lazy to serve right away and have each worker build a missing
+# figure on its first request instead. SQLite connections are opened lazily per
+# worker thread (search_index.py), so no connection is ever inherited across
+# the fork.
+#
+# Usage:
+#   gunicorn -c gunicorn.conf.py app:server
+#   WEB_CONCURRENCY=8 GUNICORN_THREADS=4 gunicorn -c gunicorn.conf.py app:server
+
+import gc
+import multiprocessing
+import os
+
+os.environ.setdefault('FIGURE_BUILD', 'eager')
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '8050')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+preload_app = True
+# Workers are cheap to fork from the loaded master, so recycle them now and
+# then to bound the memory they unshare over time
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+
+def when_ready(server):
+    # The app is loaded; freeze it before the first worker is forked
+    gc.collect()
+    gc.freeze()
+    server.log.info('Froze %d objects before forking %d workers', gc.get_freeze_count(), workers)
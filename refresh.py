@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Incremental refresh of the skeleton dataset from the ADS API.
+#
+# Instead of re-harvesting every dark matter paper, a refresh only asks ADS for
+# the records entered or re-indexed since the previous run (kept in
+# data_cache/refresh.json), extracts the entities of just those papers (from
+# their abstracts cleaned by clean_abstracts.py) and patches the columnar store:
+# changed bibcodes are replaced, new ones appended, and columns ADS does not
+# return (e.g. downloads) are carried over from the old rows. The patched
+# Parquet file becomes the new skeleton version in the manifest and a restarted
+# app picks it up.
+#
+# The search index is patched too: the FTS rows of the changed bibcodes are
+# deleted and re-inserted and new papers are appended (search_index.update), so
+# their relevance ranking by citations is only exact after a full
+# `python aggregates.py build`. So are the aggregate tables (aggregates.patch):
+# the per-year and per-category counts, the filter cubes and the entity trends
+# are adjusted by the delta, and only the tables that depend on the whole
+# corpus (the citation graph and its PageRank, the co-occurrence statistics and
+# the scatter index) are rebuilt. The static figures are then built again for
+# the new tables, and the files of the superseded version (its skeleton copies,
+# tables, search index and figures) are removed.
+#
+# The harvest itself goes through ads_harvester, so an interrupted refresh
+# resumes where it stopped when run again.
+#
+# Usage:
+#   ADS_API_TOKEN=... python refresh.py --since 2024-01-01   # first run
+#   ADS_API_TOKEN=... python refresh.py                      # later runs
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import ads_harvester
+import aggregates
+import arxiv_weights
+import clean_abstracts
+import columnar_store
+import data_loader
+import entities
+import search_index
+
+QUERY = 'full:"dark matter"'
+STATE_NAME = 'refresh.json'
+
+# ADS fields and the skeleton columns they fill
+FIELDS = {
+    'bibcode': 'bibcode',
+    'title': 'title',
+    'year': 'year',
+    'first_author': 'first_author',
+    'citation_count': 'citations',
+    'citation_count_norm': 'citations_normalized',
+    'read_count': 'reads',
+    'arxiv_class': 'arxiv_class',
+    'abstract': 'abstract',
+    'keyword_norm': 'keyword_norm',
+    'citation': 'citation',
+}
+
+def _state_path(cache_dir):
+    return os.path.join(cache_dir, STATE_NAME)
+
+
+def read_state(cache_dir=data_loader.DATA_CACHE_DIR):
+    try:
+        with open(_state_path(cache_dir)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_state(state, cache_dir):
+    columnar_store.write_atomic(_state_path(cache_dir), lambda f: json.dump(state, f, indent=2))
+
+
+def delta_query(since, query=QUERY):
+    # Records added (entdate) or changed (indexstamp) since `since`, an ISO
+    # timestamp such as 2024-01-01T00:00:00Z
+    return f'{query} (entdate:[{since[:10]} TO *] OR indexstamp:["{since}" TO *])'
+
+
+def paper_row(doc):
+    # ADS document -> skeleton row (column name -> value)
+    row = {column: doc.get(field) for field, column in FIELDS.items()}
+    if isinstance(row['title'], list):
+        row['title'] = row['title'][0] if row['title'] else None
+    try:
+        row['year'] = int(row['year'])
+    except (TypeError, ValueError):
+        row['year'] = None
+    if row['arxiv_class']:
+        row['arxiv_category'] = [arxiv_weights.category(arxiv_class) for arxiv_class in row['arxiv_class']]
+    return row
+
+
+def delta_table(rows, base):
+    # Rows in the schema of the base table; columns the harvest does not
+    # provide keep their old value for known bibcodes and are null for new ones
+    bibcodes = pa.array([row['bibcode'] for row in rows], pa.string())
+    existing = pc.index_in(bibcodes, value_set=base.column('bibcode'))
+    harvested = set(FIELDS.values()).union(*rows)
+    arrays = []
+    for field in base.schema:
+        if field.name in harvested:
+            values = [row.get(field.name) for row in rows]
+            if pa.types.is_dictionary(field.type):
+                array = pa.array(values, field.type.value_type).dictionary_encode()
+            else:
+                array = pa.array(values, field.type)
+        else:
+            array = base.column(field.name).take(existing)
+        arrays.append(array)
+    return pa.table(arrays, names=base.schema.names)
+
+
+def patch(base, delta):
+    # Replace the papers in `delta` and append the new ones
+    keep = pc.invert(pc.is_in(base.column('bibcode'), value_set=delta.column('bibcode')))
+    return pa.concat_tables([base.filter(keep), delta.cast(base.schema)])
+
+
+def refresh(since=None, query=QUERY, cache_dir=data_loader.DATA_CACHE_DIR, workers=ads_harvester.WORKERS,
+            api_url=None):
+    state = read_state(cache_dir)
+    since = since or state.get('last_run')
+    if since is None:
+        raise ValueError('no previous refresh recorded; pass --since for the first run')
+    if len(since) == 10:
+        since += 'T00:00:00Z'
+    started = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+    # The harvest directory depends on `since` only, so a rerun after a crash
+    # resumes the same harvest
+    harvest_dir = os.path.join(cache_dir, 'refresh-' + since.replace(':', '').replace('-', ''))
+    harvester = ads_harvester.Harvester(delta_query(since, query), harvest_dir, fields=list(FIELDS), workers=workers,
+                                        api_url=api_url)
+    harvester.run()
+
+    base_path = columnar_store.columnar_path('skeleton', cache_dir)
+    base = pq.read_table(base_path)
+    # iter_docs yields each bibcode once, even if it moved between pages
+    rows = [paper_row(doc) for doc in ads_harvester.iter_docs(harvest_dir) if doc.get('bibcode')]
+    # Entities are only extracted for the harvested papers, from the cleaned
+    # abstracts (markup stripped, acronyms expanded) like the batch pipeline
+    cleaned = [clean_abstracts.clean(row['abstract'])[0] for row in rows]
+    extracted = entities.extract_all(cleaned, entities.vocabularies(base))
+    for column, values in extracted.items():
+        for row, value in zip(rows, values):
+            row[column] = value
+
+    if rows:
+        delta = delta_table(rows, base)
+        added = len(rows) - pc.sum(pc.is_in(delta.column('bibcode'), value_set=base.column('bibcode'))).as_py()
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.refresh-', suffix='.tmp')
+        os.close(fd)
+        columnar_store.write_table(patch(base, delta), tmp_path)
+        old_version = data_loader.dataset_version('skeleton', cache_dir)
+        old_index = search_index.index_path(old_version, cache_dir)
+        data_loader.add_file('skeleton', tmp_path, '.parquet', cache_dir)
+        aggregates.patch_for_cached_skeleton(old_version, delta.column('bibcode').to_pylist(), cache_dir)
+        new_index = search_index.index_path(data_loader.dataset_version('skeleton', cache_dir), cache_dir)
+        if os.path.exists(old_index):
+            search_index.update(old_index, new_index, base, delta)
+        else:
+            search_index.build_for_cached_skeleton(cache_dir)
+        aggregates.build_figures(cache_dir)
+        print(f'{len(rows) - added} papers updated, {added} added')
+    else:
+        old_version = None
+        print('No new or changed papers')
+
+    state.update({'last_run': started, 'since': since, 'papers': len(rows),
+                  'version': data_loader.dataset_version('skeleton', cache_dir)})
+    _write_state(state, cache_dir)
+    prune(old_version, cache_dir)
+    shutil.rmtree(harvest_dir, ignore_errors=True)
+    return state
+
+
+def prune(version, cache_dir=data_loader.DATA_CACHE_DIR):
+    # Remove the files of a skeleton version the manifest no longer points to:
+    # the file itself and its Parquet and Arrow copies, and the tables, search
+    # index and figures built from it. Running workers that mapped the old
+    # Arrow file keep reading it until they restart
+    if version is None or version == data_loader.dataset_version('skeleton', cache_dir):
+        return []
+    patterns = [f'{version}.*', f'aggregates-{version}-v*.pkl', f'figures-{version}-v*.pkl',
+                os.path.basename(search_index.index_path(version, cache_dir))]
+    removed = [path for pattern in patterns for path in glob.glob(os.path.join(glob.escape(cache_dir), pattern))]
+    for path in removed:
+        os.remove(path)
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fetch and apply the ADS records changed since the last refresh.')
+    parser.add_argument('--since', help='YYYY-MM-DD or ISO timestamp (default: the start of the previous refresh)')
+    parser.add_argument('--query', default=QUERY, help='base ADS query')
+    parser.add_argument('--workers', type=int, default=ads_harvester.WORKERS, help='concurrent requests')
+    parser.add_argument('--api-url', default=None, help='search endpoint (default: $ADS_API_URL or the public API)')
+    args = parser.parse_args(argv)
+    print(json.dumps(refresh(args.since, args.query, workers=args.workers, api_url=args.api_url), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Rendering backend for the large scatter and line figures.
+#
+# SVG traces (go.Scatter) get slow to draw and hit-test once a figure holds a
+# few thousand points; WebGL traces (go.Scattergl) take the same properties and
+# stay interactive. PLOT_RENDER_MODE picks the backend:
+#   auto  - WebGL from WEBGL_POINT_THRESHOLD points on (default)
+#   svg   - always SVG
+#   webgl - always WebGL
+
+import os
+
+import plotly.graph_objects as go
+
+RENDER_MODES = ('auto', 'svg', 'webgl')
+RENDER_MODE = os.environ.get('PLOT_RENDER_MODE', 'auto')
+WEBGL_POINT_THRESHOLD = int(os.environ.get('WEBGL_POINT_THRESHOLD', 1000))
+
+if RENDER_MODE not in RENDER_MODES:
+    raise ValueError(f"PLOT_RENDER_MODE must be one of {', '.join(RENDER_MODES)}, got {RENDER_MODE!r}")
+
+
+def use_webgl(n_points):
+    return RENDER_MODE == 'webgl' or (RENDER_MODE == 'auto' and n_points >= WEBGL_POINT_THRESHOLD)
+
+
+def scatter(n_points, **kwargs):
+    # go.Scatter or go.Scattergl with the same styling, depending on the size
+    trace_class = go.Scattergl if use_webgl(n_points) else go.Scatter
+    return trace_class(**kwargs)
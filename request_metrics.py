@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Request-level latency and payload histograms in the Prometheus text format.
+#
+# Every Flask request is timed per route (the URL rule, so /_figures/<name>.json
+# is one series) together with the size of the response body. Dash callbacks
+# all go through /_dash-update-component, so server-side callbacks are also
+# timed individually: app.callback is wrapped before the callbacks are
+# registered, the function time is recorded per callback name, and the rest of
+# the request (Dash dispatch and JSON serialization of the result) and the
+# payload size are attributed to the same callback. Callbacks driven by
+# url.pathname (display_page) are additionally labelled with the page, one of
+# the app's routes or UNKNOWN_PAGE, so arbitrary URLs cannot use up the series.
+#
+# The histograms live in an anonymous shared memory mapping created at import,
+# so when a preloading server forks its workers (see gunicorn.conf.py) all of
+# them count into the same buckets and /_metrics reports the whole server, not
+# the worker that happened to answer the scrape. Dash already serves a page at
+# /metrics, hence the underscore.
+#
+# Usage:
+#   curl localhost:8050/_metrics
+
+import mmap
+import multiprocessing
+import threading
+import time
+from functools import wraps
+
+import flask
+import numpy as np
+
+METRICS_ROUTE = '/_metrics'
+DASH_UPDATE_ROUTE = '/_dash-update-component'
+UNMATCHED_ROUTE = '<unmatched>'
+UNKNOWN_PAGE = '<unknown>'
+OVERFLOW_KEY = 'overflow="true"'
+SERIES_CAPACITY = 256  # label sets per histogram; later ones are counted under OVERFLOW_KEY
+KEY_BYTES = 256
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class SharedHistogram:
+    # Label set -> bucket counts, sum and count, in memory shared by forked
+    # processes. Rows are claimed on first use; the label sets themselves are
+    # stored next to the counts so every process can find the rows the others
+    # claimed.
+    def __init__(self, name, help_text, buckets, capacity=SERIES_CAPACITY):
+        self.name, self.help_text = name, help_text
+        self.buckets = np.asarray(buckets, dtype=np.float64)
+        self.capacity = capacity
+        # Per row: one count per bucket plus +Inf, then the sum
+        width = len(buckets) + 2
+        self._memory = mmap.mmap(-1, 8 + capacity * (KEY_BYTES + 8 * width))
+        self._used = np.frombuffer(self._memory, dtype=np.int64, count=1)
+        self._keys = np.frombuffer(self._memory, dtype=f'S{KEY_BYTES}', count=capacity, offset=8)
+        self._values = np.frombuffer(self._memory, dtype=np.float64, count=capacity * width,
+                                     offset=8 + capacity * KEY_BYTES).reshape(capacity, width)
+        self._lock = multiprocessing.Lock()
+        self._rows = {}  # this process's cache of key -> row
+
+    def _row(self, key):
+        row = self._rows.get(key)
+        if row is not None:
+            return row
+        encoded = key.encode()[:KEY_BYTES]
+        used = int(self._used[0])
+        found = np.flatnonzero(self._keys[:used] == encoded)
+        if len(found):
+            row = int(found[0])
+        elif used < self.capacity - 1:
+            row = used
+            self._keys[row] = encoded
+            self._used[0] = used + 1
+        else:
+            # The last row collects every label set beyond the capacity
+            row = self.capacity - 1
+            self._keys[row] = OVERFLOW_KEY.encode()
+        self._rows[key] = row
+        return row
+
+    def observe(self, key, value):
+        bucket = int(np.searchsorted(self.buckets, value))
+        with self._lock:
+            row = self._row(key)
+            self._values[row, bucket] += 1
+            self._values[row, -1] += value
+
+    def exposition(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            keys = [key.decode() for key in self._keys[:int(self._used[0])]]
+            if self._keys[-1]:
+                keys.append(self._keys[-1].decode())
+            values = self._values[:len(keys)].copy()
+        for key, row in zip(keys, values):
+            cumulative = np.cumsum(row[:-1])
+            for le, count in zip([f'{b:g}' for b in self.buckets] + ['+Inf'], cumulative):
+                lines.append(f'{self.name}_bucket{{{key},le="{le}"}} {count:.0f}')
+            lines.append(f'{self.name}_sum{{{key}}} {row[-1]:.6g}')
+            lines.append(f'{self.name}_count{{{key}}} {cumulative[-1]:.0f}')
+        return lines
+
+
+REQUEST_SECONDS = SharedHistogram('http_request_duration_seconds', 'Flask request latency by route.',
+                                  LATENCY_BUCKETS)
+RESPONSE_BYTES = SharedHistogram('http_response_size_bytes', 'Response body size by route.', SIZE_BUCKETS)
+CALLBACK_SECONDS = SharedHistogram('dash_callback_duration_seconds', 'Time spent in the Dash callback function.',
+                                   LATENCY_BUCKETS)
+CALLBACK_SERIALIZATION_SECONDS = SharedHistogram(
+    'dash_callback_serialization_seconds',
+    'Rest of the callback request: Dash dispatch and JSON serialization of the result.', LATENCY_BUCKETS)
+CALLBACK_BYTES = SharedHistogram('dash_callback_response_size_bytes', 'Callback response body size.', SIZE_BUCKETS)
+HISTOGRAMS = [REQUEST_SECONDS, RESPONSE_BYTES, CALLBACK_SECONDS, CALLBACK_SERIALIZATION_SECONDS, CALLBACK_BYTES]
+
+_local = threading.local()
+_pages = dict  # returns the known pathnames, see init_app
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def timed(func):
+    # Records the callback's own run time for the request being served
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.callback = (func.__name__, time.perf_counter() - start)
+    return wrapper
+
+
+def _callback_key(name):
+    key = f'callback="{_label(name)}"'
+    body = flask.request.get_json(silent=True) or {}
+    for item in body.get('inputs', []):
+        if isinstance(item, dict) and item.get('property') == 'pathname':
+            page = item.get('value')
+            key += f',page="{_label(page if page in _pages() else UNKNOWN_PAGE)}"'
+            break
+    return key
+
+
+def _before_request():
+    flask.g.request_metrics_start = time.perf_counter()
+    _local.callback = None
+
+
+def _after_request(response):
+    start = flask.g.pop('request_metrics_start', None)
+    if start is None:
+        return response
+    elapsed = time.perf_counter() - start
+    rule = flask.request.url_rule
+    route = rule.rule if rule is not None else UNMATCHED_ROUTE
+    if response.content_length is not None:
+        size = response.content_length
+    elif response.direct_passthrough:
+        size = 0  # streamed file, not worth reading here
+    else:
+        size = len(response.get_data())
+    key = f'route="{_label(route)}"'
+    REQUEST_SECONDS.observe(key, elapsed)
+    RESPONSE_BYTES.observe(key, size)
+
+    callback, _local.callback = getattr(_local, 'callback', None), None
+    if callback is not None and route == DASH_UPDATE_ROUTE:
+        name, seconds = callback
+        key = _callback_key(name)
+        CALLBACK_SECONDS.observe(key, seconds)
+        CALLBACK_SERIALIZATION_SECONDS.observe(key, max(elapsed - seconds, 0.0))
+        CALLBACK_BYTES.observe(key, size)
+    return response
+
+
+def _respond():
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.exposition())
+    return flask.Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+
+def init_app(app, pages=dict):
+    # Call right after creating the Dash app, before any callback is registered.
+    # `pages` returns the pathnames to label callbacks with (the routes table
+    # may not exist yet); any other pathname is counted as UNKNOWN_PAGE
+    global _pages
+    _pages = pages
+    server = app.server
+    server.before_request(_before_request)
+    server.after_request(_after_request)
+    server.add_url_rule(METRICS_ROUTE, 'request_metrics', _respond)
+
+    register = app.callback
+
+    @wraps(register)
+    def callback(*args, **kwargs):
+        decorator = register(*args, **kwargs)
+
+        def wrap(func):
+            decorator(timed(func))
+            return func
+        return wrap
+
+    app.callback = callback
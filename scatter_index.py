@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Spatial index for the citations vs. downloads bubble chart (fig_4).
+#
+# Papers are bucketed on a uniform grid in log10(x) / log10(y) space and stored
+# sorted by grid cell, so a viewport query only touches the cells it overlaps:
+# each grid row is one contiguous slice of the sorted arrays. The index also
+# keeps a log-binned 2D histogram of the whole corpus for the zoomed-out view.
+
+import numpy as np
+import pandas as pd
+
+GRID_SIZE = 128  # index cells per axis
+DENSITY_BINS = 60  # histogram bins per axis for the overview
+
+
+class ScatterIndex:
+    def __init__(self, frame, x, y, size, hover_columns, grid_size=GRID_SIZE, density_bins=DENSITY_BINS):
+        # Log axes cannot show zero or negative values, so those papers are left out
+        frame = frame[(frame[x] > 0) & (frame[y] > 0)]
+        self.x_name, self.y_name, self.size_name = x, y, size
+        self.hover_columns = list(hover_columns)
+
+        log_x = np.log10(frame[x].to_numpy(dtype=np.float64))
+        log_y = np.log10(frame[y].to_numpy(dtype=np.float64))
+        self.bounds = (log_x.min(), log_x.max(), log_y.min(), log_y.max()) if len(frame) else (0.0, 1.0, 0.0, 1.0)
+        self.grid_size = grid_size
+
+        cells = self._cell(log_x, 0) * grid_size + self._cell(log_y, 2)
+        order = np.argsort(cells, kind='stable')
+        self.cell_start = np.searchsorted(cells[order], np.arange(grid_size * grid_size + 1))
+        self.log_x = log_x[order]
+        self.log_y = log_y[order]
+        self.points = frame[[x, y, size] + self.hover_columns].iloc[order].reset_index(drop=True)
+        # Text hover columns as Arrow strings instead of one Python object per
+        # paper, so the points stay shared between forked server workers
+        for column in self.hover_columns:
+            if self.points[column].dtype == object:
+                self.points[column] = self.points[column].astype('string[pyarrow]')
+
+        # Overview: log-spaced histogram edges in data units
+        self.x_edges = np.logspace(self.bounds[0], self.bounds[1], density_bins + 1)
+        self.y_edges = np.logspace(self.bounds[2], self.bounds[3], density_bins + 1)
+        self.density, _, _ = np.histogram2d(self.log_x, self.log_y, bins=[np.log10(self.x_edges), np.log10(self.y_edges)])
+
+    def _cell(self, values, axis):
+        low, high = self.bounds[axis], self.bounds[axis + 1]
+        scale = self.grid_size / (high - low) if high > low else 0.0
+        return np.clip(((values - low) * scale).astype(np.int64), 0, self.grid_size - 1)
+
+    def __len__(self):
+        return len(self.points)
+
+    def outliers(self, n):
+        # The n most cited papers
+        n = min(n, len(self.points))
+        top = np.argpartition(-self.points[self.size_name].to_numpy(), n - 1)[:n] if n else []
+        return self.points.iloc[np.sort(top)]
+
+    def query(self, x_range, y_range, budget):
+        # Papers inside the (log10) viewport and how many there are in total; when
+        # more than `budget` match, only the most cited ones are returned
+        x0, x1 = sorted(x_range)
+        y0, y1 = sorted(y_range)
+        first_column, last_column = self._cell(np.array([x0, x1]), 0)
+        first_row, last_row = self._cell(np.array([y0, y1]), 2)
+
+        # Cells are ordered x-major, so each grid column is one contiguous slice
+        columns = np.arange(first_column, last_column + 1) * self.grid_size
+        starts = self.cell_start[columns + first_row]
+        stops = self.cell_start[columns + last_row + 1]
+        candidates = np.concatenate([np.arange(start, stop) for start, stop in zip(starts, stops)])
+
+        inside = candidates[
+            (self.log_x[candidates] >= x0) & (self.log_x[candidates] <= x1)
+            & (self.log_y[candidates] >= y0) & (self.log_y[candidates] <= y1)
+        ]
+        total = len(inside)
+        if total > budget:
+            sizes = self.points[self.size_name].to_numpy()[inside]
+            inside = np.sort(inside[np.argpartition(-sizes, budget - 1)[:budget]])
+        return self.points.iloc[inside], total
+
+
+def build(frame, x='citations_normalized', y='downloads', size='citations', hover_columns=('title', 'first_author', 'year')):
+    return ScatterIndex(pd.DataFrame(frame), x, y, size, hover_columns)
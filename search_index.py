@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Full-text search over titles, abstracts and keywords (SQLite FTS5).
+#
+# The index is an on-disk SQLite file next to the other cached data
+# (data_cache/search-<skeleton sha256>.sqlite), built once from the Parquet store
+# in record batches. Paper metadata lives in a plain table and the text in a
+# contentless FTS5 table with the same rowids, so a query is one MATCH ranked by
+# bm25 plus a rowid join; the pandas frame is never touched.
+#
+# Rowids follow the citation rank (1 = most cited paper) and FTS5 returns
+# matches in rowid order, so the most cited matches come first for free. A
+# query only scores its RANKED_CANDIDATES most cited matches with bm25; broad
+# queries ("dark matter" hits nearly every paper) would otherwise score the
+# whole corpus.
+#
+# The index is built offline (here or by `python aggregates.py build`) and
+# shipped like the aggregate pickle; SEARCH_INDEX_PATH points the app at a
+# prebuilt file. The web app never builds it: without an index, /search and
+# /api/search report it as unavailable.
+#
+# Usage:
+#   python search_index.py build           # build for the cached skeleton
+#   python search_index.py "dark photon"   # query it
+
+import json
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import flask
+import numpy as np
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import columnar_store
+import data_loader
+
+API_ROUTE = '/api/search'
+BATCH_SIZE = 10000
+MAX_RESULTS = 100
+RANKED_CANDIDATES = 2000
+UNAVAILABLE = 'search index unavailable'
+
+# Set to a prebuilt index file to skip the version lookup entirely
+SEARCH_INDEX_PATH = os.environ.get('SEARCH_INDEX_PATH')
+
+# bm25 column weights, in FTS column order: title, abstract, keywords
+COLUMN_WEIGHTS = (10.0, 1.0, 5.0)
+
+SCHEMA = """
+CREATE TABLE papers (
+    rowid INTEGER PRIMARY KEY,
+    bibcode TEXT,
+    title TEXT,
+    year INTEGER,
+    citations INTEGER,
+    arxiv_class TEXT
+);
+CREATE VIRTUAL TABLE papers_fts USING fts5(
+    title, abstract, keywords, content='', tokenize='porter unicode61 remove_diacritics 2'
+);
+"""
+
+_local = threading.local()
+
+
+def index_path(version, cache_dir=data_loader.DATA_CACHE_DIR):
+    return os.path.join(cache_dir, f'search-{version}.sqlite')
+
+
+def _joined(table, column):
+    # list<string> columns become one ', '-separated string per paper
+    if column not in table.schema.names:
+        return [None] * table.num_rows
+    return pc.binary_join(table.column(column), ', ').to_pylist()
+
+
+def _fts_values(batch):
+    # (title, abstract, keywords) per paper, as indexed
+    n = batch.num_rows
+    titles = batch.column('title').to_pylist() if 'title' in batch.schema.names else [None] * n
+    abstracts = batch.column('abstract').to_pylist() if 'abstract' in batch.schema.names else [None] * n
+    return zip(titles, abstracts, _joined(batch, 'keyword_norm'))
+
+
+def _insert(connection, rowids, batch):
+    table = batch.to_pydict()
+    connection.executemany(
+        'INSERT INTO papers VALUES (?, ?, ?, ?, ?, ?)',
+        zip(rowids, table['bibcode'], table['title'], table['year'], table['citations'], _joined(batch, 'arxiv_class')),
+    )
+    connection.executemany(
+        'INSERT INTO papers_fts (rowid, title, abstract, keywords) VALUES (?, ?, ?, ?)',
+        ((rowid, *values) for rowid, values in zip(rowids, _fts_values(batch))),
+    )
+
+
+def build(parquet_path, dest_path):
+    dest_dir = os.path.dirname(dest_path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix='.search-', suffix='.tmp')
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(tmp_path)
+        connection.executescript(SCHEMA)
+        parquet = pq.ParquetFile(parquet_path)
+        columns = [c for c in ('bibcode', 'title', 'year', 'citations', 'arxiv_class', 'abstract', 'keyword_norm')
+                   if c in parquet.schema_arrow.names]
+        # rowid = citation rank, ties broken by dataset order
+        citations = pq.read_table(parquet_path, columns=['citations']).column('citations').to_numpy(zero_copy_only=False)
+        order = np.argsort(-np.nan_to_num(citations.astype(np.float64)), kind='stable')
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(1, len(order) + 1)
+        offset = 0
+        for batch in parquet.iter_batches(batch_size=BATCH_SIZE, columns=columns):
+            _insert(connection, ranks[offset:offset + batch.num_rows].tolist(), batch)
+            offset += batch.num_rows
+        connection.execute("INSERT INTO papers_fts (papers_fts) VALUES ('optimize')")
+        connection.commit()
+        connection.close()
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return dest_path
+
+
+def update(old_path, dest_path, base, delta):
+    # Copy of the index at `old_path` (built from the pyarrow table `base`)
+    # with the papers of `delta` replaced or added. The contentless FTS table
+    # only forgets a row when given the values it indexed, which come from
+    # `base`. Replaced papers keep their rowid and new ones are appended after
+    # the last, so new papers rank as the least cited until the next full build.
+    dest_dir = os.path.dirname(dest_path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix='.search-', suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(old_path, tmp_path)
+        connection = sqlite3.connect(tmp_path)
+        changed = base.filter(pc.is_in(base.column('bibcode'), value_set=delta.column('bibcode')))
+        rowids = dict(connection.execute(
+            'SELECT bibcode, rowid FROM papers WHERE bibcode IN (SELECT value FROM json_each(?))',
+            (json.dumps(changed.column('bibcode').to_pylist()),),
+        ))
+        old_rowids = [rowids.get(bibcode) for bibcode in changed.column('bibcode').to_pylist()]
+        connection.executemany(
+            "INSERT INTO papers_fts (papers_fts, rowid, title, abstract, keywords) VALUES ('delete', ?, ?, ?, ?)",
+            ((rowid, *values) for rowid, values in zip(old_rowids, _fts_values(changed)) if rowid is not None),
+        )
+        connection.executemany('DELETE FROM papers WHERE rowid = ?', ((rowid,) for rowid in old_rowids if rowid is not None))
+        last = connection.execute('SELECT COALESCE(MAX(rowid), 0) FROM papers').fetchone()[0]
+        new_rowids = []
+        for bibcode in delta.column('bibcode').to_pylist():
+            if rowids.get(bibcode) is None:
+                last += 1
+                rowids[bibcode] = last
+            new_rowids.append(rowids[bibcode])
+        for batch in delta.to_batches(max_chunksize=BATCH_SIZE):
+            _insert(connection, new_rowids[:batch.num_rows], batch)
+            new_rowids = new_rowids[batch.num_rows:]
+        connection.commit()
+        connection.close()
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return dest_path
+
+
+def build_for_cached_skeleton(cache_dir=data_loader.DATA_CACHE_DIR):
+    parquet_path = columnar_store.columnar_path('skeleton', cache_dir)
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    return build(parquet_path, index_path(version, cache_dir))
+
+
+def find(cache_dir=data_loader.DATA_CACHE_DIR):
+    # Path of the prebuilt search index for the current dataset version (or
+    # SEARCH_INDEX_PATH), None if there is none; never fetches or builds
+    if SEARCH_INDEX_PATH:
+        return SEARCH_INDEX_PATH if os.path.exists(SEARCH_INDEX_PATH) else None
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    if version is not None and os.path.exists(index_path(version, cache_dir)):
+        return index_path(version, cache_dir)
+    return None
+
+
+def match_expression(query):
+    # User text -> FTS5 query: every word must match, the last one as a prefix
+    # (so results follow the typing), and FTS5 operators are never interpreted
+    words = re.findall(r'\w+', query)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _connection(db_path):
+    # One read-only connection per thread and index file
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    if db_path not in connections:
+        connections[db_path] = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    return connections[db_path]
+
+
+def search(db_path, query, limit=20, offset=0):
+    expression = match_expression(query)
+    if expression is None:
+        return []
+    connection = _connection(db_path)
+    limit = max(0, min(limit, MAX_RESULTS))
+    offset = max(0, offset)
+
+    # Rowid of the RANKED_CANDIDATES-th most cited match, if there are that many
+    cutoff = connection.execute(
+        'SELECT rowid FROM papers_fts WHERE papers_fts MATCH ? LIMIT 1 OFFSET ?',
+        (expression, RANKED_CANDIDATES - 1),
+    ).fetchone()
+    weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS)
+    rows = connection.execute(
+        f"""
+        SELECT p.bibcode, p.title, p.year, p.citations, p.arxiv_class, ranked.score
+        FROM (
+            SELECT rowid, bm25(papers_fts, {weights}) AS score
+            FROM papers_fts
+            WHERE papers_fts MATCH ? AND rowid <= ?
+            ORDER BY score
+            LIMIT ? OFFSET ?
+        ) AS ranked
+        JOIN papers p ON p.rowid = ranked.rowid
+        ORDER BY ranked.score
+        """,
+        (expression, cutoff[0] if cutoff else sys.maxsize, limit, offset),
+    ).fetchall()
+    return [
+        {'bibcode': bibcode, 'title': title, 'year': year, 'citations': citations,
+         'arxiv_class': arxiv_class, 'score': round(-score, 3)}
+        for bibcode, title, year, citations, arxiv_class, score in rows
+    ]
+
+
+def init_app(server, db_path):
+    def respond():
+        args = flask.request.args
+        if db_path is None:
+            return flask.jsonify({'query': args.get('q', ''), 'error': UNAVAILABLE}), 503
+        start = time.perf_counter()
+        results = search(db_path, args.get('q', ''), args.get('limit', 20, type=int), args.get('offset', 0, type=int))
+        return flask.jsonify({
+            'query': args.get('q', ''),
+            'results': results,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+        })
+
+    server.add_url_rule(API_ROUTE, 'search', respond)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit('usage: python search_index.py build | <query>')
+    if sys.argv[1] == 'build':
+        print(build_for_cached_skeleton())
+    else:
+        for result in search(find() or build_for_cached_skeleton(), ' '.join(sys.argv[1:])):
+            print(f"{result['year']}  {result['citations']:>6}  {result['title']}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Opt-in startup timing report.
+#
+# With STARTUP_PROFILE=1 every startup stage wrapped in stage() (download,
+# Parquet conversion and parsing, each aggregate table, each figure build and
+# its serialization) logs its wall time and memory to stderr as it finishes:
+# the resident set size after the stage, the change during the stage and the
+# process peak so far. A summary follows once app.py has been imported, and the
+# recorded stages are served as JSON from /_startup. Without the variable,
+# stage() does nothing.
+#
+# Usage:
+#   STARTUP_PROFILE=1 python app.py
+
+import contextlib
+import os
+import resource
+import sys
+import threading
+import time
+
+import flask
+
+ENABLED = os.environ.get('STARTUP_PROFILE', '') not in ('', '0')
+ROUTE = '/_startup'
+MB = 1024 * 1024
+
+_stages = []
+_local = threading.local()
+_started = time.perf_counter()
+
+
+def _rss():
+    # Current resident set size in bytes (Linux), else the peak
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return _peak()
+
+
+def _peak():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@contextlib.contextmanager
+def stage(name):
+    if not ENABLED:
+        yield
+        return
+    depth = getattr(_local, 'depth', 0)
+    _local.depth = depth + 1
+    rss_before = _rss()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        rss = _rss()
+        record = {
+            'stage': name,
+            'depth': depth,
+            'thread': threading.current_thread().name,
+            'seconds': round(time.perf_counter() - start, 4),
+            'rss_mb': round(rss / MB, 1),
+            'rss_delta_mb': round((rss - rss_before) / MB, 1),
+            'peak_mb': round(_peak() / MB, 1),
+        }
+        _stages.append(record)
+        print(_format(record), file=sys.stderr, flush=True)
+
+
+def _format(record):
+    return (f"[startup] {'  ' * record['depth']}{record['stage']:<{44 - 2 * record['depth']}} "
+            f"{record['seconds']:8.3f} s  rss {record['rss_mb']:8.1f} MB ({record['rss_delta_mb']:+.1f})  "
+            f"peak {record['peak_mb']:8.1f} MB")
+
+
+def stages():
+    return list(_stages)
+
+
+def summary(label='ready'):
+    # Top-level stages sorted by time, then the total since this module was imported
+    if not ENABLED:
+        return
+    top = sorted((record for record in _stages if record['depth'] == 0), key=lambda r: -r['seconds'])
+    print('[startup] slowest stages:', file=sys.stderr)
+    for record in top[:10]:
+        print(_format(record), file=sys.stderr)
+    print(f'[startup] {label} after {time.perf_counter() - _started:.2f} s, rss {_rss() / MB:.1f} MB, '
+          f'peak {_peak() / MB:.1f} MB', file=sys.stderr, flush=True)
+
+
+def init_app(server):
+    def respond():
+        if not ENABLED:
+            flask.abort(404)
+        return flask.jsonify({'stages': stages(), 'rss_mb': round(_rss() / MB, 1), 'peak_mb': round(_peak() / MB, 1)})
+
+    server.add_url_rule(ROUTE, 'startup_profile', respond)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The harvester against a local mock of the ADS search API: throttling with
+# Retry-After, resuming an interrupted harvest from its checkpoint, and both
+# shard formats.
+#
+# Usage:
+#   python -m pytest tests
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pyarrow.parquet as pq
+import pytest
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ads_harvester  # noqa: E402
+
+DOCS = [{'bibcode': f'2024Mock..{i:09d}', 'title': [f'Paper {i}'], 'year': '2024', 'citation_count': i}
+        for i in range(40)]
+ROWS = 2
+FIELDS = ['bibcode', 'title', 'year', 'citation_count']
+
+
+class MockADS(BaseHTTPRequestHandler):
+    # Answers from DOCS after the server's `delay`; its `responses` maps a
+    # start offset to a list of (status, headers) answers given before the
+    # real page, and `refused` records when those were sent
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        start, rows = int(params['start'][0]), int(params['rows'][0])
+        fields = params['fl'][0].split(',')
+        with self.server.lock:
+            self.server.requests.append((time.monotonic(), start))
+            answers = self.server.responses.get(start)
+            status, headers = answers.pop(0) if answers else (200, {})
+        if status == 200:
+            docs = [{field: doc[field] for field in fields if field in doc} for doc in DOCS[start:start + rows]]
+            body = json.dumps({'response': {'numFound': len(DOCS), 'start': start, 'docs': docs}}).encode()
+            time.sleep(self.server.delay)
+        else:
+            body = b'{}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if status != 200:
+            self.server.refused.append(time.monotonic())
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockADS)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = {}
+    server.refused = []
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def harvester(server, out_dir, **kwargs):
+    return ads_harvester.Harvester('dark matter', str(out_dir), fields=FIELDS, rows=ROWS, token='test',
+                                   api_url=f'http://127.0.0.1:{server.server_port}/search', **kwargs)
+
+
+def test_retry_delay():
+    response = requests.Response()
+    response.headers['Retry-After'] = '7'
+    assert ads_harvester.retry_delay(response, 0) == 7.0
+    response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert ads_harvester.retry_delay(response, 0) == 0.0
+    assert ads_harvester.retry_delay(None, 3) == 8.0
+
+
+def test_retry_after_holds_back_every_worker(server, tmp_path):
+    # Page 1 is throttled once; the Retry-After must keep the other workers
+    # from sending requests too, apart from those already in flight when the
+    # 429 arrived. Slow pages leave them enough work to show it
+    server.responses[ROWS] = [(429, {'Retry-After': '0.5'})]
+    server.delay = 0.02
+    harvester(server, tmp_path, workers=4).run()
+    assert sorted(doc['bibcode'] for doc in ads_harvester.iter_docs(str(tmp_path))) == [doc['bibcode'] for doc in DOCS]
+
+    refused = server.refused[0]
+    assert [start for sent, start in server.requests if refused + 0.05 < sent < refused + 0.45] == []
+    assert len(server.requests) == len(DOCS) // ROWS + 1
+
+
+def test_resumes_from_checkpoint(server, tmp_path):
+    pages = len(DOCS) // ROWS
+    server.responses[5 * ROWS] = [(500, {})]
+    with pytest.raises(requests.HTTPError):
+        harvester(server, tmp_path, workers=1, max_retries=0).run()
+    checkpoint = json.load(open(tmp_path / ads_harvester.CHECKPOINT_NAME))
+    assert checkpoint['num_found'] == len(DOCS)
+    done = set(checkpoint['pages_done'])
+    assert 5 not in done
+
+    server.requests.clear()
+    harvester(server, tmp_path, workers=1).run()
+    assert sorted(start // ROWS for _, start in server.requests) == sorted(set(range(pages)) - done)
+    assert [doc['bibcode'] for doc in ads_harvester.iter_docs(str(tmp_path))] == [doc['bibcode'] for doc in DOCS]
+
+
+def test_checkpoint_of_another_harvest(server, tmp_path):
+    harvester(server, tmp_path).run()
+    with pytest.raises(ValueError):
+        harvester(server, tmp_path, fmt='parquet').run()
+
+
+@pytest.mark.parametrize('fmt', ads_harvester.FORMATS)
+def test_formats(server, tmp_path, fmt):
+    paths = harvester(server, tmp_path, fmt=fmt).run()
+    assert len(paths) == len(DOCS) // ROWS
+    assert all(path.endswith('.' + fmt) for path in paths)
+    if fmt == 'parquet':
+        assert all(pq.read_schema(path).equals(ads_harvester.shard_schema(FIELDS)) for path in paths)
+    assert list(ads_harvester.iter_docs(str(tmp_path))) == DOCS
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The aggregate store: tables are built once per dataset version into a pickle
+# keyed by the skeleton sha256 and TABLES_VERSION, and later loads reuse it.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import aggregates  # noqa: E402
+import data_loader  # noqa: E402
+import synthetic  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def cache_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('cache')
+    path = synthetic.write_skeleton(2000, str(directory / 'skeleton.parquet'))
+    data_loader.add_file('skeleton', path, '.parquet', str(directory))
+    return str(directory)
+
+
+def test_classify_research_focus():
+    # The first non-null column of RESEARCH_FOCUS wins; dm_research_focus skips dm_models
+    df = pd.DataFrame({column: [None] * 3 for column, _ in aggregates.RESEARCH_FOCUS}, dtype=object)
+    df.loc[0, ['dm_models', 'methods']] = [['wimp'], ['n-body']]
+    df.loc[1, ['theory', 'particles']] = [['mond'], ['axion']]
+    df = aggregates.classify_research_focus(df)
+    assert df['research_focus'].astype(object).tolist() == ['Dark Matter Models', 'Particles', np.nan]
+    assert df['dm_research_focus'].astype(object).tolist() == ['Methods', 'Particles', np.nan]
+
+
+def test_load_or_build(cache_dir, monkeypatch):
+    version = data_loader.dataset_version('skeleton', cache_dir)
+    path = aggregates.aggregates_path(version, cache_dir)
+    assert os.path.basename(path) == f'aggregates-{version}-v{aggregates.TABLES_VERSION}.pkl'
+    tables = aggregates.load_or_build(cache_dir)
+    assert os.path.exists(path)
+    assert aggregates.load(path)['version'] == version
+
+    # Built tables are reused, not built again
+    def build(df):
+        raise AssertionError('tables rebuilt')
+    monkeypatch.setattr(aggregates, 'build', build)
+    reloaded = aggregates.load_or_build(cache_dir)
+    assert sorted(reloaded) == sorted(tables)
+    pd.testing.assert_frame_equal(reloaded['merged_df'], tables['merged_df'])
+
+
+def test_tables(cache_dir):
+    tables = aggregates.load_or_build(cache_dir)
+    df = pd.read_parquet(data_loader.cached_path('skeleton', cache_dir), columns=['year', 'citations'])
+    per_year = tables['publications_per_year'].set_index('year')['publication_count']
+    assert per_year.to_dict() == df['year'].value_counts().sort_index().to_dict()
+    # Relevance-weighted category counts still add up to the papers of each year
+    weighted = tables['arxiv_distribution'].groupby('year')['category_count'].sum()
+    np.testing.assert_allclose(weighted.to_numpy(), per_year.loc[weighted.index].to_numpy(), atol=1e-3)
+    assert len(tables['top_titles']['title_citation'].unique()) == 50
+    assert tables['top_titles']['citations'].sum() == pytest.approx(df['citations'].nlargest(50).sum())
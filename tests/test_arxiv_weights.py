@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# arXiv relevance weighting: the class at rank r weighs 1 / 2^(r-1), the
+# shares of a paper add up to one, and the weighted tables keep the paper
+# counts of the corpus.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import arxiv_weights  # noqa: E402
+
+ARXIV_CLASS = [
+    ['astro-ph.CO', 'hep-ph', 'gr-qc'],
+    None,
+    ['hep-th'],
+    [],
+    ['astro-ph.GA', 'astro-ph.CO'],
+    ['weird-class'],
+]
+
+
+@pytest.fixture(scope='module')
+def ranked():
+    return arxiv_weights.ranked_classes(pd.Series(ARXIV_CLASS, dtype=object))
+
+
+def test_category():
+    assert arxiv_weights.category('astro-ph.CO') == 'astrophysics'
+    assert arxiv_weights.category('hep-ex') == 'high-energy physics'
+    assert arxiv_weights.category('physics.ins-det') == 'physics'
+    assert arxiv_weights.category('nucl-th') == 'nuclear physics'
+    assert arxiv_weights.category('weird-class') == arxiv_weights.OTHER
+    classes = ['gr-qc', 'astro-ph.HE', 'gr-qc', 'q-bio.NC']
+    assert arxiv_weights.categories(classes).tolist() == [arxiv_weights.category(c) for c in classes]
+
+
+def test_ranks_and_weights(ranked):
+    first = ranked[ranked['paper'] == 0]
+    assert first['rank'].tolist() == [1, 2, 3]
+    assert first['weight'].tolist() == [1.0, 0.5, 0.25]
+    np.testing.assert_allclose(first['share'], np.array([1.0, 0.5, 0.25]) / 1.75)
+    assert first['arxiv_category'].astype(str).tolist() == [
+        'astrophysics', 'high-energy physics', 'general relativity and quantum cosmology']
+    # Papers without classes have no rows, and every listed paper's shares add up to one
+    assert set(ranked['paper']) == {0, 2, 4, 5}
+    np.testing.assert_allclose(ranked.groupby('paper')['share'].sum(), 1.0)
+
+
+def test_category_shares(ranked):
+    shares = arxiv_weights.category_shares(ranked, np.arange(len(ARXIV_CLASS)))
+    # Classes of one category are summed, unclassified papers count once as NO_CLASS
+    paper_4 = shares[shares['paper'] == 4]
+    assert paper_4['arxiv_category'].tolist() == ['astrophysics'] and paper_4['share'].tolist() == [1.0]
+    unclassified = shares[shares['arxiv_category'] == arxiv_weights.NO_CLASS]
+    assert unclassified['paper'].tolist() == [1, 3]
+    assert shares['share'].sum() == pytest.approx(len(ARXIV_CLASS))
+    assert shares['paper'].is_monotonic_increasing
+
+    subset = arxiv_weights.category_shares(ranked, np.array([2, 3]))
+    assert subset['paper'].tolist() == [2, 3]
+
+
+def test_weighted_metrics(ranked):
+    values = pd.DataFrame({'citations': [70, 5, 8, 1, 20, None], 'downloads': [7, 0, 4, 1, 2, 3]})
+    table = arxiv_weights.weighted_metrics(ranked, values, 'arxiv_category')
+    # Listed papers are split over their categories, so the counts add up
+    assert table['papers'].sum() == pytest.approx(4)
+    assert table['citations'].sum() == pytest.approx(70 + 8 + 20)
+    assert table['papers'].is_monotonic_decreasing
+    astrophysics = table.set_index('arxiv_category').loc['astrophysics']
+    assert astrophysics['papers'] == pytest.approx(1 / 1.75 + 1)
+    assert astrophysics['citations'] == pytest.approx(70 / 1.75 + 20)
+
+    by_class = arxiv_weights.weighted_metrics(ranked, values, 'arxiv_class')
+    assert set(by_class['arxiv_class']) == {'astro-ph.CO', 'hep-ph', 'gr-qc', 'hep-th', 'astro-ph.GA', 'weird-class'}
+
+
+def test_patch_metrics(ranked):
+    # Taking papers out and putting them back in gives the same table
+    values = pd.DataFrame({'citations': [70, 5, 8, 1, 20, 2], 'downloads': [7, 0, 4, 1, 2, 3]})
+    table = arxiv_weights.weighted_metrics(ranked, values, 'arxiv_class')
+    part = ranked[ranked['paper'].isin([0, 4])]
+    delta = arxiv_weights.weighted_metrics(part, values, 'arxiv_class')
+    without = arxiv_weights.patch_metrics(table, delta, delta.iloc[:0], 'arxiv_class')
+    assert set(without['arxiv_class']) == {'hep-th', 'weird-class'}
+    restored = arxiv_weights.patch_metrics(without, delta.iloc[:0], delta, 'arxiv_class')
+    pd.testing.assert_frame_equal(restored.sort_values('arxiv_class', ignore_index=True),
+                                  table.sort_values('arxiv_class', ignore_index=True))
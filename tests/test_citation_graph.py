@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The citation graph engine on a small hand-made corpus: edges, PageRank,
+# communities, bibcode lookup and the budgeted neighbourhoods served by
+# /api/citation-graph/<bibcode>.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import flask
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import citation_graph  # noqa: E402
+
+# `citation` lists the papers citing each one. Two groups, A-D and E-G, joined
+# by nothing; H is cited from outside the corpus only
+CITATION = {
+    'A': ['B', 'C', 'D', 'B'],
+    'B': ['C'],
+    'C': ['D'],
+    'D': [],
+    'E': ['F', 'G'],
+    'F': ['G'],
+    'G': None,
+    'H': ['2099Outside'],
+}
+
+
+@pytest.fixture(scope='module')
+def graph():
+    bibcodes = list(CITATION)
+    return citation_graph.build(pd.DataFrame({
+        'bibcode': bibcodes,
+        'title': ['Paper ' + bibcode for bibcode in bibcodes],
+        'year': np.arange(2000, 2000 + len(bibcodes), dtype=np.int16),
+        'citations': [3, 1, 1, 0, 2, 1, 0, None],
+        'arxiv_category': pd.Categorical(['astrophysics'] * len(bibcodes)),
+        'citation': pd.Series(list(CITATION.values()), dtype=object),
+    }))
+
+
+def test_edges(graph):
+    # Edges go citing -> cited, once per pair, and only inside the corpus
+    edges = {(graph.bibcode(i), graph.bibcode(j)) for i, j in zip(*graph.out_edges.nonzero())}
+    expected = {(citing, cited) for cited, citing_papers in CITATION.items() for citing in citing_papers or []
+                if citing in CITATION}
+    assert edges == expected
+    assert graph.in_degree[graph.find('A')] == 3
+    assert graph.out_degree[graph.find('C')] == 2
+
+
+def test_pagerank(graph):
+    n = len(CITATION)
+    # Dense power iteration over the Google matrix as the reference
+    matrix = graph.out_edges.toarray().astype(np.float64)
+    rows = matrix.sum(axis=1)
+    transition = np.where(rows[:, None] > 0, matrix / np.maximum(rows, 1)[:, None], 1.0 / n)
+    google = citation_graph.DAMPING * transition + (1 - citation_graph.DAMPING) / n
+    expected = np.full(n, 1.0 / n)
+    for _ in range(1000):
+        expected = expected @ google
+    np.testing.assert_allclose(graph.pagerank, expected, atol=1e-8)
+    assert graph.pagerank.sum() == pytest.approx(1.0)
+    assert graph.bibcode(graph.top(1)[0]) == 'A'
+
+
+def test_communities(graph):
+    community = {bibcode: graph.community[graph.find(bibcode)] for bibcode in CITATION}
+    assert len({community[b] for b in 'ABCD'}) == 1
+    assert len({community[b] for b in 'EFG'}) == 1
+    # Renumbered by size: the largest group is 0
+    assert community['A'] == 0 and community['E'] != 0 and community['H'] not in (community['A'], community['E'])
+
+
+def test_find(graph):
+    assert [graph.find(bibcode) for bibcode in CITATION] == list(range(len(CITATION)))
+    assert graph.find('Z') is None
+    assert graph.find('') is None
+    assert graph.find(None) is None
+
+
+def test_neighbourhood(graph):
+    nodes, hops = graph.neighbourhood(graph.find('D'), hops=1)
+    assert sorted(graph.bibcode(n) for n in nodes) == ['A', 'C', 'D']
+    nodes, hops = graph.neighbourhood(graph.find('D'), hops=3)
+    assert sorted(graph.bibcode(n) for n in nodes) == ['A', 'B', 'C', 'D']
+    assert hops.tolist() == sorted(hops.tolist())
+    # Over budget, the highest-ranked neighbours are kept
+    nodes, _ = graph.neighbourhood(graph.find('A'), hops=1, max_nodes=2)
+    best = max('BCD', key=lambda bibcode: graph.pagerank[graph.find(bibcode)])
+    assert [graph.bibcode(n) for n in nodes] == ['A', best]
+    nodes, _ = graph.neighbourhood(graph.find('H'), hops=3)
+    assert [graph.bibcode(n) for n in nodes] == ['H']
+
+
+def test_subgraph(graph):
+    subgraph = graph.subgraph(graph.find('F'))
+    assert subgraph['center'] == 'F'
+    names = subgraph['nodes']['bibcode']
+    assert sorted(names) == ['E', 'F', 'G']
+    assert {(names[i], names[j]) for i, j in subgraph['edges']} == {('F', 'E'), ('G', 'E'), ('G', 'F')}
+    assert subgraph['nodes']['hop'][names.index('F')] == 0
+    assert all(len(values) == len(names) for values in subgraph['nodes'].values())
+
+
+@pytest.mark.parametrize('value, expected', [(None, 2), ('3', 3), ('x', 2), (99, 3), (-4, 0), ('1.5', 2),
+                                             (float('inf'), 2)])
+def test_clamp(value, expected):
+    assert citation_graph.clamp(value, 2, 0, 3) == expected
+
+
+def test_api(graph):
+    server = flask.Flask(__name__)
+    citation_graph.init_app(server, graph)
+    client = server.test_client()
+    assert client.get(citation_graph.API_ROUTE + 'Z').status_code == 404
+    response = client.get(citation_graph.API_ROUTE + 'A', query_string={'hops': 'all', 'max_nodes': 0})
+    assert response.status_code == 200
+    assert response.get_json()['nodes']['bibcode'] == ['A']
+    response = client.get(citation_graph.API_ROUTE + 'A', query_string={'hops': 1})
+    assert sorted(response.get_json()['nodes']['bibcode']) == ['A', 'B', 'C', 'D']
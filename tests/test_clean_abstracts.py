@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Abstract cleaning: markup stripping, acronym expansion, stopwords and the
+# light lemmatization, and a sharded run that resumes after an interruption.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import clean_abstracts  # noqa: E402
+
+
+@pytest.mark.parametrize('text, expected', [
+    (r'The $\Lambda${\rm CDM} model', 'The Lambda CDM model'),
+    (r'$M \sim 10^{12} M_\odot$', 'M ~ 10^12 M_ sun'),
+    ('<i>Dark</i> &amp; cold', 'Dark & cold'),
+])
+def test_strip_markup(text, expected):
+    assert clean_abstracts.strip_markup(text).split() == expected.split()
+
+
+@pytest.mark.parametrize('word, expected', [('galaxies', 'galaxy'), ('halos', 'halo'), ('masses', 'mass'),
+                                            ('mass', 'mass'), ('physics', 'physics'), ('species', 'species'),
+                                            ('gas', 'gas'), ('axions,', 'axions,')])
+def test_lemma(word, expected):
+    assert clean_abstracts.lemma(word) == expected
+
+
+def test_clean():
+    text, lemmas = clean_abstracts.clean('WIMPs and the $\\Lambda$CDM halos of galaxies.')
+    assert text == 'weakly interacting massive particle lambda cdm halos galaxies.'
+    assert lemmas == 'weakly interacting massive particle lambda cdm halo galaxy.'
+    assert clean_abstracts.clean(None) == (None, None)
+
+
+def test_ambiguous_acronyms():
+    # Only expanded when the abstract also spells out the model
+    assert clean_abstracts.clean('Dust from the SFD maps.')[0] == 'dust sfd maps.'
+    assert clean_abstracts.clean('Asymmetric dark matter (ADM) and ADM relics.')[0] == \
+        'asymmetric dark matter (asymmetric dark matter) asymmetric dark matter relics.'
+
+
+def test_run(tmp_path):
+    source = str(tmp_path / 'papers.parquet')
+    abstracts = [f'Paper {i} on WIMPs.' if i % 3 else None for i in range(10)]
+    pq.write_table(pa.table({'bibcode': [f'b{i}' for i in range(10)], 'abstract': abstracts}), source)
+    out_dir = str(tmp_path / 'clean')
+    paths = clean_abstracts.run(source, out_dir, workers=2, chunk_size=4)
+    assert [os.path.basename(path) for path in paths] == [f'clean-{i:06d}.parquet' for i in range(3)]
+    table = clean_abstracts.read_clean(out_dir)
+    assert table.column('bibcode').to_pylist() == [f'b{i}' for i in range(10)]
+    assert table.column('abstract_clean').to_pylist()[:2] == [None, 'paper 1 weakly interacting massive particle.']
+
+    # A rerun only cleans the missing shards
+    os.remove(paths[1])
+    mtime = os.path.getmtime(paths[0])
+    assert clean_abstracts.run(source, out_dir, workers=1, chunk_size=4) == paths
+    assert os.path.getmtime(paths[0]) == mtime
+    assert clean_abstracts.read_clean(out_dir).equals(table)
+    with pytest.raises(ValueError):
+        clean_abstracts.run(source, out_dir, chunk_size=5)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Sparse co-occurrence counts against a count over the per-paper lists, with
+# year ranges, the top terms table and /api/co-occurrence/<rows>/<columns>.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+from collections import Counter
+
+import flask
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import co_occurrence  # noqa: E402
+
+COLUMNS = ['methods', 'particles']
+DF = pd.DataFrame({
+    'year': np.array([2003, 2001, 2002, 2001, 2003], dtype=np.int16),
+    'methods': [['lensing'], ['n-body', 'n-body', 'lensing'], None, ['lensing'], ['n-body']],
+    'particles': [['axion', 'wimp'], ['axion'], ['wimp'], [], ['axion']],
+})
+
+
+@pytest.fixture(scope='module')
+def index():
+    return co_occurrence.build(DF, COLUMNS)
+
+
+def expected(df, row_column, col_column):
+    # Papers mentioning both terms, counted from the lists
+    pairs = Counter()
+    for rows, cols in zip(df[row_column], df[col_column]):
+        pairs.update((row, col) for row in set(rows or []) for col in set(cols or []))
+    return pairs
+
+
+def as_counter(index, counts, row_column, col_column):
+    counts = counts.tocoo()
+    return Counter({(index.vocabularies[row_column][i], index.vocabularies[col_column][j]): v
+                    for i, j, v in zip(counts.row, counts.col, counts.data) if v})
+
+
+def test_incidence_matrix():
+    vocabulary, matrix = co_occurrence.incidence_matrix(DF['methods'])
+    assert sorted(vocabulary) == ['lensing', 'n-body']
+    assert matrix.shape == (len(DF), 2)
+    # A term listed twice in one paper still counts once
+    assert matrix.max() == 1
+    assert matrix.sum(axis=1).ravel().tolist() == [[1, 2, 0, 1, 1]]
+
+
+@pytest.mark.parametrize('year_range', [None, (2001, 2001), (2002, 2003), (1990, 2010)])
+def test_counts(index, year_range):
+    df = DF if year_range is None else DF[DF['year'].between(*year_range)]
+    counts = index.counts('methods', 'particles', year_range)
+    assert as_counter(index, counts, 'methods', 'particles') == expected(df, 'methods', 'particles')
+
+
+def test_table(index):
+    rows, columns, counts = index.table('methods', 'particles', top=1)
+    assert rows.tolist() == ['lensing'] and columns.tolist() == ['axion']
+    assert counts.tolist() == [[2]]
+    # Terms without any co-occurrence in the range are dropped
+    rows, columns, counts = index.table('methods', 'particles', (2002, 2002))
+    assert rows.tolist() == [] and columns.tolist() == [] and counts.shape == (0, 0)
+
+
+def test_api(index):
+    server = flask.Flask(__name__)
+    co_occurrence.init_app(server, index)
+    client = server.test_client()
+    assert client.get(co_occurrence.API_ROUTE + 'methods/unknown').status_code == 404
+    response = client.get(co_occurrence.API_ROUTE + 'methods/particles', query_string={'start': 2003})
+    assert response.status_code == 200
+    data = response.get_json()
+    table = dict(zip(data['rows'], data['counts']))
+    assert dict(zip(data['columns'], table['n-body'])) == {'axion': 1, 'wimp': 0}
+    response = client.get(co_occurrence.API_ROUTE + 'methods/particles', query_string={'top': 0})
+    assert len(response.get_json()['rows']) == 1
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The skeleton survives the pickle -> Parquet -> Arrow IPC conversions of
+# columnar_store with the types and list shapes the readers rely on.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import columnar_store  # noqa: E402
+import data_loader  # noqa: E402
+
+FRAME = pd.DataFrame({
+    'bibcode': ['2020A', '2021B', '2022C', '2023D'],
+    'title': [['A listed title'], 'A plain title', None, 'Another'],
+    'year': ['2020', 2021, 2022.0, 'unknown'],
+    'first_author': ['Smith, J.', 'Doe, A.', 'Smith, J.', None],
+    'citations': [3, None, 10, 0],
+    'arxiv_category': [['astrophysics', 'high-energy physics'], 'astrophysics', '', np.nan],
+    'dm_models': [np.array(['wimp']), None, ['axion', 'wimp'], []],
+    'citation': [['2021B', '2022C'], [], None, ['2020A']],
+})
+
+
+@pytest.fixture(scope='module')
+def paths(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('columnar')
+    source = str(directory / 'skeleton.pkl')
+    FRAME.to_pickle(source)
+    parquet_path = columnar_store.convert(source, str(directory / 'skeleton.parquet'))
+    arrow_path = columnar_store.write_ipc(parquet_path, str(directory / 'skeleton.arrow'))
+    return parquet_path, arrow_path
+
+
+def test_types(paths):
+    schema = pq.read_schema(paths[0])
+    assert schema.field('year').type == pa.int16()
+    assert schema.field('citations').type == pa.int32()
+    assert schema.field('first_author').type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field('title').type == pa.string()
+    for column in ('arxiv_category', 'dm_models', 'citation'):
+        assert schema.field(column).type == pa.list_(pa.string())
+
+
+def test_values(paths):
+    table = pq.read_table(paths[0])
+    assert table.column('title').to_pylist() == ['A listed title', 'A plain title', None, 'Another']
+    assert table.column('year').to_pylist() == [2020, 2021, 2022, None]
+    assert table.column('citations').to_pylist() == [3, None, 10, 0]
+    # A bare string is a one-element list, an empty string an empty one
+    assert table.column('arxiv_category').to_pylist() == [['astrophysics', 'high-energy physics'], ['astrophysics'],
+                                                          [], None]
+    assert table.column('dm_models').to_pylist() == [['wimp'], None, ['axion', 'wimp'], []]
+
+
+@pytest.mark.parametrize('index', [0, 1])
+def test_read_columns(paths, index):
+    df = columnar_store.read_columns(paths[index], ['bibcode', 'first_author', 'arxiv_category', 'dm_models'],
+                                     join_lists={'arxiv_category': ', '}, join_copies={'dm_models': ', '})
+    assert list(df.columns) == ['bibcode', 'first_author', 'arxiv_category', 'dm_models', 'dm_models_joined']
+    assert isinstance(df['first_author'].dtype, pd.CategoricalDtype)
+    assert df['arxiv_category'].astype(object).tolist() == ['astrophysics, high-energy physics', 'astrophysics', '',
+                                                            np.nan]
+    assert [None if value is None else list(value) for value in df['dm_models']] == [['wimp'], None,
+                                                                                      ['axion', 'wimp'], []]
+    assert df['dm_models_joined'].astype(object).tolist() == ['wimp', np.nan, 'axion, wimp', '']
+
+
+def test_arrow_copy_matches_parquet(paths):
+    parquet, arrow = (columnar_store.read_columns(path) for path in paths)
+    pd.testing.assert_frame_equal(parquet.drop(columns=['first_author']), arrow.drop(columns=['first_author']))
+    assert parquet['first_author'].astype(object).equals(arrow['first_author'].astype(object))
+
+
+def test_arrow_lists_and_parts(paths):
+    df = columnar_store.read_columns(paths[1], ['citation'], arrow_lists=['citation'])
+    assert isinstance(df['citation'].dtype, pd.ArrowDtype)
+    offsets, values = columnar_store.list_parts(df['citation'])
+    assert offsets.tolist() == [0, 2, 2, 2, 3]
+    assert values.to_pylist() == ['2021B', '2022C', '2020A']
+
+
+@pytest.mark.parametrize('index', [0, 1])
+def test_rows(paths, index):
+    rows = pc.field('bibcode').isin(['2021B', '2023D'])
+    df = columnar_store.read_columns(paths[index], ['bibcode', 'year'], rows=rows)
+    assert df['bibcode'].tolist() == ['2021B', '2023D']
+
+
+def test_columnar_path_follows_the_version(tmp_path):
+    source = tmp_path / 'patched.pkl'
+    FRAME.to_pickle(str(source))
+    data_loader.add_file('skeleton', str(source), '.pkl', str(tmp_path))
+    version = data_loader.dataset_version('skeleton', str(tmp_path))
+    parquet_path = columnar_store.columnar_path('skeleton', str(tmp_path))
+    assert parquet_path == os.path.join(str(tmp_path), version + '.parquet')
+    assert columnar_store.mapped_path('skeleton', str(tmp_path)) == os.path.join(str(tmp_path), version + '.arrow')
+    assert columnar_store.open_mapped('skeleton', ['bibcode'], str(tmp_path)).num_rows == len(FRAME)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The content-addressed cache of data_loader: files live under their sha256,
+# the manifest maps dataset names to them, and a warm cache never goes to the
+# network. Google Drive is replaced by a canned response.
+#
+# Usage:
+#   python -m pytest tests
+
+import hashlib
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import data_loader  # noqa: E402
+
+CONTENT = b'bibcode,title\n2024Test,A paper\n'
+
+
+class Response:
+    def __init__(self, status_code=200, content=CONTENT, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'ETag': '"v1"', 'Content-Type': 'text/csv'} if headers is None else headers
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@pytest.fixture
+def drive(monkeypatch):
+    # Requests sent to Google Drive as (url, etag); `responses` are answered in order
+    calls, responses = [], []
+
+    def get(url, etag=None):
+        calls.append((url, etag))
+        return responses.pop(0)
+    monkeypatch.setattr(data_loader, '_get', get)
+    return calls, responses
+
+
+def test_download_is_content_addressed(tmp_path, drive):
+    calls, responses = drive
+    responses.append(Response())
+    path = data_loader.fetch('df_unique', str(tmp_path))
+    sha256 = hashlib.sha256(CONTENT).hexdigest()
+    assert os.path.basename(path) == sha256 + '.csv'
+    with open(path, 'rb') as f:
+        assert f.read() == CONTENT
+    entry = data_loader.read_manifest(str(tmp_path))['df_unique']
+    assert (entry['sha256'], entry['size'], entry['etag'], entry['source']) == (sha256, len(CONTENT), '"v1"', 'drive')
+    assert data_loader.dataset_version('df_unique', str(tmp_path)) == sha256
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_warm_cache_skips_the_network(tmp_path, drive):
+    calls, responses = drive
+    responses.append(Response())
+    path = data_loader.fetch('df_unique', str(tmp_path))
+    assert data_loader.fetch('df_unique', str(tmp_path)) == path
+    assert len(calls) == 1
+
+
+def test_revalidation_sends_the_etag(tmp_path, drive):
+    calls, responses = drive
+    responses.extend([Response(), Response(status_code=304, content=b'')])
+    path = data_loader.fetch('df_unique', str(tmp_path))
+    assert data_loader.fetch('df_unique', str(tmp_path), revalidate=True) == path
+    assert calls[1][1] == '"v1"'
+
+
+def test_truncated_file_is_a_miss(tmp_path, drive):
+    calls, responses = drive
+    responses.append(Response())
+    path = data_loader.fetch('df_unique', str(tmp_path))
+    with open(path, 'wb') as f:
+        f.write(CONTENT[:5])
+    assert data_loader.cached_path('df_unique', str(tmp_path)) is None
+    with open(path, 'wb') as f:
+        f.write(CONTENT.upper())
+    assert data_loader.cached_path('df_unique', str(tmp_path)) == path
+    assert data_loader.cached_path('df_unique', str(tmp_path), verify=True) is None
+
+
+def test_html_interstitial_is_refused(tmp_path, drive):
+    calls, responses = drive
+    page = Response(content=b'<html>virus scan</html>', headers={'Content-Type': 'text/html'})
+    responses.extend([page, page])
+    with pytest.raises(RuntimeError):
+        data_loader.fetch('df_unique', str(tmp_path))
+    assert calls[1][0].endswith('&confirm=t')
+    assert data_loader.cached_path('df_unique', str(tmp_path)) is None
+
+
+def test_local_files_are_not_revalidated(tmp_path, drive):
+    calls, responses = drive
+    source = tmp_path / 'patched.parquet'
+    source.write_bytes(b'patched skeleton')
+    path = data_loader.add_file('skeleton', str(source), '.parquet', str(tmp_path))
+    assert not source.exists()
+    assert data_loader.read_manifest(str(tmp_path))['skeleton']['source'] == 'local'
+    assert data_loader.fetch('skeleton', str(tmp_path), revalidate=True) == path
+    assert calls == []
+
+
+def test_unreadable_manifest(tmp_path):
+    (tmp_path / data_loader.MANIFEST_NAME).write_text('{not json')
+    assert data_loader.read_manifest(str(tmp_path)) == {}
+    assert data_loader.cached_path('skeleton', str(tmp_path)) is None
+    (tmp_path / data_loader.MANIFEST_NAME).write_text(json.dumps({}))
+    assert data_loader.dataset_version('skeleton', str(tmp_path)) is None
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Entity extraction with the token trie: longest matches without overlaps,
+# synonyms merged into canonical names, ambiguous acronyms, and the vocabulary
+# taken from the entity columns of a table.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import pyarrow as pa
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import entities  # noqa: E402
+
+VOCABULARIES = {
+    'dm_models': sorted(set(entities.DM_MODELS) | set(entities.SYNONYMS)),
+    'particles': ['axion', 'neutrino', 'sterile neutrino'],
+    'methods': ['n-body', 'n-body simulation', 'simulation'],
+}
+
+
+def extractor():
+    return entities.EntityExtractor(VOCABULARIES)
+
+
+def test_longest_match():
+    found = extractor().extract('We run N-body simulations of sterile neutrino dark matter and a simulation.')
+    assert found['methods'] == ['n-body', 'simulation']
+    assert found['dm_models'] == ['sterile neutrino dark matter']
+    # Categories are matched independently of each other
+    assert found['particles'] == ['sterile neutrino']
+
+
+def test_synonyms():
+    found = extractor().extract('WIMPs, or weakly interacting massive particles, and self interacting dark matter '
+                                '(SIDM).')
+    assert found['dm_models'] == ['weakly interacting massive particle', 'self-interacting dark matter']
+    assert found['particles'] is None
+
+
+def test_ambiguous_acronyms():
+    # SFD alone is the dust map; with superfluid dark matter spelled out it is the model
+    assert extractor().extract('Extinction from the SFD maps.')['dm_models'] is None
+    found = extractor().extract('Superfluid dark matter (SFD) in galaxies. SFD predicts a phonon force.')
+    assert found['dm_models'] == ['superfluid dark matter']
+    assert extractor().extract('Constraints on WIMPs.')['dm_models'] == ['weakly interacting massive particle']
+
+
+def test_missing_text():
+    assert extractor().extract(None) == {column: None for column in VOCABULARIES}
+
+
+def test_vocabularies():
+    table = pa.table({'particles': pa.array([['Axion', 'neutrino'], None, ['axion', '']], pa.list_(pa.string()))})
+    vocabularies = entities.vocabularies(table, ['particles', 'methods'])
+    assert vocabularies['particles'] == ['axion', 'neutrino']
+    assert vocabularies['methods'] == []
+    assert 'wimp' in vocabularies['dm_models'] and 'axion-like particle' in vocabularies['dm_models']
+
+
+def test_extract_all():
+    texts = ['Axion searches.', None, 'N-body simulation of WIMPs.'] * 5
+    expected = extractor().extract_many(texts)
+    assert entities.extract_all(texts, VOCABULARIES, workers=2, chunk_size=4) == expected
+    assert expected['particles'][:3] == [['axion'], None, None]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The entity trends index: per-year paper counts per term, patched in place on
+# a refresh, and served by /api/entity-trends/<category>.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import flask
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import entity_trends  # noqa: E402
+
+COLUMNS = ['methods', 'particles']
+
+
+def papers(rows):
+    return pd.DataFrame(rows, columns=['year', *COLUMNS]).astype({'year': np.int16})
+
+
+DF = papers([
+    (2001, ['n-body', 'n-body', 'lensing'], ['axion']),
+    (2001, ['lensing'], None),
+    (2003, ['lensing'], ['wimp', 'axion']),
+    (2003, None, []),
+])
+
+
+@pytest.fixture(scope='module')
+def index():
+    return entity_trends.build_index(DF, COLUMNS)
+
+
+def test_build_index(index):
+    methods = index['methods']
+    assert methods['years'].tolist() == [2001, 2002, 2003]
+    assert methods['terms'] == ['lensing', 'n-body']
+    assert methods['totals'].tolist() == [3, 1]
+    # A term listed twice in one paper is counted once
+    assert methods['counts'].tolist() == [[2, 0, 1], [1, 0, 0]]
+    # Ties are ordered by term
+    assert index['particles']['terms'] == ['axion', 'wimp']
+    assert index['particles']['counts'].tolist() == [[1, 0, 1], [0, 0, 1]]
+
+
+def test_patch_index(index):
+    # A refreshed paper is removed with its old row and added with its new one
+    removed = DF.iloc[[2]]
+    added = papers([(2003, ['n-body'], ['wimp']), (2005, ['simulation'], None)])
+    patched = entity_trends.patch_index(index, removed, added, COLUMNS)
+    expected = entity_trends.build_index(pd.concat([DF.drop(index=2), added], ignore_index=True), COLUMNS)
+    for column in COLUMNS:
+        assert patched[column]['terms'] == expected[column]['terms']
+        for key in ('years', 'totals', 'counts'):
+            np.testing.assert_array_equal(patched[column][key], expected[column][key])
+    assert 'axion' in patched['particles']['terms']
+
+
+def test_trends(index):
+    trends = entity_trends.trends(index, 'methods', top=1)
+    assert trends == {'category': 'methods', 'years': [2001, 2002, 2003],
+                      'terms': [{'term': 'lensing', 'total': 3, 'counts': [2, 0, 1]}]}
+    assert len(entity_trends.trends(index, 'methods')['terms']) == 2
+
+
+def test_api(index):
+    server = flask.Flask(__name__)
+    entity_trends.init_app(server, index)
+    client = server.test_client()
+    assert client.get(entity_trends.API_ROUTE + 'unknown').status_code == 404
+    response = client.get(entity_trends.API_ROUTE + 'methods', query_string={'top': 0})
+    assert [term['term'] for term in response.get_json()['terms']] == ['lensing']
+    response = client.get(entity_trends.API_ROUTE + 'methods', query_string={'top': 'x'})
+    assert len(response.get_json()['terms']) == 2
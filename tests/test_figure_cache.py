@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The figure cache: figures served pre-compressed with ETags, lazy builds and
+# /_ready, filtered variants, and saving/loading the built figures by key.
+#
+# Usage:
+#   python -m pytest tests
+
+import gzip
+import json
+import os
+import sys
+from collections import OrderedDict
+
+import flask
+import plotly.graph_objects as go
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import figure_cache  # noqa: E402
+
+
+def figure(title):
+    return go.Figure(go.Bar(x=['a', 'b'], y=[1, 2]), layout=dict(title=title))
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    # Every test starts from an empty cache
+    monkeypatch.setattr(figure_cache, '_figures', {})
+    monkeypatch.setattr(figure_cache, '_builders', {})
+    monkeypatch.setattr(figure_cache, '_factories', {})
+    monkeypatch.setattr(figure_cache, '_filtered', OrderedDict())
+
+
+@pytest.fixture
+def client():
+    server = flask.Flask(__name__)
+    figure_cache.init_app(server)
+    return server.test_client()
+
+
+def url(name):
+    return figure_cache.FIGURE_ROUTE + name + '.json'
+
+
+def test_respond(client):
+    figure_cache.register('bars', figure('Bars'))
+    response = client.get(url('bars'), headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data))['layout']['title']['text'] == 'Bars'
+    etag = response.headers['ETag']
+
+    # Unchanged figures are revalidated with a 304, per encoding
+    assert client.get(url('bars'), headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag}).status_code == 304
+    response = client.get(url('bars'), headers={'Accept-Encoding': 'identity', 'If-None-Match': etag})
+    assert response.status_code == 200 and 'Content-Encoding' not in response.headers
+    assert client.get(url('missing')).status_code == 404
+
+
+def test_lazy(client):
+    built = []
+
+    def build():
+        built.append('lazy')
+        return figure('Lazy')
+    figure_cache.register_lazy('lazy', build)
+    response = client.get(figure_cache.READY_ROUTE)
+    assert response.status_code == 503 and response.get_json()['pending'] == ['lazy']
+
+    figure_cache.warm()
+    assert client.get(figure_cache.READY_ROUTE).status_code == 200
+    assert client.get(url('lazy')).status_code == 200
+    assert built == ['lazy']
+
+
+def test_warm_skips_failures():
+    def broken():
+        raise RuntimeError('no data')
+    figure_cache.register_lazy('broken', broken)
+    figure_cache.register_lazy('lazy', lambda: figure('Lazy'))
+    figure_cache.warm()
+    assert figure_cache.pending() == ['broken']
+
+
+def test_filtered(client):
+    figure_cache.register('bars', figure('All'))
+    calls = []
+
+    def factory(filters):
+        calls.append(filters)
+        if not isinstance(filters.get('year'), int):
+            raise ValueError(filters)
+        return figure(f"Year {filters['year']}")
+    figure_cache.register_factory('bars', factory)
+
+    for _ in range(2):
+        response = client.get(url('bars'), query_string={'filters': json.dumps({'year': 2020})})
+        assert json.loads(response.data)['layout']['title']['text'] == 'Year 2020'
+    assert calls == [{'year': 2020}]
+    for filters in ('not json', '[1]', json.dumps({'year': 'x'})):
+        assert client.get(url('bars'), query_string={'filters': filters}).status_code == 400
+
+
+def test_save_load(tmp_path):
+    path = str(tmp_path / 'figures.pkl')
+    figure_cache.register_lazy('lazy', lambda: figure('Lazy'))
+    figure_cache.warm()
+    figure_cache.save(path, 'key-1')
+    saved = figure_cache._figures['lazy']
+
+    figure_cache._figures.clear()
+    # A file written for other code or data is ignored
+    assert figure_cache.load(path, 'key-2') == []
+    assert figure_cache.load(str(tmp_path / 'missing.pkl'), 'key-1') == []
+    assert figure_cache.pending() == ['lazy']
+    assert figure_cache.load(path, 'key-1') == ['lazy']
+    assert figure_cache.pending() == []
+    assert figure_cache._figures['lazy']['digest'] == saved['digest']
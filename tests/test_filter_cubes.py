@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The filter cubes must answer an unfiltered view with exactly the static
+# tables that aggregates.build computes from the full DataFrame, since app.py
+# switches between the two depending on whether a filter is set.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import aggregates  # noqa: E402
+import columnar_store  # noqa: E402
+import synthetic  # noqa: E402
+
+UNFILTERED = {}
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    path = synthetic.write_skeleton(5000, str(tmp_path_factory.mktemp('skeleton') / 'skeleton.parquet'))
+    df = columnar_store.read_columns(path, aggregates.SKELETON_COLUMNS, aggregates.ARXIV_CATEGORY_JOIN,
+                                     aggregates.CITATION_LIST_COLUMNS, aggregates.DM_MODELS_JOIN)
+    tables = aggregates.build(df)
+    tables['df'] = df
+    return tables
+
+
+def test_totals(tables):
+    df = tables['df']
+    assert tables['filter_cubes'].totals(UNFILTERED) == (len(df), int(df['citations'].fillna(0).sum()))
+
+
+def test_publications(tables):
+    hover = aggregates.publications_hover_tables(*tables['filter_cubes'].publications(UNFILTERED))
+    pd.testing.assert_frame_equal(hover['merged_df'], tables['merged_df'])
+
+
+def test_dm_models_focus(tables):
+    pd.testing.assert_frame_equal(tables['filter_cubes'].dm_models_focus(UNFILTERED), tables['grouped_data'])
+
+
+def test_theoretical_vs_experimental(tables):
+    cubes = tables['filter_cubes']
+    pd.testing.assert_frame_equal(cubes.theoretical_vs_experimental(UNFILTERED, aggregates.RESEARCH_TYPE_AFTER),
+                                  tables['theoretical_vs_experimental'])
+    pd.testing.assert_frame_equal(
+        cubes.theoretical_vs_experimental_citations(UNFILTERED, aggregates.RESEARCH_TYPE_AFTER),
+        tables['grouped_data_2'])
+
+
+def test_citations_focus(tables):
+    pd.testing.assert_frame_equal(
+        tables['filter_cubes'].citations_focus(UNFILTERED, aggregates.CITATIONS_FOCUS_AFTER),
+        tables['grouped_citation_data'])
+
+
+def test_category_filter(tables):
+    # A category selects every paper whose arxiv_category lists it
+    df, cubes = tables['df'], tables['filter_cubes']
+    category = cubes.categories[0]
+    selected = df['arxiv_category'].astype(str).str.split(', ').map(lambda parts: category in parts)
+    expected = (int(selected.sum()), int(df.loc[selected, 'citations'].fillna(0).sum()))
+    assert cubes.totals({'categories': [category]}) == expected
+    assert np.all(cubes.papers[-1] >= 0)
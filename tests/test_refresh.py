@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# A refresh patches the skeleton with the harvested papers (refresh.delta_table
+# and refresh.patch) and the aggregate tables with the delta
+# (aggregates.patch); both must give what a full rebuild would.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import aggregates  # noqa: E402
+import arxiv_weights  # noqa: E402
+import columnar_store  # noqa: E402
+import refresh  # noqa: E402
+import synthetic  # noqa: E402
+
+READ = {'columns': aggregates.SKELETON_COLUMNS, 'join_lists': aggregates.ARXIV_CATEGORY_JOIN,
+        'arrow_lists': aggregates.CITATION_LIST_COLUMNS, 'join_copies': aggregates.DM_MODELS_JOIN}
+
+
+@pytest.fixture(scope='module')
+def base_path(tmp_path_factory):
+    return synthetic.write_skeleton(3000, str(tmp_path_factory.mktemp('skeleton') / 'skeleton.parquet'))
+
+
+@pytest.fixture(scope='module')
+def base(base_path):
+    return pq.read_table(base_path)
+
+
+def harvested(row, **changes):
+    # A row as paper_row builds it from an ADS document (no downloads)
+    row = {column: value for column, value in row.items() if column != 'downloads'}
+    row.update(changes)
+    return row
+
+
+def test_replaces_existing_bibcode(base):
+    old = base.slice(0, 1).to_pylist()[0]
+    patched = refresh.patch(base, refresh.delta_table([harvested(old, title='Revised title', citations=99)], base))
+    assert patched.num_rows == base.num_rows
+    rows = patched.filter(pc.equal(patched.column('bibcode'), old['bibcode'])).to_pylist()
+    assert len(rows) == 1
+    assert rows[0]['title'] == 'Revised title'
+    assert rows[0]['citations'] == 99
+
+
+def test_appends_new_bibcode(base):
+    row = {'bibcode': '2099New..000000001', 'title': 'New paper', 'year': 2099, 'citations': 1}
+    patched = refresh.patch(base, refresh.delta_table([row], base))
+    assert patched.num_rows == base.num_rows + 1
+    new = patched.slice(patched.num_rows - 1).to_pylist()[0]
+    assert new['bibcode'] == row['bibcode'] and new['title'] == 'New paper'
+    assert new['downloads'] is None
+
+
+def test_carries_over_downloads(base):
+    old = base.slice(5, 1).to_pylist()[0]
+    delta = refresh.delta_table([harvested(old, citations=old['citations'] + 1)], base)
+    assert delta.column('downloads').to_pylist() == [old['downloads']]
+
+
+def test_dictionary_columns(base):
+    # first_author is dictionary-encoded in the skeleton; harvested values,
+    # known to it or not, must cast to its schema
+    old = base.slice(0, 1).to_pylist()[0]
+    rows = [harvested(old, first_author='Unseen, A.'),
+            {'bibcode': '2099New..000000002', 'first_author': base.column('first_author')[1].as_py()}]
+    patched = refresh.patch(base, refresh.delta_table(rows, base))
+    assert patched.schema.field('first_author').type == base.schema.field('first_author').type
+    assert set(patched.column('first_author').to_pylist()[-2:]) == {'Unseen, A.', rows[1]['first_author']}
+
+
+@pytest.fixture(scope='module')
+def patched_path(base, tmp_path_factory):
+    # Changed papers move to another year, get other classes, entities and
+    # citations; new ones fall outside the year range or bring new labels
+    rows = []
+    for i, row in enumerate(base.slice(0, 40).to_pylist()):
+        arxiv_class = ['gr-qc'] if i % 2 else ['physics.bio-ph', 'astro-ph.CO']
+        rows.append(harvested(
+            row, year=2000 + i % 5, citations=row['citations'] * 2 + i, arxiv_class=arxiv_class,
+            arxiv_category=[arxiv_weights.category(arxiv) for arxiv in arxiv_class],
+            dm_models=['wimp'] if i % 3 else None, theory=None, particles=['axion', 'new particle'],
+        ))
+    for i in range(10):
+        rows.append({
+            'bibcode': f'2099New..{i:09d}', 'title': f'New paper {i}', 'year': 1890 if i % 2 else 2031,
+            'first_author': 'New, A.', 'citations': i, 'citations_normalized': 0.5, 'arxiv_class': ['q-bio.NC'],
+            'arxiv_category': [arxiv_weights.category('q-bio.NC')], 'dm_models': ['fuzzy dark matter'],
+            'particles': ['new particle'], 'citation': [],
+        })
+    path = os.path.join(str(tmp_path_factory.mktemp('patched')), 'patched.parquet')
+    columnar_store.write_table(refresh.patch(base, refresh.delta_table(rows, base)), path)
+    return path, [row['bibcode'] for row in rows]
+
+
+@pytest.fixture(scope='module')
+def tables(base_path, patched_path):
+    path, bibcodes = patched_path
+    expected = aggregates.build(columnar_store.read_columns(path, **READ))
+    df = columnar_store.read_columns(path, **READ)
+    removed = columnar_store.read_columns(base_path, rows=pc.field('bibcode').isin(bibcodes), **READ)
+    tables = aggregates.build(columnar_store.read_columns(base_path, **READ))
+    return aggregates.patch(tables, df, removed, df[df['bibcode'].isin(bibcodes)]), expected
+
+
+@pytest.mark.parametrize('name', ['merged_df', 'grouped_data', 'top_titles', 'theoretical_vs_experimental',
+                                  'grouped_citation_data', 'grouped_data_2'])
+def test_patched_tables(tables, name):
+    patched, expected = tables
+    pd.testing.assert_frame_equal(patched[name], expected[name])
+
+
+@pytest.mark.parametrize('name', ['arxiv_category_metrics', 'arxiv_class_metrics'])
+def test_patched_metrics(tables, name):
+    patched, expected = tables
+    by = name[:-len('_metrics')]
+    pd.testing.assert_frame_equal(patched[name].sort_values(by, ignore_index=True),
+                                  expected[name].sort_values(by, ignore_index=True))
+
+
+def test_patched_entity_trends(tables):
+    patched, expected = tables
+    for column, entry in expected['entity_trends'].items():
+        assert patched['entity_trends'][column]['terms'] == entry['terms']
+        for key in ('years', 'totals', 'counts'):
+            np.testing.assert_array_equal(patched['entity_trends'][column][key], entry[key])
+
+
+def test_patched_filters(tables):
+    patched, expected = tables
+    cubes = patched['filter_cubes']
+    filters = {'years': (1995, 2031), 'categories': [cubes.categories[0]], 'focus': ['Particles']}
+    assert cubes.totals(filters) == expected['filter_cubes'].totals(filters)
+    pd.testing.assert_frame_equal(cubes.dm_models_focus(filters), expected['filter_cubes'].dm_models_focus(filters))
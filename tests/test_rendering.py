@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The rendering backend switches large scatter traces to WebGL, following
+# PLOT_RENDER_MODE.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import plotly.graph_objects as go
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rendering  # noqa: E402
+
+
+@pytest.mark.parametrize('mode, points, trace_class', [
+    ('auto', rendering.WEBGL_POINT_THRESHOLD - 1, go.Scatter),
+    ('auto', rendering.WEBGL_POINT_THRESHOLD, go.Scattergl),
+    ('svg', 10 ** 6, go.Scatter),
+    ('webgl', 1, go.Scattergl),
+])
+def test_scatter(monkeypatch, mode, points, trace_class):
+    monkeypatch.setattr(rendering, 'RENDER_MODE', mode)
+    trace = rendering.scatter(points, x=[1, 2], y=[3, 4], mode='markers', marker=dict(color='#E09351'))
+    assert type(trace) is trace_class
+    # Both backends take the same styling
+    assert trace.marker.color == '#E09351' and list(trace.x) == [1, 2]
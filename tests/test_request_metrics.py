@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Request metrics: the shared histograms count into memory that forked
+# workers share, bound their label sets, and a Dash app instrumented with
+# init_app reports its routes and callbacks at /_metrics.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import dash
+import pytest
+from dash import Input, Output, dcc, html
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import request_metrics  # noqa: E402
+
+
+def series(lines, suffix, key):
+    # Value of the `<name><suffix>{key...}` line
+    for line in lines:
+        name, _, value = line.rpartition(' ')
+        if name.split('{')[0].endswith(suffix) and name.split('{', 1)[1].startswith(key):
+            return float(value)
+    return None
+
+
+def test_observe():
+    histogram = request_metrics.SharedHistogram('test_seconds', 'Test.', (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe('route="/a"', value)
+    histogram.observe('route="/b"', 2.0)
+    lines = histogram.exposition()
+    assert lines[:2] == ['# HELP test_seconds Test.', '# TYPE test_seconds histogram']
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert series(lines, '_sum', 'route="/a"') == pytest.approx(3.65)
+    assert series(lines, '_count', 'route="/b"') == 1
+
+
+def test_capacity():
+    # Label sets beyond the capacity share the overflow series
+    histogram = request_metrics.SharedHistogram('test_capacity', 'Test.', (1.0,), capacity=3)
+    for i in range(5):
+        histogram.observe(f'route="/{i}"', 0.5)
+    lines = histogram.exposition()
+    assert series(lines, '_count', 'route="/0"') == 1
+    assert series(lines, '_count', 'route="/1"') == 1
+    assert series(lines, '_count', 'route="/2"') is None
+    assert series(lines, '_count', request_metrics.OVERFLOW_KEY) == 3
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+def test_shared_across_fork():
+    histogram = request_metrics.SharedHistogram('test_fork', 'Test.', (1.0,))
+    histogram.observe('route="/parent"', 0.5)
+    pid = os.fork()
+    if pid == 0:
+        # A worker: new label sets and counts must reach the parent
+        try:
+            histogram.observe('route="/child"', 2.0)
+            histogram.observe('route="/parent"', 0.5)
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    lines = histogram.exposition()
+    assert series(lines, '_count', 'route="/parent"') == 2
+    assert series(lines, '_count', 'route="/child"') == 1
+    histogram.observe('route="/child"', 2.0)
+    assert series(histogram.exposition(), '_count', 'route="/child"') == 2
+
+
+def test_label_escaping():
+    assert request_metrics._label('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
+
+
+@pytest.fixture(scope='module')
+def client():
+    app = dash.Dash(__name__)
+    request_metrics.init_app(app, pages=lambda: {'/known': None})
+    app.layout = html.Div([dcc.Location(id='url'), html.Div(id='page')])
+
+    @app.callback(Output('page', 'children'), Input('url', 'pathname'))
+    def metrics_test_page(pathname):
+        return pathname
+    return app.server.test_client()
+
+
+def update(client, pathname):
+    return client.post(request_metrics.DASH_UPDATE_ROUTE, json={
+        'output': 'page.children', 'outputs': {'id': 'page', 'property': 'children'},
+        'inputs': [{'id': 'url', 'property': 'pathname', 'value': pathname}], 'changedPropIds': ['url.pathname'],
+    })
+
+
+def test_dash_app(client):
+    assert update(client, '/known').status_code == 200
+    assert update(client, '/some/random/url').status_code == 200
+    client.get('/no-such-route')
+    text = client.get(request_metrics.METRICS_ROUTE).get_data(as_text=True)
+    lines = text.splitlines()
+    assert series(lines, 'dash_callback_duration_seconds_count', 'callback="metrics_test_page",page="/known"') == 1
+    # Unknown pathnames do not get a series of their own
+    assert series(lines, 'dash_callback_duration_seconds_count',
+                  f'callback="metrics_test_page",page="{request_metrics.UNKNOWN_PAGE}"') == 1
+    assert '/some/random/url' not in text
+    assert series(lines, 'dash_callback_response_size_bytes_count', 'callback="metrics_test_page"') >= 1
+    assert series(lines, 'http_request_duration_seconds_count', f'route="{request_metrics.DASH_UPDATE_ROUTE}"') >= 2
+    # Routes are labelled by their URL rule, not the requested path
+    assert '/no-such-route' not in text
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The level-of-detail queries of scatter_index must give what a scan of all
+# papers would: every paper inside the viewport while they fit the budget, and
+# the most cited ones when they do not.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scatter_index  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(6)
+    n = 20000
+    frame = pd.DataFrame({
+        'citations_normalized': rng.lognormal(0, 1.5, n),
+        'downloads': rng.lognormal(4, 1, n).round(),
+        'citations': rng.permutation(n),
+        'title': [f'Paper {i}' for i in range(n)],
+        'first_author': 'Author',
+        'year': rng.integers(1950, 2025, n),
+    })
+    # Log axes cannot show these
+    frame.loc[:99, 'citations_normalized'] = 0
+    frame.loc[100:149, 'downloads'] = -1
+    return frame
+
+
+@pytest.fixture(scope='module')
+def index(frame):
+    return scatter_index.build(frame)
+
+
+def scan(frame, x_range, y_range):
+    log_x = np.log10(frame['citations_normalized'].where(frame['citations_normalized'] > 0))
+    log_y = np.log10(frame['downloads'].where(frame['downloads'] > 0))
+    return frame[log_x.between(*sorted(x_range)) & log_y.between(*sorted(y_range))]
+
+
+def test_drops_non_positive(index, frame):
+    assert len(index) == len(frame) - 150
+    assert index.density.sum() == len(index)
+
+
+@pytest.mark.parametrize('x_range, y_range', [((-1, 0.5), (1, 2)), ((0.5, -1), (2, 1)), ((-10, 10), (-10, 10)),
+                                              ((2.5, 3), (1, 1.5))])
+def test_query_within_budget(index, frame, x_range, y_range):
+    points, total = index.query(x_range, y_range, len(frame))
+    expected = scan(frame, x_range, y_range)
+    assert total == len(expected)
+    assert sorted(points['title']) == sorted(expected['title'])
+
+
+def test_query_over_budget(index, frame):
+    points, total = index.query((-1, 1), (1, 3), 100)
+    expected = scan(frame, (-1, 1), (1, 3))
+    assert total == len(expected) > 100
+    assert sorted(points['citations']) == sorted(expected['citations'].nlargest(100))
+
+
+def test_outliers(index, frame):
+    kept = frame[(frame['citations_normalized'] > 0) & (frame['downloads'] > 0)]
+    assert sorted(index.outliers(50)['citations']) == sorted(kept['citations'].nlargest(50))
+    assert len(index.outliers(0)) == 0
+
+
+def test_single_paper():
+    frame = pd.DataFrame({'citations_normalized': [1.0], 'downloads': [10.0], 'citations': [3], 'title': ['Only'],
+                          'first_author': ['Author'], 'year': [2024]})
+    points, total = scatter_index.build(frame).query((-1, 1), (0, 2), 10)
+    assert total == 1 and points['title'].tolist() == ['Only']
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Full-text search: user text is turned into an FTS5 query that can never be
+# read as an operator or fail to parse, and the index built from (and patched
+# with) pyarrow tables answers it.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sqlite3
+import sys
+
+import flask
+import pyarrow as pa
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import columnar_store  # noqa: E402
+import search_index  # noqa: E402
+
+SCHEMA = pa.schema([
+    ('bibcode', pa.string()), ('title', pa.string()), ('year', pa.int16()), ('citations', pa.int32()),
+    ('arxiv_class', pa.list_(pa.string())), ('abstract', pa.string()), ('keyword_norm', pa.list_(pa.string())),
+])
+PAPERS = [
+    {'bibcode': '2001A', 'title': 'Dark matter halos of dwarf galaxies', 'year': 2001, 'citations': 50,
+     'arxiv_class': ['astro-ph.GA'], 'abstract': 'Rotation curves of dwarfs.', 'keyword_norm': ['dwarf galaxies']},
+    {'bibcode': '2002B', 'title': 'Axion dark matter searches', 'year': 2002, 'citations': 300,
+     'arxiv_class': ['hep-ph', 'astro-ph.CO'], 'abstract': 'Haloscope limits on axions.', 'keyword_norm': None},
+    {'bibcode': '2003C', 'title': 'A dark photon portal', 'year': 2003, 'citations': None,
+     'arxiv_class': None, 'abstract': None, 'keyword_norm': ['dark photon']},
+    {'bibcode': '2004D', 'title': 'Weak lensing of the cosmic web', 'year': 2004, 'citations': 10,
+     'arxiv_class': ['astro-ph.CO'], 'abstract': 'Shear maps trace the halo mass.', 'keyword_norm': None},
+]
+
+
+@pytest.fixture(scope='module')
+def base():
+    return pa.Table.from_pylist(PAPERS, schema=SCHEMA)
+
+
+@pytest.fixture(scope='module')
+def index(base, tmp_path_factory):
+    directory = tmp_path_factory.mktemp('search')
+    parquet_path = str(directory / 'skeleton.parquet')
+    columnar_store.write_table(base, parquet_path)
+    return search_index.build(parquet_path, str(directory / 'search.sqlite'))
+
+
+def bibcodes(db_path, query, **kwargs):
+    return [result['bibcode'] for result in search_index.search(db_path, query, **kwargs)]
+
+
+def test_match_expression():
+    assert search_index.match_expression('dark photon') == '"dark" "photon"*'
+    assert search_index.match_expression('  "(-*:^') is None
+    assert search_index.match_expression('title:axion OR NEAR(x)') == '"title" "axion" "OR" "NEAR" "x"*'
+
+
+@pytest.mark.parametrize('query', ['"unbalanced', 'axion AND', 'NOT', 'a OR b)', 'title:dark', '*', 'NEAR(dark',
+                                   "'; DROP TABLE papers; --", 'ünïcödé ß', 'x' * 500])
+def test_hostile_queries(index, query):
+    # Never an FTS5 syntax error, whatever the user typed
+    assert isinstance(search_index.search(index, query), list)
+
+
+def test_search(index):
+    assert set(bibcodes(index, 'dark matter')) == {'2001A', '2002B'}
+    # The last word is a prefix, the others are stemmed
+    assert bibcodes(index, 'dark phot') == ['2003C']
+    assert set(bibcodes(index, 'halo')) == {'2001A', '2002B', '2004D'}
+    # Keywords are indexed, and a title hit outranks an abstract one
+    assert bibcodes(index, 'dwarf')[0] == '2001A'
+    assert bibcodes(index, 'halo')[0] == '2001A'
+    assert bibcodes(index, 'halo', limit=1, offset=1) == bibcodes(index, 'halo')[1:2]
+    result = search_index.search(index, 'axion')[0]
+    assert (result['title'], result['year'], result['citations'], result['arxiv_class']) == (
+        'Axion dark matter searches', 2002, 300, 'hep-ph, astro-ph.CO')
+
+
+def test_rowids_follow_citations(index):
+    connection = sqlite3.connect(index)
+    assert [row[0] for row in connection.execute('SELECT bibcode FROM papers ORDER BY rowid')] == [
+        '2002B', '2001A', '2004D', '2003C']
+
+
+def test_update(index, base, tmp_path):
+    delta = pa.Table.from_pylist([
+        dict(PAPERS[1], title='Axion haloscope results', citations=400),
+        {'bibcode': '2024E', 'title': 'Fuzzy dark matter solitons', 'year': 2024, 'citations': 1,
+         'arxiv_class': ['astro-ph.CO'], 'abstract': None, 'keyword_norm': None},
+    ], schema=SCHEMA)
+    updated = search_index.update(index, str(tmp_path / 'updated.sqlite'), base, delta)
+    assert bibcodes(updated, 'searches') == []
+    assert bibcodes(updated, 'haloscope') == ['2002B']
+    assert bibcodes(updated, 'fuzzy') == ['2024E']
+    assert set(bibcodes(updated, 'dark matter')) == {'2001A', '2024E'}
+    connection = sqlite3.connect(updated)
+    connection.execute("INSERT INTO papers_fts (papers_fts) VALUES ('integrity-check')")
+    assert connection.execute('SELECT COUNT(*) FROM papers').fetchone()[0] == len(PAPERS) + 1
+    # The original index is left as it was
+    assert bibcodes(index, 'searches') == ['2002B']
+
+
+def test_api(index):
+    server = flask.Flask(__name__)
+    search_index.init_app(server, index)
+    response = server.test_client().get(search_index.API_ROUTE, query_string={'q': 'axion', 'limit': 500})
+    assert response.status_code == 200
+    assert [result['bibcode'] for result in response.get_json()['results']] == ['2002B']
+
+    unavailable = flask.Flask(__name__)
+    search_index.init_app(unavailable, None)
+    response = unavailable.test_client().get(search_index.API_ROUTE, query_string={'q': 'axion'})
+    assert response.status_code == 503
+    assert response.get_json()['error'] == search_index.UNAVAILABLE
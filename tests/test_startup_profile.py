@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# The opt-in startup profile: nested stages with their time and memory,
+# served from /_startup, and nothing recorded without STARTUP_PROFILE.
+#
+# Usage:
+#   python -m pytest tests
+
+import os
+import sys
+import time
+
+import flask
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import startup_profile  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    server = flask.Flask(__name__)
+    startup_profile.init_app(server)
+    return server.test_client()
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(startup_profile, 'ENABLED', True)
+    monkeypatch.setattr(startup_profile, '_stages', [])
+
+
+def test_disabled(monkeypatch, client, capsys):
+    monkeypatch.setattr(startup_profile, 'ENABLED', False)
+    monkeypatch.setattr(startup_profile, '_stages', [])
+    with startup_profile.stage('parse'):
+        pass
+    startup_profile.summary()
+    assert startup_profile.stages() == []
+    assert capsys.readouterr().err == ''
+    assert client.get(startup_profile.ROUTE).status_code == 404
+
+
+def test_stages(enabled, client, capsys):
+    with startup_profile.stage('aggregates'):
+        with startup_profile.stage('top titles'):
+            time.sleep(0.01)
+        # A stage that fails is still recorded
+        with pytest.raises(KeyError), startup_profile.stage('broken'):
+            raise KeyError('column')
+    records = startup_profile.stages()
+    # Inner stages finish, and are recorded, first
+    assert [(r['stage'], r['depth']) for r in records] == [('top titles', 1), ('broken', 1), ('aggregates', 0)]
+    assert records[0]['seconds'] >= 0.01 and records[2]['seconds'] >= records[0]['seconds']
+    assert all(r['rss_mb'] > 0 and r['peak_mb'] > 0 for r in records)
+
+    startup_profile.summary('test ready')
+    err = capsys.readouterr().err
+    # The three stages as they finish, then the top-level ones by time
+    assert err.count('[startup]') == 6 and '[startup] test ready after' in err
+
+    data = client.get(startup_profile.ROUTE).get_json()
+    assert data['stages'] == records and data['peak_mb'] > 0